@@ -1,7 +1,13 @@
+import re
+
+# Blocked substrings, matched in one pass over the lowercased task
+BLOCKED_TERMS = ("illegal", "malware")
+_BLOCKED = re.compile("|".join(map(re.escape, BLOCKED_TERMS)))
+
 class GovernorAgent:
     skip_in_main = True
     def preflight(self, task: str):
-        blocked = any(b in task.lower() for b in ["illegal","malware"])
+        blocked = _BLOCKED.search(task.lower()) is not None
         if blocked:
             return False, "disallowed content"
         return True, "ok"
@@ -147,11 +147,8 @@ async def get_all_agent_metrics(
         monitor = get_performance_monitor()
         
         # Get all tracked agents
-        with monitor._lock:
-            agent_names = list(monitor._agent_metrics.keys())
-        
         agent_metrics = {}
-        for agent_name in agent_names:
+        for agent_name in monitor.get_agent_names():
             performance = monitor.get_agent_metrics(agent_name, time_window_minutes)
             agent_metrics[agent_name] = {
                 "agent_type": performance.agent_type,
@@ -3,9 +3,12 @@ Workflow API routes.
 """
 
 import asyncio
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status
-from sqlalchemy.orm import Session
+import json
+from collections import OrderedDict
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, load_only
 
 from api.models import (
     ComplianceWorkflowRequest,
@@ -20,10 +23,39 @@ from api.auth import get_current_user
 from api.models import User
 from database.session import get_db
 from database.models import Run, AgentRun, RunStatus
-from workflows.compliance import ComplianceWorkflow
+from workflows.compliance import (
+    AGENT_STEPS,
+    ComplianceWorkflow,
+    render_compliance_report,
+    status_streaming_available
+)
+from workflows.tasks import dispatch_compliance_workflow
 
 router = APIRouter(prefix="/workflows", tags=["workflows"])
 
+# Rendered markdown reports by run ID; results are final once a run completes
+_REPORT_CACHE_SIZE = 256
+_report_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _markdown_report(run: Run) -> str:
+    """Render (or reuse) the markdown report for a completed run."""
+    report = _report_cache.get(run.id)
+    if report is not None:
+        _report_cache.move_to_end(run.id)
+        return report
+    
+    output_data = run.output_data or {}
+    report = output_data.get("compliance_report") or render_compliance_report(
+        (run.input_data or {}).get("query", ""),
+        output_data,
+        run.completed_at
+    )
+    _report_cache[run.id] = report
+    if len(_report_cache) > _REPORT_CACHE_SIZE:
+        _report_cache.popitem(last=False)
+    return report
+
 
 @router.post(
     "/compliance",
@@ -53,30 +85,28 @@ async def start_compliance_workflow(
         # Initialize workflow
         workflow = ComplianceWorkflow(db_session=db)
         
+        workflow_config = {
+            "jurisdiction": request.jurisdiction,
+            "risk_threshold": request.risk_threshold,
+            "policy_documents": request.policy_documents,
+            **(request.config or {})
+        }
+        
         # Start workflow (creates database record)
         workflow_id = await workflow.start_workflow(
             query=request.query,
             tenant_id=current_user.tenant_id,
-            config={
-                "jurisdiction": request.jurisdiction,
-                "risk_threshold": request.risk_threshold,
-                "policy_documents": request.policy_documents,
-                **(request.config or {})
-            }
+            config=workflow_config
         )
         
-        # Execute workflow in background
-        background_tasks.add_task(
-            workflow.execute_workflow,
-            workflow_id,
-            request.query,
-            {
-                "jurisdiction": request.jurisdiction,
-                "risk_threshold": request.risk_threshold,
-                "policy_documents": request.policy_documents,
-                **(request.config or {})
-            }
-        )
+        # Execute on the task queue if configured, else in background
+        if not dispatch_compliance_workflow(workflow_id, request.query, workflow_config):
+            background_tasks.add_task(
+                workflow.execute_workflow,
+                workflow_id,
+                request.query,
+                workflow_config
+            )
         
         return ComplianceWorkflowResponse(
             workflow_id=workflow_id,
@@ -111,7 +141,7 @@ async def get_workflow_status(
     """
     try:
         # Get run from database
-        run = db.query(Run).filter(Run.id == workflow_id).first()
+        run = db.get(Run, workflow_id)
         
         if not run:
             raise HTTPException(
@@ -119,13 +149,18 @@ async def get_workflow_status(
                 detail=f"Workflow {workflow_id} not found"
             )
         
-        # Get agent runs
-        agent_runs = db.query(AgentRun).filter(
+        # Get agent runs; without details only the progress columns are read
+        agent_query = db.query(AgentRun).filter(
             AgentRun.run_id == workflow_id
-        ).order_by(AgentRun.created_at).all()
+        ).order_by(AgentRun.created_at)
+        if not include_agent_details:
+            agent_query = agent_query.options(
+                load_only(AgentRun.status, AgentRun.agent_name, AgentRun.created_at)
+            )
+        agent_runs = agent_query.all()
         
         # Calculate progress
-        total_agents = 4  # react, debate, evaluator, governor
+        total_agents = len(AGENT_STEPS)
         completed_agents = sum(1 for ar in agent_runs if ar.status.value == "completed")
         progress = (completed_agents / total_agents) * 100 if total_agents > 0 else 0
         
@@ -191,6 +226,38 @@ async def get_workflow_status(
         )
 
 
+@router.get(
+    "/{workflow_id}/events",
+    summary="Stream Workflow Status",
+    description="Stream workflow status transitions as server-sent events"
+)
+async def stream_workflow_events(
+    workflow_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Stream status transitions of a workflow as server-sent events.
+    
+    The first event carries the current status snapshot; later events are
+    pushed as agents start and finish, so clients need not poll the status
+    endpoint. The stream ends when the workflow completes or fails.
+    """
+    if not status_streaming_available():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Workflow status streaming is not configured"
+        )
+    
+    workflow = ComplianceWorkflow(db_session=db)
+    
+    async def event_stream():
+        async for event in workflow.stream_workflow_status(workflow_id):
+            yield f"data: {json.dumps(event, default=str)}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.get(
     "/{workflow_id}/results",
     response_model=ComplianceResultsResponse,
@@ -199,18 +266,24 @@ async def get_workflow_status(
 )
 async def get_workflow_results(
     workflow_id: str,
+    report_format: Literal["json", "markdown"] = Query(
+        "json",
+        alias="format",
+        description="Use 'markdown' to include the rendered compliance report"
+    ),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Get the final results of a completed workflow.
     
-    Returns the complete compliance analysis, risk assessment, and report.
+    Returns the complete compliance analysis and risk assessment; the
+    markdown report is rendered only when format=markdown is requested.
     Only available for completed workflows.
     """
     try:
         # Get run from database
-        run = db.query(Run).filter(Run.id == workflow_id).first()
+        run = db.get(Run, workflow_id)
         
         if not run:
             raise HTTPException(
@@ -238,7 +311,7 @@ async def get_workflow_results(
             status=WorkflowStatus(run.status.value),
             analysis=output_data.get("analysis"),
             risk_assessment=output_data.get("risk_assessment"),
-            compliance_report=output_data.get("compliance_report"),
+            compliance_report=_markdown_report(run) if report_format == "markdown" else None,
             created_at=run.created_at,
             completed_at=run.completed_at,
             duration_seconds=duration
@@ -6,6 +6,7 @@ from typing import Dict, List, Callable, Optional, Set
 from collections import defaultdict, deque
 from datetime import datetime, timedelta
 import asyncio
+import logging
 from threading import Lock
 
 from .message import Message, MessageType
@@ -82,11 +83,13 @@ class MessageBus:
                 if message.is_broadcast():
                     # Broadcast to all registered agents
                     recipients.update(self._queues.keys())
-                    logger.debug(f"Broadcasting message {message.id} to all agents")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Broadcasting message {message.id} to all agents")
                 else:
                     # Direct message
                     recipients.add(message.receiver)
-                    logger.debug(f"Routing message {message.id} to {message.receiver}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Routing message {message.id} to {message.receiver}")
                 
                 # Add subscribers to this message type
                 recipients.update(self._subscribers.get(message.message_type, set()))
@@ -190,7 +193,7 @@ class MessageBus:
                 if queue:
                     messages.append(queue.popleft())
         
-        if messages:
+        if messages and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Retrieved {len(messages)} message(s) for {agent_name}")
         
         return messages
@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional, List, Set
 from datetime import datetime
 from threading import Lock
 from copy import deepcopy
+import logging
 
 from utils.logging import get_logger
 
@@ -89,7 +90,8 @@ class SharedContext:
             # Notify watchers
             self._notify_watchers(full_key, value, agent_name)
             
-            logger.debug(f"Set {full_key} = {value} (by {agent_name or 'system'})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Set {full_key} = {value} (by {agent_name or 'system'})")
     
     def get(
         self,
@@ -346,7 +348,9 @@ class SharedContext:
     
     def _notify_watchers(self, key: str, value: Any, agent_name: Optional[str]) -> None:
         """Notify agents watching this key."""
-        if key in self._watchers:
+        # Notification is only logged for now, so skip the walk entirely
+        # unless debug output is on
+        if key in self._watchers and logger.isEnabledFor(logging.DEBUG):
             watchers = self._watchers[key].copy()
             for watcher in watchers:
                 if watcher != agent_name:  # Don't notify the agent that made the change
@@ -32,9 +32,9 @@ class KafkaConfig(BaseSettings):
     )
     
     # Producer settings
-    KAFKA_BATCH_SIZE: int = int(os.getenv("KAFKA_BATCH_SIZE", "100"))
-    KAFKA_LINGER_MS: int = int(os.getenv("KAFKA_LINGER_MS", "100"))
-    KAFKA_COMPRESSION: str = os.getenv("KAFKA_COMPRESSION", "gzip")
+    KAFKA_BATCH_SIZE: int = int(os.getenv("KAFKA_BATCH_SIZE", "262144"))
+    KAFKA_LINGER_MS: int = int(os.getenv("KAFKA_LINGER_MS", "10"))
+    KAFKA_COMPRESSION: str = os.getenv("KAFKA_COMPRESSION", "lz4")
     KAFKA_MAX_RETRIES: int = int(os.getenv("KAFKA_MAX_RETRIES", "3"))
     
     # Feature flags
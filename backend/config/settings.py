@@ -53,6 +53,15 @@ class Settings(BaseSettings):
     # Workflow Configuration
     max_retry_attempts: int = 3
     workflow_timeout_seconds: int = 600
+    task_broker_url: str = Field(
+        default="",
+        description="Celery broker URL for workflow workers; empty runs workflows in-process"
+    )
+    redis_url: str = Field(
+        default="",
+        description="Redis URL for workflow report caching and status events; empty disables both"
+    )
+    workflow_cache_ttl_seconds: int = 3600
     
     # Logging Configuration
     log_level: str = Field(
@@ -1,181 +1,108 @@
 
 """
 Core module exports.
-"""
-
-from .base_agent import BaseAgent
-from .agent_loader import AgentLoader
-from .orchestrator import Orchestrator
-from .action_dispatcher import ActionDispatcher
-from .feedback_pipeline import FeedbackPipeline, OutcomeEvent, OutcomeStatus
-from .online_learning import RealTimeModelUpdater
-from .performance_monitor import (
-    PerformanceMonitor,
-    get_performance_monitor,
-    init_performance_monitor,
-    PerformanceMetrics,
-    AgentPerformance,
-    PerformanceAlert,
-    AlertLevel,
-    MetricType
-)
-from .dynamic_config_manager import (
-    DynamicConfigManager,
-    get_config_manager,
-    AdjustmentStrategy,
-    AdjustmentRule,
-    ParameterBounds,
-    ConfigurationScope
-)
-from .performance_monitor_with_config import (
-    AdaptivePerformanceMonitor,
-    get_adaptive_monitor
-)
-from .adaptive_orchestrator import AdaptiveOrchestrator
 
-# Plugin system
-from .plugin_base import (
-    PluginInterface,
-    PluginMetadata,
-    PluginCapability,
-    PluginPermission,
-    PluginException,
-    PluginInitializationError,
-    PluginExecutionError,
-    PluginSecurityError,
-    PluginValidationError
-)
-from .plugin_security import PluginSignature, PluginSandbox, PluginValidator
-from .plugin_loader import PluginLoader, PluginInstance
-from .plugin_registry import PluginRegistry, PluginRegistryEntry
-from .plugin_service import PluginService
-from .orchestrator_with_plugins import PluginEnabledOrchestrator
+Exports are resolved lazily: ``from core.version_detector import ...`` (or
+``from core import VersionDetector``) only loads the submodules it needs,
+not every agent, monitoring and plugin module in the package.
+"""
 
-# Self-update CI/CD system
-from .version_detector import (
-    VersionDetector,
-    VersionInfo,
-    VersionComparison,
-    UpdateSource,
-    UpdatePriority
-)
-from .update_simulator import (
-    UpdateSimulator,
-    SimulationResult,
-    SimulationConfig,
-    SimulationStatus,
-    TestType
-)
-from .update_policy_engine import (
-    UpdatePolicyEngine,
-    PolicyEvaluation,
-    UpdatePolicy,
-    UpdateDecision,
-    RiskLevel
-)
-from .cicd_integrator import (
-    CICDIntegrator,
-    CICDConfig,
-    CICDProvider,
-    DeploymentTrigger,
-    DeploymentResult,
-    DeploymentStatus
-)
-from .rollout_controller import (
-    RolloutController,
-    RolloutConfig,
-    RolloutStrategy,
-    RolloutStatus,
-    RolloutPhase
-)
-from .self_update_orchestrator import (
-    SelfUpdateOrchestrator,
-    UpdateWorkflow
-)
+from importlib import import_module
+from typing import Any
 
-__all__ = [
-    # Base classes
-    "BaseAgent",
-    "AgentLoader",
-    
-    # Orchestration
-    "Orchestrator",
-    "ActionDispatcher",
-    "AdaptiveOrchestrator",
-    
-    # Feedback and learning
-    "FeedbackPipeline",
-    "OutcomeEvent",
-    "OutcomeStatus",
-    "RealTimeModelUpdater",
-    
-    # Performance monitoring
-    "PerformanceMonitor",
-    "get_performance_monitor",
-    "init_performance_monitor",
-    "PerformanceMetrics",
-    "AgentPerformance",
-    "PerformanceAlert",
-    "AlertLevel",
-    "MetricType",
-    
-    # Dynamic self-configuration
-    "DynamicConfigManager",
-    "get_config_manager",
-    "AdjustmentStrategy",
-    "AdjustmentRule",
-    "ParameterBounds",
-    "ConfigurationScope",
-    "AdaptivePerformanceMonitor",
-    "get_adaptive_monitor",
+# Exported name -> submodule that defines it
+_EXPORTS = {
+    "BaseAgent": ".base_agent",
+    "AgentLoader": ".agent_loader",
+    "Orchestrator": ".orchestrator",
+    "ActionDispatcher": ".action_dispatcher",
+    "FeedbackPipeline": ".feedback_pipeline",
+    "OutcomeEvent": ".feedback_pipeline",
+    "OutcomeStatus": ".feedback_pipeline",
+    "RealTimeModelUpdater": ".online_learning",
+    "PerformanceMonitor": ".performance_monitor",
+    "get_performance_monitor": ".performance_monitor",
+    "init_performance_monitor": ".performance_monitor",
+    "PerformanceMetrics": ".performance_monitor",
+    "AgentPerformance": ".performance_monitor",
+    "PerformanceAlert": ".performance_monitor",
+    "AlertLevel": ".performance_monitor",
+    "MetricType": ".performance_monitor",
+    "DynamicConfigManager": ".dynamic_config_manager",
+    "get_config_manager": ".dynamic_config_manager",
+    "AdjustmentStrategy": ".dynamic_config_manager",
+    "AdjustmentRule": ".dynamic_config_manager",
+    "ParameterBounds": ".dynamic_config_manager",
+    "ConfigurationScope": ".dynamic_config_manager",
+    "AdaptivePerformanceMonitor": ".performance_monitor_with_config",
+    "get_adaptive_monitor": ".performance_monitor_with_config",
+    "AdaptiveOrchestrator": ".adaptive_orchestrator",
     
     # Plugin system
-    "PluginInterface",
-    "PluginMetadata",
-    "PluginCapability",
-    "PluginPermission",
-    "PluginException",
-    "PluginInitializationError",
-    "PluginExecutionError",
-    "PluginSecurityError",
-    "PluginValidationError",
-    "PluginSignature",
-    "PluginSandbox",
-    "PluginValidator",
-    "PluginLoader",
-    "PluginInstance",
-    "PluginRegistry",
-    "PluginRegistryEntry",
-    "PluginService",
-    "PluginEnabledOrchestrator",
+    "PluginInterface": ".plugin_base",
+    "PluginMetadata": ".plugin_base",
+    "PluginCapability": ".plugin_base",
+    "PluginPermission": ".plugin_base",
+    "PluginException": ".plugin_base",
+    "PluginInitializationError": ".plugin_base",
+    "PluginExecutionError": ".plugin_base",
+    "PluginSecurityError": ".plugin_base",
+    "PluginValidationError": ".plugin_base",
+    "PluginSignature": ".plugin_security",
+    "PluginSandbox": ".plugin_security",
+    "PluginValidator": ".plugin_security",
+    "PluginLoader": ".plugin_loader",
+    "PluginInstance": ".plugin_loader",
+    "PluginRegistry": ".plugin_registry",
+    "PluginRegistryEntry": ".plugin_registry",
+    "PluginService": ".plugin_service",
+    "PluginEnabledOrchestrator": ".orchestrator_with_plugins",
     
     # Self-update CI/CD system
-    "VersionDetector",
-    "VersionInfo",
-    "VersionComparison",
-    "UpdateSource",
-    "UpdatePriority",
-    "UpdateSimulator",
-    "SimulationResult",
-    "SimulationConfig",
-    "SimulationStatus",
-    "TestType",
-    "UpdatePolicyEngine",
-    "PolicyEvaluation",
-    "UpdatePolicy",
-    "UpdateDecision",
-    "RiskLevel",
-    "CICDIntegrator",
-    "CICDConfig",
-    "CICDProvider",
-    "DeploymentTrigger",
-    "DeploymentResult",
-    "DeploymentStatus",
-    "RolloutController",
-    "RolloutConfig",
-    "RolloutStrategy",
-    "RolloutStatus",
-    "RolloutPhase",
-    "SelfUpdateOrchestrator",
-    "UpdateWorkflow",
-]
+    "VersionDetector": ".version_detector",
+    "VersionInfo": ".version_detector",
+    "VersionComparison": ".version_detector",
+    "UpdateSource": ".version_detector",
+    "UpdatePriority": ".version_detector",
+    "UpdateSimulator": ".update_simulator",
+    "SimulationResult": ".update_simulator",
+    "SimulationConfig": ".update_simulator",
+    "SimulationStatus": ".update_simulator",
+    "TestType": ".update_simulator",
+    "UpdatePolicyEngine": ".update_policy_engine",
+    "PolicyEvaluation": ".update_policy_engine",
+    "UpdatePolicy": ".update_policy_engine",
+    "UpdateDecision": ".update_policy_engine",
+    "RiskLevel": ".update_policy_engine",
+    "CICDIntegrator": ".cicd_integrator",
+    "CICDConfig": ".cicd_integrator",
+    "CICDProvider": ".cicd_integrator",
+    "DeploymentTrigger": ".cicd_integrator",
+    "DeploymentResult": ".cicd_integrator",
+    "DeploymentStatus": ".cicd_integrator",
+    "RolloutController": ".rollout_controller",
+    "RolloutConfig": ".rollout_controller",
+    "RolloutStrategy": ".rollout_controller",
+    "RolloutStatus": ".rollout_controller",
+    "RolloutPhase": ".rollout_controller",
+    "SelfUpdateOrchestrator": ".self_update_orchestrator",
+    "UpdateWorkflow": ".self_update_orchestrator"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access to an export."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,11 +6,13 @@ This module provides an enhanced action dispatcher that tracks agent executions
 and publishes structured outcome events to the feedback pipeline.
 """
 
+import sys
 import uuid
 import time
+import asyncio
 import traceback
 from typing import Dict, Any, Optional, List, Callable
-from datetime import datetime
+from functools import lru_cache
 from contextlib import asynccontextmanager
 
 from core.base_agent import BaseAgent
@@ -25,6 +27,30 @@ from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Step outcomes that end a sequential workflow early
+_WORKFLOW_STOP_STATUSES = frozenset({
+    OutcomeStatus.FAILURE.value,
+    OutcomeStatus.TIMEOUT.value
+})
+
+
+@lru_cache(maxsize=8)
+def _utc_second_prefix(epoch_seconds: int) -> str:
+    """ISO-8601 UTC prefix (to the second) for an epoch second."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(epoch_seconds))
+
+
+def _format_utc_ns(epoch_ns: int) -> str:
+    """
+    Format an epoch-nanosecond timestamp as a naive UTC ISO-8601 string.
+    
+    Equivalent to ``datetime.utcnow().isoformat(timespec="microseconds")``
+    without allocating a datetime; the per-second prefix is cached since
+    dispatches cluster within the same second.
+    """
+    seconds, nanos = divmod(epoch_ns, 1_000_000_000)
+    return f"{_utc_second_prefix(seconds)}.{nanos // 1000:06d}"
+
 
 class ActionDispatcher:
     """
@@ -88,7 +114,12 @@ class ActionDispatcher:
         """
         event_id = str(uuid.uuid4())
         run_id = run_id or str(uuid.uuid4())
-        start_time = datetime.utcnow()
+        
+        # Agent names and action types come from a small set; interning
+        # them makes buffer keys and comparisons identity-cheap
+        action_type = sys.intern(action_type)
+        agent_name = sys.intern(agent.name)
+        start_ns = time.time_ns()
         start_perf = time.perf_counter()
         
         # Initialize result
@@ -112,7 +143,7 @@ class ActionDispatcher:
             
             # Execute the agent
             logger.info(
-                f"Dispatching action: agent={agent.name} "
+                f"Dispatching action: agent={agent_name} "
                 f"type={action_type} event_id={event_id}"
             )
             
@@ -158,8 +189,9 @@ class ActionDispatcher:
         
         finally:
             # Calculate metrics
-            end_time = datetime.utcnow()
             end_perf = time.perf_counter()
+            end_ns = time.time_ns()
+            end_time = _format_utc_ns(end_ns)
             duration_ms = (end_perf - start_perf) * 1000
             
             # Extract LLM metrics if available
@@ -170,12 +202,13 @@ class ActionDispatcher:
             event = OutcomeEvent(
                 event_id=event_id,
                 run_id=run_id,
-                agent_name=agent.name,
+                agent_name=agent_name,
                 agent_type=agent.agent_type,
                 action_type=action_type,
-                timestamp=datetime.utcnow().isoformat(),
-                start_time=start_time.isoformat(),
-                end_time=end_time.isoformat(),
+                timestamp=end_time,
+                timestamp_ns=end_ns,
+                start_time=_format_utc_ns(start_ns),
+                end_time=end_time,
                 duration_ms=duration_ms,
                 status=status,
                 severity=severity,
@@ -310,17 +343,25 @@ class OrchestrationDispatcher:
         task: str,
         context: Optional[Dict[str, Any]] = None,
         workflow_id: Optional[str] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        parallel: bool = False
     ) -> Dict[str, Any]:
         """
         Execute a multi-agent workflow with outcome tracking.
         
+        By default agents run in order and the workflow stops at the first
+        failure or timeout; later agents are never dispatched. With
+        ``parallel=True`` the agents are treated as independent and
+        dispatched concurrently; every agent runs regardless of failures
+        and outputs are reported in agent order.
+        
         Args:
             agents: List of agents to execute
             task: Task description
             context: Shared context
             workflow_id: Workflow identifier
             tags: Workflow tags
+            parallel: Dispatch independent agents concurrently
             
         Returns:
             dict: Workflow results with outcome metadata
@@ -337,30 +378,42 @@ class OrchestrationDispatcher:
             f"agents={len(agents)} task={task[:50]}..."
         )
         
-        # Execute each agent
-        for agent in agents:
-            result = await self.dispatcher.dispatch(
-                agent=agent,
-                action_type="workflow_step",
-                input_data={"task": task},
-                context=context,
-                run_id=run_id,
-                workflow_id=workflow_id,
-                tags=tags
-            )
+        if parallel:
+            results = await asyncio.gather(*[
+                self.dispatcher.dispatch(
+                    agent=agent,
+                    action_type="workflow_step",
+                    input_data={"task": task},
+                    context=context,
+                    run_id=run_id,
+                    workflow_id=workflow_id,
+                    tags=tags
+                )
+                for agent in agents
+            ])
             
-            # Add to outputs
-            context["outputs"].append({
-                "agent": agent.name,
-                "output": result.get("output"),
-                "status": result.get("status"),
-                "event_id": result.get("event_id")
-            })
-            
-            # Stop on failure if configured
-            if result.get("status") == "failure":
-                logger.warning(f"Workflow stopped due to failure in {agent.name}")
-                break
+            for agent, result in zip(agents, results):
+                context["outputs"].append(self._workflow_output(agent, result))
+        else:
+            # Execute each agent
+            for agent in agents:
+                result = await self.dispatcher.dispatch(
+                    agent=agent,
+                    action_type="workflow_step",
+                    input_data={"task": task},
+                    context=context,
+                    run_id=run_id,
+                    workflow_id=workflow_id,
+                    tags=tags
+                )
+                
+                # Add to outputs
+                context["outputs"].append(self._workflow_output(agent, result))
+                
+                # Stop at the first failed or timed-out step
+                if result.get("status") in _WORKFLOW_STOP_STATUSES:
+                    logger.warning(f"Workflow stopped due to failure in {agent.name}")
+                    break
         
         return {
             "workflow_id": workflow_id,
@@ -369,6 +422,16 @@ class OrchestrationDispatcher:
             "state": context["state"],
             "metrics": self.dispatcher.get_metrics()
         }
+    
+    @staticmethod
+    def _workflow_output(agent: BaseAgent, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the per-agent workflow output entry from a dispatch result."""
+        return {
+            "agent": agent.name,
+            "output": result.get("output"),
+            "status": result.get("status"),
+            "event_id": result.get("event_id")
+        }
 
 
 # Factory function
@@ -16,7 +16,7 @@ Connects all existing components into a compounding learning loop:
 Result: Performance compounds with each iteration
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 import json
 from datetime import datetime
 import time
@@ -100,6 +100,40 @@ class AgentLearningCoordinator:
         Returns:
             Comprehensive learning report
         """
+        start_time = time.time()
+        
+        for _ in self.iter_exponential_learning_loop(iterations, batch_size, report_every):
+            pass
+        
+        total_time = time.time() - start_time
+        
+        logger.info("\n" + "="*70)
+        logger.info("✅ EXPONENTIAL LEARNING COMPLETE")
+        logger.info(f"   Total Time: {total_time:.1f}s")
+        logger.info("="*70)
+        
+        return self._generate_learning_report(total_time)
+    
+    def iter_exponential_learning_loop(
+        self, 
+        iterations: int = 100,
+        batch_size: int = 10,
+        report_every: int = 10
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run the exponential learning loop, yielding each iteration's record.
+        
+        Callers can inspect iterations as they finish and stop early;
+        start_exponential_learning_loop drains this and builds the report.
+        
+        Args:
+            iterations: Number of learning iterations
+            batch_size: Tasks per iteration
+            report_every: Report progress every N iterations
+        
+        Yields:
+            Iteration record (iteration, performance, multiplier, ...)
+        """
         logger.info("\n" + "="*70)
         logger.info("🔥 STARTING EXPONENTIAL LEARNING LOOP")
         logger.info(f"   Iterations: {iterations}")
@@ -107,7 +141,6 @@ class AgentLearningCoordinator:
         logger.info("="*70)
         
         baseline_performance = None
-        start_time = time.time()
         
         for iteration in range(iterations):
             iteration_start = time.time()
@@ -180,15 +213,8 @@ class AgentLearningCoordinator:
                 logger.info(f"\n🚀 MILESTONE: Performance 5x baseline! ({multiplier:.1f}x)")
             elif multiplier >= 10.0:
                 logger.info(f"\n⭐ MILESTONE: Performance 10x baseline! ({multiplier:.1f}x)")
-        
-        total_time = time.time() - start_time
-        
-        logger.info("\n" + "="*70)
-        logger.info("✅ EXPONENTIAL LEARNING COMPLETE")
-        logger.info(f"   Total Time: {total_time:.1f}s")
-        logger.info("="*70)
-        
-        return self._generate_learning_report(total_time)
+            
+            yield iteration_data
     
     def _generate_training_batch(self, batch_size: int) -> List[Dict[str, Any]]:
         """Generate safe training tasks using plugin system."""
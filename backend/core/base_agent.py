@@ -3,7 +3,7 @@ Base agent class that all agents must inherit from.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
+from typing import Any, Collection, Dict, Optional, List
 from datetime import datetime
 
 from communication import CommunicationProtocol, Message, MessageType
@@ -33,7 +33,7 @@ class BaseAgent(ABC):
         self,
         name: str,
         agent_type: str,
-        capabilities: Optional[List[str]] = None,
+        capabilities: Optional[Collection[str]] = None,
         protocol: Optional[CommunicationProtocol] = None,
         llm_provider: Optional[BaseLLMProvider] = None,
         metadata: Optional[Dict[str, Any]] = None
@@ -44,7 +44,7 @@ class BaseAgent(ABC):
         Args:
             name: Unique agent name
             agent_type: Type of agent
-            capabilities: List of capabilities
+            capabilities: Capabilities (any collection, e.g. a shared frozenset)
             protocol: Communication protocol
             llm_provider: LLM provider
             metadata: Additional metadata
@@ -76,7 +76,7 @@ class BaseAgent(ABC):
         self.protocol.register_agent(
             name=self.name,
             agent_type=self.agent_type,
-            capabilities=self.capabilities,
+            capabilities=list(self.capabilities),
             metadata=self.metadata
         )
         self._is_registered = True
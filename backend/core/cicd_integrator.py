@@ -14,8 +14,9 @@ Integrates with CI/CD systems to trigger automated deployments:
 import asyncio
 import logging
 import json
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 import aiohttp
@@ -94,11 +95,13 @@ class CICDIntegrator:
         
         self.active_deployments: Dict[str, DeploymentResult] = {}
         self.completed_deployments: List[DeploymentResult] = []
-        self.deployment_queue: List[DeploymentTrigger] = []
+        self.deployment_queue: Deque[DeploymentTrigger] = deque()
         
         self._trigger_counter = 0
         self._running = False
         self._deployment_task: Optional[asyncio.Task] = None
+        # Set when a trigger is queued so the processor wakes immediately
+        self._queue_ready = asyncio.Event()
     
     def _get_default_config(self) -> CICDConfig:
         """Get default CI/CD configuration"""
@@ -171,6 +174,7 @@ class CICDIntegrator:
         
         # Add to queue
         self.deployment_queue.append(trigger)
+        self._queue_ready.set()
         
         logger.info(f"Deployment triggered: {trigger_id} for {version_info.component} v{version_info.version}")
         return trigger
@@ -179,11 +183,13 @@ class CICDIntegrator:
         """Process deployment queue"""
         while self._running:
             try:
-                if self.deployment_queue:
-                    trigger = self.deployment_queue.pop(0)
-                    await self._execute_deployment(trigger)
-                else:
-                    await asyncio.sleep(5)
+                if not self.deployment_queue:
+                    self._queue_ready.clear()
+                    await self._queue_ready.wait()
+                    continue
+                
+                trigger = self.deployment_queue.popleft()
+                await self._execute_deployment(trigger)
             except Exception as e:
                 logger.error(f"Error processing deployment queue: {e}")
                 await asyncio.sleep(10)
@@ -351,10 +357,10 @@ class CICDIntegrator:
         
         # Remove from queue if pending
         initial_len = len(self.deployment_queue)
-        self.deployment_queue = [
+        self.deployment_queue = deque(
             t for t in self.deployment_queue
             if t.trigger_id != trigger_id
-        ]
+        )
         
         return len(self.deployment_queue) < initial_len
     
@@ -7,22 +7,26 @@ outcome events from agent actions, enabling real-time monitoring, analytics,
 and adaptive learning.
 """
 
-from typing import Dict, Any, Optional, List, Literal
-from datetime import datetime
+from typing import Dict, Any, Optional, List, Literal, Union
 from enum import Enum
 import json
+import logging
+import time
 import asyncio
-from dataclasses import dataclass, asdict
+import numpy as np
+from dataclasses import dataclass, field, fields
 from concurrent.futures import ThreadPoolExecutor
 
 try:
     from kafka import KafkaProducer
+    from kafka.codec import has_lz4
     from kafka.errors import KafkaError
     KAFKA_AVAILABLE = True
 except ImportError:
     KAFKA_AVAILABLE = False
     KafkaProducer = None
     KafkaError = Exception
+    has_lz4 = lambda: False
 
 from utils.logging import get_logger
 
@@ -39,6 +43,12 @@ class OutcomeStatus(str, Enum):
     PENDING = "pending"
 
 
+# Compact integer codes used by the columnar event buffer
+_STATUS_CODES: Dict[OutcomeStatus, int] = {
+    status: code for code, status in enumerate(OutcomeStatus)
+}
+
+
 class EventSeverity(str, Enum):
     """Event severity levels."""
     INFO = "info"
@@ -47,13 +57,24 @@ class EventSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Logging level per severity, resolved once instead of per logged event
+_SEVERITY_LEVELS: Dict[EventSeverity, int] = {
+    EventSeverity.INFO: logging.INFO,
+    EventSeverity.WARNING: logging.WARNING,
+    EventSeverity.ERROR: logging.ERROR,
+    EventSeverity.CRITICAL: logging.CRITICAL
+}
+
+
+@dataclass(slots=True)
 class OutcomeEvent:
     """
     Structured outcome event from an agent action.
     
     This event captures the complete context of an agent action execution,
     including performance metrics, errors, and contextual information.
+    One is allocated per dispatch, so it is slotted to drop the
+    per-instance ``__dict__``.
     """
     # Identification
     event_id: str
@@ -106,17 +127,68 @@ class OutcomeEvent:
     tags: Optional[List[str]] = None
     metadata: Optional[Dict[str, Any]] = None
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        data = asdict(self)
-        # Convert enums to strings
-        data['status'] = self.status.value
-        data['severity'] = self.severity.value
-        return data
+    # Epoch nanoseconds of `timestamp`, so consumers can compare times
+    # without parsing the ISO string (which is kept for compatibility)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    # Serialized form, populated on first use and shared by every sink.
+    # Events are treated as immutable once serialized.
+    _cached_json: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # to_dict() is generated below, once the field layout is known
+    
+    def to_json_bytes(self) -> bytes:
+        """Convert to UTF-8 encoded JSON, serializing at most once."""
+        if self._cached_json is None:
+            self._cached_json = json.dumps(
+                self.to_dict(), separators=(',', ':')
+            ).encode('utf-8')
+        return self._cached_json
     
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        return self.to_json_bytes().decode('utf-8')
+
+
+def _compile_to_dict(cls: type) -> Any:
+    """
+    Generate a straight-line ``to_dict`` for an event dataclass.
+    
+    The field layout is fixed at class creation, so instead of walking
+    ``dataclasses.fields`` on every call (as ``asdict`` does) the method is
+    built once as a single dict literal. Enum fields are converted to their
+    values through a precomputed member-to-value table (cheaper than the
+    ``.value`` descriptor) and ``tags`` is copied; other nested values are
+    shared with the event and should be treated as read-only. Private
+    fields are skipped.
+    """
+    namespace: Dict[str, Any] = {}
+    entries = []
+    for f in fields(cls):
+        if f.name.startswith('_'):
+            continue
+        if isinstance(f.type, type) and issubclass(f.type, Enum):
+            table = f"_{f.name}_values"
+            namespace[table] = {member: member.value for member in f.type}
+            expr = f"{table}[self.{f.name}]"
+        elif f.name == 'tags':
+            expr = "None if self.tags is None else list(self.tags)"
+        else:
+            expr = f"self.{f.name}"
+        entries.append(f"        {f.name!r}: {expr},")
+    
+    source = "def to_dict(self):\n    return {\n" + "\n".join(entries) + "\n    }\n"
+    exec(source, namespace)
+    
+    to_dict = namespace['to_dict']
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__doc__ = "Convert to dictionary."
+    return to_dict
+
+
+OutcomeEvent.to_dict = _compile_to_dict(OutcomeEvent)
 
 
 class KafkaPublisher:
@@ -124,16 +196,19 @@ class KafkaPublisher:
     Kafka publisher for outcome events.
     
     Handles asynchronous publishing of events to Kafka with error handling,
-    retry logic, and monitoring.
+    retry logic, and monitoring. Sends are fire-and-forget: the producer's
+    sender thread batches records on size (``batch_size``) or time
+    (``linger_ms``), and delivery results are recorded from callbacks.
     """
     
     def __init__(
         self,
         bootstrap_servers: str,
         topic: str = "agent-outcomes",
-        batch_size: int = 100,
-        linger_ms: int = 100,
-        compression_type: str = "gzip",
+        batch_size: int = 262144,
+        linger_ms: int = 10,
+        compression_type: str = "lz4",
+        acks: Union[int, str] = 1,
         max_retries: int = 3,
         enable_monitoring: bool = True
     ):
@@ -143,9 +218,11 @@ class KafkaPublisher:
         Args:
             bootstrap_servers: Kafka bootstrap servers
             topic: Topic name for outcome events
-            batch_size: Number of messages to batch
+            batch_size: Maximum batch size in bytes per partition
             linger_ms: Time to wait before sending batch
-            compression_type: Compression algorithm
+            compression_type: Compression algorithm (falls back to gzip
+                when lz4 is requested but not installed)
+            acks: Broker acknowledgements required per batch
             max_retries: Maximum retry attempts
             enable_monitoring: Enable internal monitoring
         """
@@ -168,15 +245,18 @@ class KafkaPublisher:
         # Thread pool for async operations
         self._executor = ThreadPoolExecutor(max_workers=2)
         
+        if compression_type == "lz4" and not has_lz4():
+            logger.warning("lz4 not installed, falling back to gzip compression")
+            compression_type = "gzip"
+        
         try:
             self.producer = KafkaProducer(
                 bootstrap_servers=bootstrap_servers,
-                value_serializer=lambda v: json.dumps(v).encode('utf-8'),
                 batch_size=batch_size,
                 linger_ms=linger_ms,
                 compression_type=compression_type,
                 retries=max_retries,
-                acks='all'
+                acks=acks
             )
             logger.info(f"Kafka publisher initialized (topic={topic})")
         except Exception as e:
@@ -188,38 +268,31 @@ class KafkaPublisher:
         """
         Publish an outcome event to Kafka.
         
+        The event is handed to the producer's send queue and this call
+        returns without waiting for the broker; delivery is tracked in
+        the publisher metrics once the batch is acknowledged.
+        
         Args:
             event: Outcome event to publish
             
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if the event was queued, False otherwise
         """
         if not self.enabled or not self.producer:
             logger.debug(f"Kafka disabled, logging event: {event.event_id}")
             return False
         
         try:
-            start = datetime.now()
-            
-            # Convert event to dict
-            event_data = event.to_dict()
-            
-            # Send to Kafka
-            future = self.producer.send(self.topic, value=event_data, key=event.event_id.encode('utf-8'))
-            
-            # Wait for confirmation (with timeout)
-            record_metadata = future.get(timeout=10)
+            start = time.perf_counter()
             
-            # Update metrics
-            if self.enable_monitoring:
-                latency = (datetime.now() - start).total_seconds() * 1000
-                self._events_sent += 1
-                self._total_latency_ms += latency
-                
-            logger.debug(
-                f"Event published: {event.event_id} "
-                f"(partition={record_metadata.partition}, offset={record_metadata.offset})"
+            # Queue for sending; the producer batches on size or linger_ms
+            future = self.producer.send(
+                self.topic,
+                value=event.to_json_bytes(),
+                key=event.event_id.encode('utf-8')
             )
+            future.add_callback(self._on_send_success, event.event_id, start)
+            future.add_errback(self._on_send_error, event.event_id)
             
             return True
             
@@ -232,20 +305,40 @@ class KafkaPublisher:
             logger.error(f"Failed to publish event {event.event_id}: {e}")
             return False
     
+    def _on_send_success(self, event_id: str, start: float, record_metadata: Any) -> None:
+        """Record a delivered event (runs on the producer's sender thread)."""
+        if self.enable_monitoring:
+            self._events_sent += 1
+            self._total_latency_ms += (time.perf_counter() - start) * 1000
+        
+        logger.debug(
+            f"Event published: {event_id} "
+            f"(partition={record_metadata.partition}, offset={record_metadata.offset})"
+        )
+    
+    def _on_send_error(self, event_id: str, exc: BaseException) -> None:
+        """Record a failed delivery (runs on the producer's sender thread)."""
+        self._events_failed += 1
+        logger.error(f"Kafka error publishing event {event_id}: {exc}")
+    
     async def publish_batch(self, events: List[OutcomeEvent]) -> Dict[str, int]:
         """
         Publish multiple events in batch.
         
+        All events are queued first, then the producer is flushed once off
+        the event loop so the whole batch is driven to completion together.
+        
         Args:
             events: List of outcome events
             
         Returns:
             dict: Statistics (sent, failed)
         """
-        results = await asyncio.gather(
-            *[self.publish(event) for event in events],
-            return_exceptions=True
-        )
+        results = [await self.publish(event) for event in events]
+        
+        if self.enabled and self.producer:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, self.producer.flush)
         
         sent = sum(1 for r in results if r is True)
         failed = len(results) - sent
@@ -296,7 +389,8 @@ class FeedbackPipeline:
         kafka_servers: Optional[str] = None,
         kafka_topic: str = "agent-outcomes",
         enable_kafka: bool = True,
-        enable_logging: bool = True
+        enable_logging: bool = True,
+        buffer_max_size: int = 1000
     ):
         """
         Initialize feedback pipeline.
@@ -306,6 +400,7 @@ class FeedbackPipeline:
             kafka_topic: Kafka topic name
             enable_kafka: Enable Kafka publishing
             enable_logging: Enable log-based fallback
+            buffer_max_size: Number of recent events kept in memory
         """
         self.enable_kafka = enable_kafka and kafka_servers is not None
         self.enable_logging = enable_logging
@@ -318,9 +413,21 @@ class FeedbackPipeline:
                 topic=kafka_topic
             )
         
-        # Local event buffer (for fallback and testing)
-        self._event_buffer: List[OutcomeEvent] = []
-        self._buffer_max_size = 1000
+        # Local event buffer (for fallback and testing), stored as a ring.
+        # Filter columns live in parallel NumPy arrays so get_recent_events
+        # can select matching slots with a vectorized scan; the event
+        # objects themselves are kept in a same-sized sidecar list.
+        self._buffer_max_size = buffer_max_size
+        self._event_buffer: List[Optional[OutcomeEvent]] = [None] * buffer_max_size
+        self._status_codes = np.zeros(buffer_max_size, dtype=np.uint8)
+        self._agent_ids = np.zeros(buffer_max_size, dtype=np.int32)
+        # Interned ids of agents with events in the buffer, and how many
+        # each has; an agent is dropped once its last event is overwritten
+        self._agent_id_map: Dict[str, int] = {}
+        self._agent_event_counts: Dict[int, int] = {}
+        self._next_agent_id = 0
+        self._write_index = 0
+        self._buffer_count = 0
         
         logger.info(
             f"Feedback pipeline initialized "
@@ -335,9 +442,7 @@ class FeedbackPipeline:
             event: Outcome event to record
         """
         # Add to buffer
-        if len(self._event_buffer) >= self._buffer_max_size:
-            self._event_buffer.pop(0)  # Remove oldest
-        self._event_buffer.append(event)
+        self._append_event(event)
         
         # Publish to Kafka
         if self.kafka_publisher:
@@ -347,16 +452,46 @@ class FeedbackPipeline:
         if self.enable_logging:
             self._log_event(event)
     
+    def _append_event(self, event: OutcomeEvent) -> None:
+        """
+        Append an event to the ring buffer, overwriting the oldest when full.
+        
+        Args:
+            event: Outcome event to buffer
+        """
+        slot = self._write_index
+        evicted = self._event_buffer[slot]
+        if evicted is not None:
+            evicted_id = int(self._agent_ids[slot])
+            remaining = self._agent_event_counts[evicted_id] - 1
+            if remaining:
+                self._agent_event_counts[evicted_id] = remaining
+            else:
+                del self._agent_event_counts[evicted_id]
+                del self._agent_id_map[evicted.agent_name]
+        
+        agent_id = self._agent_id_map.get(event.agent_name)
+        if agent_id is None:
+            agent_id = self._agent_id_map[event.agent_name] = self._next_agent_id
+            self._next_agent_id += 1
+        self._agent_event_counts[agent_id] = self._agent_event_counts.get(agent_id, 0) + 1
+        
+        self._event_buffer[slot] = event
+        self._status_codes[slot] = _STATUS_CODES[event.status]
+        self._agent_ids[slot] = agent_id
+        
+        self._write_index = (slot + 1) % self._buffer_max_size
+        if self._buffer_count < self._buffer_max_size:
+            self._buffer_count += 1
+    
     def _log_event(self, event: OutcomeEvent) -> None:
         """Log an outcome event."""
-        log_level = {
-            EventSeverity.INFO: logger.info,
-            EventSeverity.WARNING: logger.warning,
-            EventSeverity.ERROR: logger.error,
-            EventSeverity.CRITICAL: logger.critical
-        }.get(event.severity, logger.info)
-        
-        log_level(
+        level = _SEVERITY_LEVELS.get(event.severity, logging.INFO)
+        if not logger.isEnabledFor(level):
+            return
+        
+        logger.log(
+            level,
             f"Outcome: agent={event.agent_name} action={event.action_type} "
             f"status={event.status.value} duration={event.duration_ms:.2f}ms "
             f"latency={event.latency_ms:.2f}ms"
@@ -371,6 +506,9 @@ class FeedbackPipeline:
         """
         Get recent events from buffer.
         
+        Filters return up to ``count`` of the most recent matching events,
+        oldest first.
+        
         Args:
             count: Number of events to retrieve
             agent_name: Filter by agent name
@@ -379,20 +517,53 @@ class FeedbackPipeline:
         Returns:
             List[OutcomeEvent]: Recent events
         """
-        events = self._event_buffer[-count:]
+        if count <= 0 or self._buffer_count == 0:
+            return []
+        
+        size = self._buffer_max_size
+        end = self._write_index
         
-        # Apply filters
+        agent_id = code = None
         if agent_name:
-            events = [e for e in events if e.agent_name == agent_name]
+            agent_id = self._agent_id_map.get(agent_name)
+            if agent_id is None:
+                return []
         if status:
-            events = [e for e in events if e.status == status]
+            code = _STATUS_CODES.get(status)
+            if code is None:
+                return []
+        
+        if agent_id is None and code is None:
+            n = min(count, self._buffer_count)
+            return [self._event_buffer[(end - i) % size] for i in range(n, 0, -1)]
+        
+        # Scan back from the newest event in doubling chunks, stopping once
+        # count matches are found, so the cost tracks how far back they are
+        chunks = []
+        found = 0
+        scanned = 0
+        chunk_size = max(count, 64)
+        while found < count and scanned < self._buffer_count:
+            n = min(chunk_size, self._buffer_count - scanned)
+            slots = np.arange(end - scanned - n, end - scanned) % size
+            mask = np.ones(n, dtype=bool)
+            if agent_id is not None:
+                mask &= self._agent_ids[slots] == agent_id
+            if code is not None:
+                mask &= self._status_codes[slots] == code
+            matches = slots[mask]
+            chunks.append(matches)
+            found += len(matches)
+            scanned += n
+            chunk_size *= 2
         
-        return events
+        slots = np.concatenate(chunks[::-1])[-count:]
+        return [self._event_buffer[slot] for slot in slots]
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get pipeline metrics."""
         metrics = {
-            "buffer_size": len(self._event_buffer),
+            "buffer_size": self._buffer_count,
             "buffer_max_size": self._buffer_max_size
         }
         
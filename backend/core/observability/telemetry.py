@@ -143,7 +143,8 @@ class Tracer:
             thread_id = str(threading.get_ident())
             self.active_spans[thread_id] = span_id
         
-        logger.debug(f"Started span: {name} (trace_id={trace_id}, span_id={span_id})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Started span: {name} (trace_id={trace_id}, span_id={span_id})")
         return span
     
     def end_span(self, span: Span):
@@ -156,7 +157,8 @@ class Tracer:
                 if self.active_spans[thread_id] == span.span_id:
                     del self.active_spans[thread_id]
         
-        logger.debug(f"Ended span: {span.name} (duration={span.duration_ms():.2f}ms)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Ended span: {span.name} (duration={span.duration_ms():.2f}ms)")
     
     def get_active_span(self) -> Optional[Span]:
         """Get the currently active span for this thread"""
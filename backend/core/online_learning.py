@@ -6,16 +6,22 @@ This module implements continuous model improvement through micro-batch updates
 based on outcome events from the feedback pipeline.
 """
 
-from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Tuple, Set
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, asdict
 from enum import Enum
+import sys
 import json
+import time
 import asyncio
+import functools
+import heapq
+from operator import itemgetter
 import numpy as np
 from collections import defaultdict, deque
 import pickle
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from kafka import KafkaConsumer
@@ -26,11 +32,40 @@ except ImportError:
     KafkaConsumer = None
     KafkaError = Exception
 
-from core.feedback_pipeline import OutcomeEvent, OutcomeStatus
+# Fast JSON decoding for Kafka payloads (optional dependencies): msgspec
+# and orjson are both faster drop-ins for json.loads
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+from core.feedback_pipeline import OutcomeEvent, OutcomeStatus, EventSeverity
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Enum members and value lookups hoisted out of the per-event paths:
+# attribute access on an Enum class costs several times a plain compare
+_SUCCESS = OutcomeStatus.SUCCESS
+_STATUS_BY_VALUE: Dict[str, OutcomeStatus] = {
+    status.value: status for status in OutcomeStatus
+}
+_SEVERITY_BY_VALUE: Dict[str, EventSeverity] = {
+    severity.value: severity for severity in EventSeverity
+}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
 
 class ModelType(str, Enum):
     """Types of models that can be updated."""
@@ -83,6 +118,25 @@ class LearningMetrics:
         return asdict(self)
 
 
+def _new_agent_stats() -> Dict[str, Any]:
+    """Fresh per-agent statistics entry for AgentPerformanceModel.agent_stats."""
+    # 'latency_sum' is the running sum of the latency window, so the
+    # average is O(1) instead of a pass over the window per query.
+    return {
+        'successes': 0,
+        'failures': 0,
+        'latencies': deque(maxlen=100),
+        'latency_sum': 0.0,
+        'quality_scores': deque(maxlen=100),
+        'contexts': deque(maxlen=100)
+    }
+
+
+def _new_score_table() -> Dict[str, float]:
+    """Fresh {agent_name: score} table for task and context patterns."""
+    return defaultdict(float)
+
+
 class AgentPerformanceModel:
     """
     Model that tracks agent performance patterns and learns optimal selections.
@@ -95,20 +149,20 @@ class AgentPerformanceModel:
         """Initialize the agent performance model."""
         self.model_id = model_id
         
-        # Agent statistics: {agent_name: {'successes': int, 'failures': int, 'latencies': []}}
-        self.agent_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-            'successes': 0,
-            'failures': 0,
-            'latencies': deque(maxlen=100),
-            'quality_scores': deque(maxlen=100),
-            'contexts': deque(maxlen=100)
-        })
+        # Agent statistics: {agent_name: {'successes': int, 'failures': int, 'latencies': deque}}
+        # Default factories are module-level functions so the model pickles.
+        self.agent_stats: Dict[str, Dict[str, Any]] = defaultdict(_new_agent_stats)
         
         # Task-specific patterns: {task_type: {agent_name: score}}
-        self.task_patterns: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.task_patterns: Dict[str, Dict[str, float]] = defaultdict(_new_score_table)
         
         # Context-aware patterns
-        self.context_patterns: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self.context_patterns: Dict[str, Dict[str, float]] = defaultdict(_new_score_table)
+        
+        # Per-agent (alpha, beta, latency_penalty) used by predict_best_agent,
+        # refreshed only for agents updated since the last prediction
+        self._score_params: Dict[str, Tuple[float, float, float]] = {}
+        self._dirty: Set[str] = set()
         
         self.update_count = 0
         self.last_update = datetime.utcnow()
@@ -120,32 +174,40 @@ class AgentPerformanceModel:
         Args:
             event: Outcome event from agent execution
         """
-        agent_name = event.agent_name
+        # Events decoded from Kafka carry fresh string copies; intern the
+        # names used as keys so each distinct name is stored once
+        agent_name = sys.intern(event.agent_name)
+        action_type = sys.intern(event.action_type) if event.action_type else None
         stats = self.agent_stats[agent_name]
         
         # Update success/failure counts
-        if event.status == OutcomeStatus.SUCCESS:
+        if event.status == _SUCCESS:
             stats['successes'] += 1
         else:
             stats['failures'] += 1
         
-        # Update latency
-        stats['latencies'].append(event.latency_ms)
+        # Update latency window, evicting the oldest value from the running sum
+        latencies = stats['latencies']
+        if len(latencies) == latencies.maxlen:
+            stats['latency_sum'] -= latencies[0]
+        latencies.append(event.latency_ms)
+        stats['latency_sum'] += event.latency_ms
         
         # Update quality scores
         if event.quality_score is not None:
             stats['quality_scores'].append(event.quality_score)
         
         # Update task-specific patterns
-        if event.action_type:
+        if action_type:
             success_rate = self.get_success_rate(agent_name)
-            self.task_patterns[event.action_type][agent_name] = success_rate
+            self.task_patterns[action_type][agent_name] = success_rate
         
         # Update context patterns
         if event.context_snapshot:
             context_key = self._extract_context_key(event.context_snapshot)
             self.context_patterns[context_key][agent_name] = self.get_success_rate(agent_name)
         
+        self._dirty.add(agent_name)
         self.update_count += 1
         self.last_update = datetime.utcnow()
         
@@ -171,37 +233,60 @@ class AgentPerformanceModel:
         Returns:
             List of (agent_name, score) tuples
         """
-        scores: Dict[str, float] = {}
+        self._refresh_score_params()
+        if not self._score_params:
+            return []
         
-        for agent_name, stats in self.agent_stats.items():
-            # Base score: Thompson sampling
-            alpha = stats['successes'] + 1  # Prior
-            beta = stats['failures'] + 1  # Prior
-            score = np.random.beta(alpha, beta)
-            
-            # Adjust for task-specific performance
-            if task_type and task_type in self.task_patterns:
-                task_score = self.task_patterns[task_type].get(agent_name, 0.5)
-                score = 0.6 * score + 0.4 * task_score
-            
-            # Adjust for context
-            if context:
-                context_key = self._extract_context_key(context)
-                if context_key in self.context_patterns:
-                    context_score = self.context_patterns[context_key].get(agent_name, 0.5)
-                    score = 0.7 * score + 0.3 * context_score
-            
-            # Penalize high latency
-            if stats['latencies']:
-                avg_latency = np.mean(list(stats['latencies']))
-                latency_penalty = 1.0 / (1.0 + avg_latency / 1000)  # Normalize
-                score *= latency_penalty
-            
-            scores[agent_name] = score
+        agent_names = list(self._score_params)
+        alpha, beta, latency_penalty = np.array(list(self._score_params.values())).T
+        
+        # Base score: Thompson sampling, one draw per agent
+        scores = np.random.beta(alpha, beta)
+        
+        # Adjust for task-specific performance
+        if task_type and task_type in self.task_patterns:
+            task_scores = self.task_patterns[task_type]
+            scores = 0.6 * scores + 0.4 * np.array(
+                [task_scores.get(agent_name, 0.5) for agent_name in agent_names]
+            )
+        
+        # Adjust for context
+        if context:
+            context_key = self._extract_context_key(context)
+            if context_key in self.context_patterns:
+                context_scores = self.context_patterns[context_key]
+                scores = 0.7 * scores + 0.3 * np.array(
+                    [context_scores.get(agent_name, 0.5) for agent_name in agent_names]
+                )
+        
+        # Penalize high latency
+        scores *= latency_penalty
         
         # Return top-k agents
-        sorted_agents = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        return sorted_agents[:top_k]
+        return heapq.nlargest(top_k, zip(agent_names, scores.tolist()), key=itemgetter(1))
+    
+    def _refresh_score_params(self) -> None:
+        """Recompute cached scoring parameters for agents that changed."""
+        if self._score_params.keys() != self.agent_stats.keys():
+            # agent_stats is a defaultdict, so lookups can add agents too, and
+            # a full retrain clears it
+            for agent_name in self._score_params.keys() - self.agent_stats.keys():
+                del self._score_params[agent_name]
+            self._dirty.update(self.agent_stats.keys() - self._score_params.keys())
+        self._dirty &= self.agent_stats.keys()
+        
+        for agent_name in self._dirty:
+            stats = self.agent_stats[agent_name]
+            latency_penalty = 1.0
+            if stats['latencies']:
+                avg_latency = stats['latency_sum'] / len(stats['latencies'])
+                latency_penalty = 1.0 / (1.0 + avg_latency / 1000)  # Normalize
+            self._score_params[agent_name] = (
+                stats['successes'] + 1,  # Prior
+                stats['failures'] + 1,  # Prior
+                latency_penalty
+            )
+        self._dirty.clear()
     
     def get_success_rate(self, agent_name: str) -> float:
         """Get success rate for an agent."""
@@ -216,7 +301,7 @@ class AgentPerformanceModel:
         stats = self.agent_stats[agent_name]
         if not stats['latencies']:
             return 0.0
-        return float(np.mean(list(stats['latencies'])))
+        return stats['latency_sum'] / len(stats['latencies'])
     
     def _extract_context_key(self, context: Dict[str, Any]) -> str:
         """Extract a key from context for pattern matching."""
@@ -307,8 +392,10 @@ class RealTimeModelUpdater:
         # Event buffer
         self.event_buffer: deque = deque(maxlen=batch_size * 10)
         
-        # Consumer
+        # Consumer (polled from a single worker thread, off the event loop;
+        # the thread is created by start() and released by stop())
         self.consumer: Optional[KafkaConsumer] = None
+        self._poll_executor: Optional[ThreadPoolExecutor] = None
         self.running = False
         
         # Last save time
@@ -331,11 +418,13 @@ class RealTimeModelUpdater:
                 self.kafka_topic,
                 bootstrap_servers=self.kafka_servers,
                 group_id=self.consumer_group,
-                value_deserializer=lambda m: json.loads(m.decode('utf-8')),
                 auto_offset_reset='latest',
                 enable_auto_commit=True,
                 max_poll_records=self.batch_size
             )
+            self._poll_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="model-updater-poll"
+            )
             
             self.running = True
             logger.info("Model updater started successfully")
@@ -352,7 +441,11 @@ class RealTimeModelUpdater:
         self.running = False
         
         if self.consumer:
-            self.consumer.close()
+            # Queue the close behind any in-flight poll rather than racing
+            # it, and don't wait: stop() is called from the event loop
+            self._poll_executor.submit(self.consumer.close)
+            self._poll_executor.shutdown(wait=False)
+            self._poll_executor = None
             self.consumer = None
         
         # Save models before stopping
@@ -364,36 +457,35 @@ class RealTimeModelUpdater:
         """Main processing loop for consuming events and updating models."""
         logger.info("Starting model update processing loop")
         
-        batch = []
-        last_batch_time = datetime.utcnow()
+        batch: List[OutcomeEvent] = []
+        batch_deadline = 0.0
         
         while self.running:
             try:
-                # Poll for messages
-                messages = self.consumer.poll(timeout_ms=1000)
-                
-                for topic_partition, records in messages.items():
-                    for record in records:
-                        # Convert to OutcomeEvent
-                        event_data = record.value
-                        event = self._dict_to_outcome_event(event_data)
-                        
-                        # Add to batch
-                        batch.append(event)
-                        self.event_buffer.append(event)
-                
-                # Check if batch is ready
-                time_since_batch = (datetime.utcnow() - last_batch_time).total_seconds()
-                batch_ready = (
-                    len(batch) >= self.batch_size or
-                    (len(batch) > 0 and time_since_batch >= self.batch_timeout_seconds)
+                # Wait for at most the rest of the batch window (1s when the
+                # batch is empty, so stop() is still noticed promptly) and
+                # never ask for more records than the batch has room for
+                if batch:
+                    timeout = min(max(batch_deadline - time.monotonic(), 0.0), 1.0)
+                else:
+                    timeout = 1.0
+                events = await self._poll_events(
+                    timeout_ms=int(timeout * 1000),
+                    max_records=self.batch_size - len(batch)
                 )
                 
-                if batch_ready:
-                    # Process batch
+                if events:
+                    if not batch:
+                        batch_deadline = time.monotonic() + self.batch_timeout_seconds
+                    batch.extend(events)
+                    self.event_buffer.extend(events)
+                
+                # Process once the batch is full or its timeout has expired
+                if len(batch) >= self.batch_size or (
+                    batch and time.monotonic() >= batch_deadline
+                ):
                     await self._process_batch(batch)
                     batch = []
-                    last_batch_time = datetime.utcnow()
                 
                 # Auto-save check
                 if self.enable_auto_save:
@@ -402,15 +494,68 @@ class RealTimeModelUpdater:
                         self._save_models()
                         self.last_save_time = datetime.utcnow()
                 
-                # Small delay to prevent CPU spinning
-                await asyncio.sleep(0.1)
-                
             except Exception as e:
                 logger.error(f"Error in processing loop: {e}")
                 await asyncio.sleep(1)
         
         logger.info("Processing loop stopped")
     
+    async def _poll_events(self, timeout_ms: int, max_records: int) -> List[OutcomeEvent]:
+        """
+        Poll one batch of records from Kafka without blocking the event loop.
+        
+        Both the poll and the JSON decoding run on the poll thread.
+        
+        Args:
+            timeout_ms: Max time to block in consumer.poll
+            max_records: Max number of records to return
+            
+        Returns:
+            Decoded outcome events, in partition order
+        """
+        if not self.running:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._poll_executor,
+            functools.partial(
+                self._poll_and_decode,
+                timeout_ms=timeout_ms,
+                max_records=max_records
+            )
+        )
+    
+    def _poll_and_decode(self, timeout_ms: int, max_records: int) -> List[OutcomeEvent]:
+        """Blocking half of _poll_events; skips records that fail to decode."""
+        messages = self.consumer.poll(timeout_ms=timeout_ms, max_records=max_records)
+        
+        events = []
+        for records in messages.values():
+            for record in records:
+                try:
+                    events.append(self._decode_outcome_event(record.value))
+                except Exception as e:
+                    logger.warning(f"Skipping undecodable outcome event: {e}")
+        return events
+    
+    def _decode_outcome_event(self, raw: bytes) -> OutcomeEvent:
+        """
+        Decode a Kafka message value (OutcomeEvent JSON) into an OutcomeEvent.
+        
+        Parses with msgspec, orjson or json (fastest installed) followed by
+        _dict_to_outcome_event. Decoding to a plain dict keeps the field
+        typing as loose as the producers: agents may return any JSON value
+        as ``output``, not only the dict OutcomeEvent is annotated with.
+        """
+        if MSGSPEC_AVAILABLE:
+            data = msgspec.json.decode(raw)
+        elif ORJSON_AVAILABLE:
+            data = orjson.loads(raw)
+        else:
+            data = json.loads(raw)
+        return self._dict_to_outcome_event(data)
+    
     async def _process_batch(self, batch: List[OutcomeEvent]) -> None:
         """
         Process a batch of outcome events.
@@ -421,12 +566,21 @@ class RealTimeModelUpdater:
         start_time = datetime.utcnow()
         
         try:
+            # Agent updates only touch that agent's stats and pattern entries,
+            # so apply the batch one agent at a time (each agent's events in
+            # arrival order) and yield to the event loop between agents
+            agent_batches: Dict[str, List[OutcomeEvent]] = defaultdict(list)
+            for event in batch:
+                agent_batches[event.agent_name].append(event)
+            
             # Update each model with the batch
             for model_type, model in self.models.items():
                 if model_type == ModelType.AGENT_SELECTION:
                     # Update agent selection model
-                    for event in batch:
-                        model.update(event)
+                    for agent_events in agent_batches.values():
+                        for event in agent_events:
+                            model.update(event)
+                        await asyncio.sleep(0)
             
             # Update metrics
             self.metrics.total_updates += 1
@@ -468,10 +622,18 @@ class RealTimeModelUpdater:
     def _dict_to_outcome_event(self, data: Dict[str, Any]) -> OutcomeEvent:
         """Convert dictionary to OutcomeEvent."""
         # Convert status and severity strings back to enums
-        from core.feedback_pipeline import EventSeverity
-        
-        data['status'] = OutcomeStatus(data['status'])
-        data['severity'] = EventSeverity(data['severity'])
+        status = data['status']
+        data['status'] = _STATUS_BY_VALUE.get(status) or OutcomeStatus(status)
+        severity = data['severity']
+        data['severity'] = _SEVERITY_BY_VALUE.get(severity) or EventSeverity(severity)
+        
+        if 'timestamp_ns' not in data:
+            # Older producers only send the ISO timestamp (naive UTC); derive
+            # the event time from it instead of defaulting to decode time
+            event_time = datetime.fromisoformat(data['timestamp'])
+            if event_time.tzinfo is not None:
+                event_time = event_time.astimezone(timezone.utc).replace(tzinfo=None)
+            data['timestamp_ns'] = (event_time - _EPOCH) // _MICROSECOND * 1000
         
         return OutcomeEvent(**data)
     
@@ -646,7 +808,7 @@ class RealTimeModelUpdater:
             for model_type, model in self.models.items():
                 filepath = self.model_storage_path / f"{model_type.value}.pkl"
                 with open(filepath, 'wb') as f:
-                    pickle.dump(model, f)
+                    pickle.dump(model, f, protocol=5)
                 logger.debug(f"Saved model: {model_type.value}")
             
             # Save metrics
@@ -7,6 +7,7 @@ monitoring capabilities.
 """
 
 import time
+import logging
 import uuid
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -122,7 +123,8 @@ class MonitoredOrchestrator(Orchestrator):
                     metadata=metadata
                 )
             
-            logger.debug(f"Recorded metrics for run {run_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Recorded metrics for run {run_id}")
             
         except Exception as e:
             logger.error(f"Error recording run metrics: {e}", exc_info=True)
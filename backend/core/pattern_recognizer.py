@@ -17,6 +17,7 @@ from enum import Enum
 from collections import defaultdict, Counter
 import numpy as np
 import json
+import logging
 
 from utils.logging import get_logger
 
@@ -117,7 +118,8 @@ class PatternRecognizer:
         if len(self.event_history) > self.max_history_size:
             self.event_history = self.event_history[-self.max_history_size:]
         
-        logger.debug(f"Added event: {event_type} at {timestamp}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Added event: {event_type} at {timestamp}")
     
     def analyze_patterns(self) -> List[Pattern]:
         """
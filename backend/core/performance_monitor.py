@@ -2,16 +2,21 @@
 Enhanced Performance Monitor with Semantic Memory for Pattern Learning
 """
 
-from typing import Dict, Any, Optional, List, Tuple
-from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, List, Tuple, Union
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, asdict, field
 from enum import Enum
+import sys
 import json
+import logging
 import time
 import statistics
 from collections import defaultdict, deque
 from threading import Lock, Thread
 import asyncio
+from functools import partial
+from operator import attrgetter
+import numpy as np
 
 # Kafka integration (optional dependency)
 try:
@@ -23,6 +28,14 @@ except ImportError:
     KafkaProducer = None
     KafkaError = Exception
 
+# Numba JIT (optional dependency)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
 from utils.logging import get_logger
 from database import get_session
 from database.models import (
@@ -34,6 +47,90 @@ from enhanced_memory import SemanticMemory
 logger = get_logger(__name__)
 
 
+def _acc_numeric(predicted: float, actual: float) -> float:
+    """Relative-error accuracy between two numbers, clamped to [0, 1]."""
+    if actual == 0.0:
+        return 0.0 if predicted != 0.0 else 1.0
+    error = abs(predicted - actual) / abs(actual)
+    return max(0.0, 1.0 - error)
+
+
+if NUMBA_AVAILABLE:
+    _acc_numeric_njit = njit(cache=True)(_acc_numeric)
+    # Compile at import so the first recorded measurement doesn't pay for it
+    _acc_numeric_njit(1.0, 1.0)
+else:
+    _acc_numeric_njit = _acc_numeric
+
+
+# Columnar layout of the agent-run metrics buffer: one NumPy array per field,
+# indexed by ring-buffer slot.
+_METRIC_COLUMNS = (
+    ("timestamp_ns", np.int64),
+    ("duration_ms", np.float64),
+    ("tokens_used", np.int64),
+    ("cost", np.float64),
+    ("memory_mb", np.float64),
+    ("cpu_ms", np.float64),
+    ("quality_score", np.float64),  # NaN when not reported
+    ("confidence", np.float64),  # NaN when not reported
+    ("status_code", np.uint8),
+    ("agent_id", np.int32),
+    ("timed_out", np.bool_),
+    ("retried", np.bool_),
+)
+
+# Status strings stored as small ints in the "status_code" column (0 = other)
+_STATUS_CODES = {"success": 1, "failure": 2, "partial": 3}
+
+# Set-bit count for every byte value, for popcounts over the success bitmap
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+_EPOCH = datetime(1970, 1, 1)
+_NS_PER_HOUR = 3600 * 10**9
+_MICROSECOND = timedelta(microseconds=1)
+
+# Most recent runs kept per agent in _agent_metrics
+_AGENT_HISTORY_SIZE = 1000
+
+# Staged runs at which record_agent_run drains the staging queue itself
+_STAGING_DRAIN_SIZE = 256
+
+
+def _iso_to_ns(timestamp: str) -> int:
+    """Convert an ISO timestamp (naive values are UTC) to epoch nanoseconds."""
+    dt = datetime.fromisoformat(timestamp)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return (dt - _EPOCH) // _MICROSECOND * 1000
+
+
+# PerformanceMetrics fields read by the health score and recommendations,
+# fetched in a single call
+_SCORE_FIELDS = attrgetter(
+    "total_tasks", "success_rate", "avg_latency_ms", "error_rate", "avg_accuracy"
+)
+_RECOMMENDATION_FIELDS = attrgetter(
+    "total_tasks", "success_rate", "avg_latency_ms", "error_rate",
+    "avg_accuracy", "total_cost"
+)
+
+
+def _health_score(metrics: "PerformanceMetrics") -> float:
+    """Weighted 0-100 health score: success 40, latency 30, errors 20, accuracy 10."""
+    total_tasks, success_rate, avg_latency_ms, error_rate, avg_accuracy = _SCORE_FIELDS(metrics)
+    if total_tasks == 0:
+        return 100.0
+    
+    score = (
+        success_rate * 40
+        + max(0, 30 - (avg_latency_ms / 1000) * 3)
+        + max(0, 20 - error_rate * 100)
+        + (avg_accuracy * 10 if avg_accuracy > 0 else 10)
+    )
+    return min(100.0, max(0.0, score))
+
+
 class MetricType(str, Enum):
     """Types of metrics tracked."""
     SUCCESS_RATE = "success_rate"
@@ -116,9 +213,9 @@ class AgentPerformance:
     efficiency_score: float = 0.0  # Speed vs quality balance
     
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PerformanceAlert:
-    """Alert for performance issues."""
+    """Alert for performance issues. Immutable, so readers can share instances."""
     alert_id: str
     level: AlertLevel
     metric_type: MetricType
@@ -143,6 +240,7 @@ class AccuracyMeasurement:
     timestamp: str
     feedback_source: str  # "user", "automated", "system"
     metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp_ns: int = field(default_factory=time.time_ns)  # Epoch ns of `timestamp`
 
 
 class PerformanceMonitor:
@@ -160,7 +258,8 @@ class PerformanceMonitor:
         model_updater = None,
         db_session_factory=None,
         kafka_servers: Optional[str] = None,
-        kafka_topic: str = "agent-outcomes"
+        kafka_topic: str = "agent-outcomes",
+        metrics_buffer_size: int = 10000
     ):
         """
         Initialize Enhanced Performance Monitor.
@@ -215,12 +314,41 @@ class PerformanceMonitor:
         if alert_thresholds:
             self.alert_thresholds.update(alert_thresholds)
         
-        # In-memory metric storage
+        # In-memory metric storage. Agent runs go into a fixed-size ring of
+        # NumPy columns (see _METRIC_COLUMNS) so window aggregates are
+        # vectorized; the event dicts are kept in a parallel slot list.
         self._lock = Lock()
-        self._metrics_buffer: deque = deque(maxlen=10000)
-        self._agent_metrics: Dict[str, List[Dict]] = defaultdict(list)
+        self._buffer_capacity = metrics_buffer_size
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(metrics_buffer_size, dtype=dtype)
+            for name, dtype in _METRIC_COLUMNS
+        }
+        self._event_buffer: List[Optional[Dict]] = [None] * metrics_buffer_size
+        # Bit ``slot`` (little-endian within each byte) is set iff that slot
+        # holds a successful run, so success counts are byte popcounts
+        self._success_bits = np.zeros((metrics_buffer_size + 7) // 8, dtype=np.uint8)
+        self._agent_id_map: Dict[str, int] = {}
+        self._write_index = 0
+        self._buffer_count = 0
+        # True while timestamps are non-decreasing in slot order, which lets
+        # window queries binary-search the cutoff instead of scanning
+        self._buffer_sorted = True
+        # Running sums/counts over every buffered run (see _column_totals),
+        # maintained on append so whole-buffer windows skip the reductions
+        self._totals: Dict[str, Any] = self._column_totals(slice(0, 0))
+        # run_id -> slot of its newest buffered run, so accuracy for a window
+        # is matched per measurement instead of per buffered run
+        self._run_slots: Dict[str, int] = {}
+        # Bounded per-agent run histories; the deque drops the oldest run in O(1)
+        self._agent_metrics: Dict[str, deque] = defaultdict(
+            partial(deque, maxlen=_AGENT_HISTORY_SIZE)
+        )
         self._accuracy_measurements: deque = deque(maxlen=1000)
         self._alerts: deque = deque(maxlen=100)
+        # Runs recorded but not yet applied to the buffers. Producers only
+        # append (atomic under the GIL), so record_agent_run never blocks on
+        # _lock; readers drain it in arrival order before reading
+        self._staging: deque = deque()
         
         # Running statistics
         self._running_stats: Dict[str, Any] = defaultdict(dict)
@@ -284,7 +412,11 @@ class PerformanceMonitor:
         try:
             # Get recent agent runs
             with self._lock:
-                recent_runs = list(self._metrics_buffer)[-100:]  # Last 100 runs
+                self._drain_staging()
+                recent_runs = [
+                    self._event_buffer[slot]
+                    for slot in self._buffer_slots()[-100:]  # Last 100 runs
+                ]
             
             for run in recent_runs:
                 agent_type = run.get('agent_type', 'unknown')
@@ -298,18 +430,13 @@ class PerformanceMonitor:
                     status == 'success'
                 )
                 
-                # Learn time-based patterns (hour of day)
-                timestamp = run.get('timestamp', '')
-                if timestamp:
-                    try:
-                        hour = datetime.fromisoformat(timestamp).hour
-                        self.semantic_memory.record_pattern(
-                            f"hour_{hour}",
-                            agent_type,
-                            status == 'success'
-                        )
-                    except:
-                        pass
+                # Learn time-based patterns (hour of day, UTC)
+                hour = run['timestamp_ns'] // _NS_PER_HOUR % 24
+                self.semantic_memory.record_pattern(
+                    f"hour_{hour}",
+                    agent_type,
+                    status == 'success'
+                )
                         
         except Exception as e:
             logger.error(f"Error learning performance patterns: {e}", exc_info=True)
@@ -333,8 +460,18 @@ class PerformanceMonitor:
         """
         Record an agent run event with enhanced pattern learning.
         """
+        # These come from a small vocabulary and key the per-agent metrics,
+        # the agent id map and semantic memory; interning them makes those
+        # lookups identity-cheap and shares one copy across buffered events
+        agent_name = sys.intern(agent_name)
+        agent_type = sys.intern(agent_type)
+        status = sys.intern(status)
+        if error_type is not None:
+            error_type = sys.intern(error_type)
+        
         event = {
             "timestamp": datetime.utcnow().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "run_id": run_id,
             "agent_name": agent_name,
             "agent_type": agent_type,
@@ -350,12 +487,13 @@ class PerformanceMonitor:
             "metadata": metadata or {}
         }
         
-        with self._lock:
-            self._metrics_buffer.append(event)
-            self._agent_metrics[agent_name].append(event)
-            
-            if len(self._agent_metrics[agent_name]) > 1000:
-                self._agent_metrics[agent_name] = self._agent_metrics[agent_name][-1000:]
+        staging = self._staging
+        staging.append(event)
+        if len(staging) >= _STAGING_DRAIN_SIZE and self._lock.acquire(blocking=False):
+            try:
+                self._drain_staging()
+            finally:
+                self._lock.release()
         
         # ENHANCED: Learn agent-task patterns in semantic memory
         task_type = metadata.get('task_type', 'general') if metadata else 'general'
@@ -369,7 +507,8 @@ class PerformanceMonitor:
         if self.producer:
             try:
                 self.producer.send(self.kafka_topic, value=event)
-                logger.debug(f"📤 Produced event to Kafka topic '{self.kafka_topic}': {agent_name} ({status})")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"📤 Produced event to Kafka topic '{self.kafka_topic}': {agent_name} ({status})")
             except Exception as e:
                 logger.error(f"❌ Failed to produce performance event to Kafka: {e}")
         
@@ -377,7 +516,204 @@ class PerformanceMonitor:
         if self.enable_auto_alerts:
             self._check_event_alerts(event)
         
-        logger.debug(f"Recorded performance event for {agent_name}: {status}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Recorded performance event for {agent_name}: {status}")
+    
+    def _flush_staging(self):
+        """Apply staged runs to the buffers now."""
+        with self._lock:
+            self._drain_staging()
+    
+    def _drain_staging(self):
+        """Apply staged runs to the buffers. Caller must hold self._lock."""
+        staging = self._staging
+        agent_metrics = self._agent_metrics
+        # Only the lock holder pops, so every counted item is there to pop
+        for _ in range(len(staging)):
+            event = staging.popleft()
+            self._append_raw(event)
+            agent_metrics[event["agent_name"]].append(event)
+    
+    def _append_raw(self, event: Dict):
+        """
+        Write an agent run event into the next slot of the metrics buffer.
+        
+        The caller must hold ``self._lock``. Events without a
+        ``timestamp_ns`` get one parsed from their ISO ``timestamp``.
+        """
+        timestamp_ns = event.get("timestamp_ns")
+        if timestamp_ns is None:
+            timestamp_ns = event["timestamp_ns"] = _iso_to_ns(event["timestamp"])
+        
+        agent_name = event["agent_name"]
+        agent_id = self._agent_id_map.get(agent_name)
+        if agent_id is None:
+            agent_id = self._agent_id_map[agent_name] = len(self._agent_id_map)
+        
+        quality_score = event.get("quality_score")
+        confidence = event.get("confidence")
+        metadata = event.get("metadata") or {}
+        
+        slot = self._write_index
+        columns = self._columns
+        if self._buffer_count and timestamp_ns < columns["timestamp_ns"][slot - 1]:
+            self._buffer_sorted = False
+        if self._buffer_count == self._buffer_capacity:
+            self._accumulate_totals(slot, -1)  # Run being overwritten
+            evicted_run_id = self._event_buffer[slot]["run_id"]
+            if self._run_slots.get(evicted_run_id) == slot:
+                del self._run_slots[evicted_run_id]
+        columns["timestamp_ns"][slot] = timestamp_ns
+        columns["duration_ms"][slot] = event["duration_ms"]
+        columns["tokens_used"][slot] = event.get("tokens_used") or 0
+        columns["cost"][slot] = event.get("cost") or 0.0
+        columns["memory_mb"][slot] = event.get("memory_mb") or 0.0
+        columns["cpu_ms"][slot] = event.get("cpu_ms") or 0.0
+        columns["quality_score"][slot] = np.nan if quality_score is None else quality_score
+        columns["confidence"][slot] = np.nan if confidence is None else confidence
+        columns["status_code"][slot] = _STATUS_CODES.get(event["status"], 0)
+        if event["status"] == "success":
+            self._success_bits[slot >> 3] |= 1 << (slot & 7)
+        else:
+            self._success_bits[slot >> 3] &= 0xFF ^ (1 << (slot & 7))
+        columns["agent_id"][slot] = agent_id
+        columns["timed_out"][slot] = event.get("error_type") == "timeout"
+        columns["retried"][slot] = metadata.get("retry_count", 0) > 0
+        self._event_buffer[slot] = event
+        self._run_slots[event["run_id"]] = slot
+        self._accumulate_totals(slot, 1)
+        
+        self._write_index = (slot + 1) % self._buffer_capacity
+        if self._buffer_count < self._buffer_capacity:
+            self._buffer_count += 1
+    
+    def _accumulate_totals(self, slot: int, sign: int):
+        """Add (sign=1) or remove (sign=-1) one slot from _totals. Caller holds the lock."""
+        columns = self._columns
+        totals = self._totals
+        
+        totals["count"] += sign
+        totals["status_counts"][columns["status_code"][slot]] += sign
+        totals["duration_ms"] += sign * float(columns["duration_ms"][slot])
+        totals["tokens_used"] += sign * int(columns["tokens_used"][slot])
+        totals["cost"] += sign * float(columns["cost"][slot])
+        totals["timed_out"] += sign * bool(columns["timed_out"][slot])
+        totals["retried"] += sign * bool(columns["retried"][slot])
+        
+        # Zero memory/cpu and NaN quality/confidence mean "not reported"
+        for name in ("memory_mb", "cpu_ms"):
+            value = float(columns[name][slot])
+            if value:
+                totals[name] += sign * value
+                totals[f"{name}_count"] += sign
+        for name in ("quality_score", "confidence"):
+            value = float(columns[name][slot])
+            if value == value:
+                totals[name] += sign * value
+                totals[f"{name}_count"] += sign
+    
+    def _column_totals(self, slots: Union[slice, np.ndarray]) -> Dict[str, Any]:
+        """
+        Sums and counts over the given slots, one read per column.
+        
+        Zero memory/cpu and NaN quality/confidence are "not reported" and
+        are left out of the corresponding ``*_count``. Caller holds the lock.
+        """
+        columns = self._columns
+        memory = columns["memory_mb"][slots]
+        cpu = columns["cpu_ms"][slots]
+        quality = columns["quality_score"][slots]
+        confidence = columns["confidence"][slots]
+        
+        status_counts = np.bincount(
+            columns["status_code"][slots], minlength=len(_STATUS_CODES) + 1
+        )
+        
+        return {
+            "count": int(status_counts.sum()),
+            "status_counts": status_counts.tolist(),
+            "duration_ms": float(columns["duration_ms"][slots].sum()),
+            "tokens_used": int(columns["tokens_used"][slots].sum()),
+            "cost": float(columns["cost"][slots].sum()),
+            "memory_mb": float(memory.sum()),
+            "memory_mb_count": int(np.count_nonzero(memory)),
+            "cpu_ms": float(cpu.sum()),
+            "cpu_ms_count": int(np.count_nonzero(cpu)),
+            "quality_score": float(np.nansum(quality)),
+            "quality_score_count": int(quality.size - np.count_nonzero(np.isnan(quality))),
+            "confidence": float(np.nansum(confidence)),
+            "confidence_count": int(confidence.size - np.count_nonzero(np.isnan(confidence))),
+            "timed_out": int(np.count_nonzero(columns["timed_out"][slots])),
+            "retried": int(np.count_nonzero(columns["retried"][slots])),
+        }
+    
+    def _buffer_slots(self) -> np.ndarray:
+        """Occupied metrics buffer slots, oldest first. Caller holds the lock."""
+        return np.arange(
+            self._write_index - self._buffer_count, self._write_index
+        ) % self._buffer_capacity
+    
+    def _window_slots(self, cutoff_ns: int) -> Union[slice, np.ndarray]:
+        """
+        Occupied slots with ``timestamp_ns >= cutoff_ns``, oldest first.
+        
+        While the buffer is time-ordered the cutoff is found with
+        np.searchsorted on each contiguous segment of the ring, so only the
+        returned slots are touched; a window that does not wrap comes back
+        as a slice, so indexing columns with it is a view rather than a copy.
+        Falls back to a full mask otherwise. Caller holds the lock.
+        """
+        segments = self._window_segments(cutoff_ns)
+        if segments is None:
+            slots = self._buffer_slots()
+            return slots[self._columns["timestamp_ns"][slots] >= cutoff_ns]
+        
+        if not segments:
+            return slice(0, 0)
+        if len(segments) == 1:
+            return slice(*segments[0])
+        return np.concatenate([np.arange(lo, hi) for lo, hi in segments])
+    
+    def _window_segments(self, cutoff_ns: int) -> Optional[List[Tuple[int, int]]]:
+        """
+        Contiguous ``[lo, hi)`` slot ranges of the window, oldest first.
+        
+        Returns None when the buffer is not time-ordered. Caller holds the lock.
+        """
+        if not self._buffer_sorted:
+            return None
+        
+        timestamps = self._columns["timestamp_ns"]
+        end = self._write_index
+        start = end - self._buffer_count
+        if start >= 0:
+            segments = [(start, end)]
+        else:
+            segments = [(start + self._buffer_capacity, self._buffer_capacity), (0, end)]
+        
+        for i, (lo, hi) in enumerate(segments):
+            first = lo + int(np.searchsorted(timestamps[lo:hi], cutoff_ns, side="left"))
+            if first < hi:
+                return [(first, hi)] + segments[i + 1:]
+        return []
+    
+    def _count_successes(self, lo: int, hi: int) -> int:
+        """Popcount of the success bitmap over slots ``[lo, hi)``. Caller holds the lock."""
+        if lo >= hi:
+            return 0
+        
+        first_byte, last_byte = lo >> 3, (hi - 1) >> 3
+        chunk = self._success_bits[first_byte:last_byte + 1].copy()
+        # Mask off the bits of slots outside the range in the edge bytes
+        chunk[0] &= (0xFF << (lo & 7)) & 0xFF
+        chunk[-1] &= 0xFF >> (7 - ((hi - 1) & 7))
+        return int(_POPCOUNT[chunk].sum(dtype=np.int64))
+    
+    def _slot_events(self, slots: Union[slice, np.ndarray]) -> List[Dict]:
+        """Event dicts for the given slots, in order. Caller holds the lock."""
+        if isinstance(slots, slice):
+            return self._event_buffer[slots]
+        return [self._event_buffer[slot] for slot in slots]
     
     def get_optimal_agent_for_task(self, task_type: str) -> Optional[str]:
         """
@@ -392,6 +728,7 @@ class PerformanceMonitor:
         if task_type == "all":
             # Calculate overall success rate
             with self._lock:
+                self._drain_staging()
                 agent_runs = self._agent_metrics.get(agent_name, [])
                 if not agent_runs:
                     return 0.0
@@ -454,10 +791,7 @@ class PerformanceMonitor:
                 return 1.0
             
             if isinstance(predicted, (int, float)) and isinstance(actual, (int, float)):
-                if actual == 0:
-                    return 0.0 if predicted != 0 else 1.0
-                error = abs(predicted - actual) / abs(actual)
-                return max(0.0, 1.0 - error)
+                return _acc_numeric_njit(float(predicted), float(actual))
             
             if isinstance(predicted, str) and isinstance(actual, str):
                 pred_words = set(predicted.lower().split())
@@ -500,15 +834,62 @@ class PerformanceMonitor:
     ) -> PerformanceMetrics:
         """Get system-wide performance metrics."""
         window = time_window_minutes or self.window_size_minutes
-        cutoff_time = datetime.utcnow() - timedelta(minutes=window)
+        cutoff_ns = time.time_ns() - window * 60 * 10**9
         
         with self._lock:
-            events = [
-                e for e in self._metrics_buffer
-                if datetime.fromisoformat(e["timestamp"]) >= cutoff_time
-            ]
+            self._drain_staging()
+            slots = self._window_slots(cutoff_ns)
+            if isinstance(slots, slice):
+                count = slots.stop - slots.start
+            else:
+                count = len(slots)
+            if count == self._buffer_count:
+                totals = self._totals  # Window covers the whole buffer
+            else:
+                totals = self._column_totals(slots)
+            metrics = self._calculate_columnar_metrics(slots, totals)
+            accuracy_values = self._window_accuracy(cutoff_ns) if count else []
+        
+        if accuracy_values:
+            metrics.avg_accuracy = statistics.mean(accuracy_values)
+        
+        return metrics
+    
+    def get_success_rate(self, time_window_minutes: Optional[int] = None) -> float:
+        """
+        System-wide success rate over a time window.
+        
+        Cheaper than get_system_metrics().success_rate: on a time-ordered
+        buffer it only popcounts the success bitmap for the window.
         
-        return self._calculate_metrics(events)
+        Args:
+            time_window_minutes: Window size (defaults to window_size_minutes)
+            
+        Returns:
+            Fraction of successful runs in the window (0.0 when empty)
+        """
+        window = time_window_minutes or self.window_size_minutes
+        cutoff_ns = time.time_ns() - window * 60 * 10**9
+        
+        with self._lock:
+            self._drain_staging()
+            segments = self._window_segments(cutoff_ns)
+            if segments is None:
+                slots = self._window_slots(cutoff_ns)
+                status_codes = self._columns["status_code"][slots]
+                total = status_codes.size
+                successful = int(np.count_nonzero(status_codes == _STATUS_CODES["success"]))
+            else:
+                total = sum(hi - lo for lo, hi in segments)
+                successful = sum(self._count_successes(lo, hi) for lo, hi in segments)
+        
+        return successful / total if total else 0.0
+    
+    def get_agent_names(self) -> List[str]:
+        """Names of every agent with recorded runs, including staged ones."""
+        with self._lock:
+            self._drain_staging()
+            return list(self._agent_metrics.keys())
     
     def get_agent_metrics(
         self,
@@ -517,9 +898,10 @@ class PerformanceMonitor:
     ) -> AgentPerformance:
         """Get performance metrics for a specific agent."""
         window = time_window_minutes or self.window_size_minutes
-        cutoff_time = datetime.utcnow() - timedelta(minutes=window)
+        cutoff_ns = time.time_ns() - window * 60 * 10**9
         
         with self._lock:
+            self._drain_staging()
             if agent_name not in self._agent_metrics:
                 return AgentPerformance(
                     agent_name=agent_name,
@@ -529,7 +911,7 @@ class PerformanceMonitor:
             
             events = [
                 e for e in self._agent_metrics[agent_name]
-                if datetime.fromisoformat(e["timestamp"]) >= cutoff_time
+                if e["timestamp_ns"] >= cutoff_ns
             ]
         
         if not events:
@@ -620,6 +1002,93 @@ class PerformanceMonitor:
             sample_size=total
         )
     
+    def _calculate_columnar_metrics(
+        self,
+        slots: Union[slice, np.ndarray],
+        totals: Dict[str, Any]
+    ) -> PerformanceMetrics:
+        """
+        Vectorized equivalent of _calculate_metrics over buffer columns.
+        
+        Sums and counts come from ``totals`` and the window bounds from its
+        first and last slot; only the latency percentiles read a column, via
+        one partial partition. avg_accuracy is left to the caller. Caller
+        holds the lock.
+        
+        Args:
+            slots: Buffer slots in the window, oldest first
+            totals: _column_totals for the same slots
+        """
+        total = totals["count"]
+        if total == 0:
+            return PerformanceMetrics()
+        
+        if isinstance(slots, slice):
+            first, last = slots.start, slots.stop - 1
+        else:
+            first, last = int(slots[0]), int(slots[-1])
+        
+        status_counts = totals["status_counts"]
+        successful = status_counts[_STATUS_CODES["success"]]
+        failed = status_counts[_STATUS_CODES["failure"]]
+        partial = status_counts[_STATUS_CODES["partial"]]
+        
+        latencies = self._columns["duration_ms"][slots]
+        ranks = [total // 2, int(total * 0.95), int(total * 0.99), total - 1]
+        p50, p95, p99, max_latency = np.partition(latencies, ranks)[ranks].tolist()
+        
+        def average(name: str) -> float:
+            count = totals[f"{name}_count"]
+            return totals[name] / count if count else 0.0
+        
+        return PerformanceMetrics(
+            total_tasks=total,
+            successful_tasks=successful,
+            failed_tasks=failed,
+            partial_tasks=partial,
+            success_rate=successful / total,
+            
+            avg_latency_ms=totals["duration_ms"] / total,
+            p50_latency_ms=p50,
+            p95_latency_ms=p95,
+            p99_latency_ms=p99,
+            max_latency_ms=max_latency,
+            
+            total_tokens=totals["tokens_used"],
+            total_api_calls=total,
+            total_cost=totals["cost"],
+            avg_memory_mb=average("memory_mb"),
+            avg_cpu_ms=average("cpu_ms"),
+            
+            avg_quality_score=average("quality_score"),
+            avg_confidence=average("confidence"),
+            
+            error_rate=failed / total,
+            timeout_rate=totals["timed_out"] / total,
+            retry_rate=totals["retried"] / total,
+            
+            window_start=self._event_buffer[first]["timestamp"],
+            window_end=self._event_buffer[last]["timestamp"],
+            sample_size=total
+        )
+    
+    def _window_accuracy(self, cutoff_ns: int) -> List[float]:
+        """
+        Accuracy scores for buffered runs with ``timestamp_ns >= cutoff_ns``.
+        
+        Walks the bounded measurement history and looks each task up in
+        _run_slots, so the cost does not grow with the window. Caller holds
+        the lock.
+        """
+        timestamps = self._columns["timestamp_ns"]
+        run_slots = self._run_slots
+        accuracies = []
+        for measurement in self._accuracy_measurements:
+            slot = run_slots.get(measurement["task_id"])
+            if slot is not None and timestamps[slot] >= cutoff_ns:
+                accuracies.append(measurement["accuracy_score"])
+        return accuracies
+    
     def _get_accuracy_for_events(self, events: List[Dict]) -> List[float]:
         """Get accuracy measurements matching the given events."""
         with self._lock:
@@ -893,9 +1362,7 @@ class PerformanceMonitor:
         }
         
         if include_agents:
-            with self._lock:
-                agent_names = list(self._agent_metrics.keys())
-            
+            agent_names = self.get_agent_names()
             report["agent_metrics"] = {
                 agent_name: asdict(self.get_agent_metrics(agent_name, time_window_minutes))
                 for agent_name in agent_names
@@ -910,58 +1377,54 @@ class PerformanceMonitor:
     
     def _calculate_health_score(self, metrics: PerformanceMetrics) -> float:
         """Calculate overall system health score (0-100)."""
-        if metrics.total_tasks == 0:
-            return 100.0
-        
-        success_score = metrics.success_rate * 40
-        latency_score = max(0, 30 - (metrics.avg_latency_ms / 1000) * 3)
-        error_score = max(0, 20 - (metrics.error_rate * 100))
-        accuracy_score = metrics.avg_accuracy * 10 if metrics.avg_accuracy > 0 else 10
-        
-        health_score = success_score + latency_score + error_score + accuracy_score
-        
-        return min(100.0, max(0.0, health_score))
+        return _health_score(metrics)
     
     def _generate_recommendations(self, metrics: PerformanceMetrics) -> List[str]:
         """Generate actionable recommendations based on metrics."""
         recommendations = []
+        (
+            total_tasks, success_rate, avg_latency_ms,
+            error_rate, avg_accuracy, total_cost
+        ) = _RECOMMENDATION_FIELDS(metrics)
         
-        if metrics.success_rate < 0.90:
+        if success_rate < 0.90:
             recommendations.append(
-                f"Success rate is {metrics.success_rate:.1%}. "
+                f"Success rate is {success_rate:.1%}. "
                 "Review failure logs and consider adjusting agent prompts or retry strategies."
             )
         
-        if metrics.avg_latency_ms > 3000:
+        if avg_latency_ms > 3000:
             recommendations.append(
-                f"Average latency is {metrics.avg_latency_ms:.0f}ms. "
+                f"Average latency is {avg_latency_ms:.0f}ms. "
                 "Consider using faster LLM models or implementing caching."
             )
         
-        if metrics.total_tasks > 0:
-            cost_per_task = metrics.total_cost / metrics.total_tasks
+        if total_tasks > 0:
+            cost_per_task = total_cost / total_tasks
             if cost_per_task > 0.50:
                 recommendations.append(
                     f"Cost per task is ${cost_per_task:.2f}. "
                     "Optimize prompts, reduce token usage, or switch to cheaper models."
                 )
         
-        if metrics.avg_accuracy > 0 and metrics.avg_accuracy < 0.75:
+        if 0 < avg_accuracy < 0.75:
             recommendations.append(
-                f"Accuracy is {metrics.avg_accuracy:.1%}. "
+                f"Accuracy is {avg_accuracy:.1%}. "
                 "Consider retraining models with recent feedback data."
             )
         
-        if metrics.error_rate > 0.10:
+        if error_rate > 0.10:
             recommendations.append(
-                f"Error rate is {metrics.error_rate:.1%}. "
+                f"Error rate is {error_rate:.1%}. "
                 "Implement better error handling and increase retry limits."
             )
         
         # ENHANCED: Add recommendations based on learned patterns
         if hasattr(self, 'semantic_memory'):
+            # Iterate a drained snapshot: the success-rate lookups drain
+            # again and may add agents recorded since
             low_success_agents = [
-                agent for agent in self._agent_metrics.keys()
+                agent for agent in self.get_agent_names()
                 if self.get_agent_success_rate(agent) < 0.7
             ]
             if low_success_agents:
@@ -1025,30 +1488,55 @@ class PerformanceMonitor:
     def _cleanup_old_data(self):
         """Clean up old data to prevent memory bloat."""
         try:
-            cutoff_time = datetime.utcnow() - timedelta(hours=24)
+            cutoff_ns = time.time_ns() - 24 * _NS_PER_HOUR
             
             with self._lock:
-                self._metrics_buffer = deque(
-                    [e for e in self._metrics_buffer
-                     if datetime.fromisoformat(e["timestamp"]) >= cutoff_time],
-                    maxlen=10000
-                )
+                self._drain_staging()
+                self._compact_buffer(self._window_slots(cutoff_ns))
                 
                 for agent_name in list(self._agent_metrics.keys()):
-                    self._agent_metrics[agent_name] = [
-                        e for e in self._agent_metrics[agent_name]
-                        if datetime.fromisoformat(e["timestamp"]) >= cutoff_time
-                    ]
+                    self._agent_metrics[agent_name] = deque(
+                        [e for e in self._agent_metrics[agent_name]
+                         if e["timestamp_ns"] >= cutoff_ns],
+                        maxlen=_AGENT_HISTORY_SIZE
+                    )
                 
                 self._accuracy_measurements = deque(
                     [m for m in self._accuracy_measurements
-                     if datetime.fromisoformat(m["timestamp"]) >= cutoff_time],
+                     if m["timestamp_ns"] >= cutoff_ns],
                     maxlen=1000
                 )
         
         except Exception as e:
             logger.error(f"Error cleaning up old data: {e}", exc_info=True)
     
+    def _compact_buffer(self, kept_slots: Union[slice, np.ndarray]):
+        """
+        Move the given slots (oldest first) to the front of the metrics buffer
+        and drop everything else. Caller holds the lock.
+        """
+        events = self._slot_events(kept_slots)
+        kept = len(events)
+        for column in self._columns.values():
+            column[:kept] = column[kept_slots]
+        
+        self._event_buffer[:kept] = events
+        self._event_buffer[kept:] = [None] * (self._buffer_capacity - kept)
+        self._run_slots = {event["run_id"]: slot for slot, event in enumerate(events)}
+        
+        self._totals = self._column_totals(slice(0, kept))
+        
+        successes = self._columns["status_code"][:kept] == _STATUS_CODES["success"]
+        self._success_bits[:] = 0
+        packed = np.packbits(successes, bitorder="little")
+        self._success_bits[:packed.size] = packed
+        
+        self._write_index = kept % self._buffer_capacity
+        self._buffer_count = kept
+        self._buffer_sorted = bool(
+            np.all(np.diff(self._columns["timestamp_ns"][:kept]) >= 0)
+        )
+    
     def trigger_retraining(
         self,
         reason: str = "Manual trigger from PerformanceMonitor",
@@ -1085,8 +1573,9 @@ class PerformanceMonitor:
     def get_stats(self) -> Dict[str, Any]:
         """Get monitor statistics."""
         with self._lock:
+            self._drain_staging()
             return {
-                "events_buffered": len(self._metrics_buffer),
+                "events_buffered": self._buffer_count,
                 "agents_tracked": len(self._agent_metrics),
                 "accuracy_measurements": len(self._accuracy_measurements),
                 "active_alerts": len(self._alerts),
@@ -5,9 +5,10 @@ Defines the contract that all plugins must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Union
 from enum import Enum
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,49 @@ class PluginPermission(Enum):
     AGENT_CONTROL = "agent_control"
 
 
+# Bit index per permission value, so permission sets can be held as ints.
+# Names outside PluginPermission (custom permissions) get a bit on first use.
+_PERMISSION_BITS: Dict[str, int] = {
+    permission.value: 1 << index
+    for index, permission in enumerate(PluginPermission)
+}
+_PERMISSION_BITS_LOCK = threading.Lock()
+
+
+def perm_mask(permissions: Iterable[Union[str, PluginPermission]]) -> int:
+    """
+    Convert permission names to a bitmask.
+    
+    Args:
+        permissions: Permission value strings or PluginPermission members
+        
+    Returns:
+        Integer with one bit set per distinct permission
+    """
+    mask = 0
+    for permission in permissions:
+        name = permission.value if isinstance(permission, PluginPermission) else permission
+        bit = _PERMISSION_BITS.get(name)
+        if bit is None:
+            with _PERMISSION_BITS_LOCK:
+                bit = _PERMISSION_BITS.setdefault(name, 1 << len(_PERMISSION_BITS))
+        mask |= bit
+    return mask
+
+
+def perm_names(mask: int) -> List[str]:
+    """
+    Convert a permission bitmask back to permission names.
+    
+    Args:
+        mask: Bitmask produced by perm_mask
+        
+    Returns:
+        Names of the permissions whose bits are set
+    """
+    return [name for name, bit in _PERMISSION_BITS.items() if mask & bit]
+
+
 class PluginMetadata:
     """Plugin metadata container"""
     
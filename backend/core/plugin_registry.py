@@ -16,6 +16,10 @@ from .plugin_security import PluginSignature, PluginValidator
 
 logger = logging.getLogger(__name__)
 
+# Journal lines replayed on load before the registry file is rewritten;
+# compaction also waits until the journal outgrows the registry itself
+_JOURNAL_COMPACT_MIN = 256
+
 
 class PluginRegistryEntry:
     """Represents a plugin entry in the registry"""
@@ -107,6 +111,10 @@ class PluginRegistry:
         """
         self.registry_dir = Path(registry_dir or './plugin_registry')
         self.registry_file = self.registry_dir / registry_file
+        # Append-only log of changed entries since the registry file was
+        # last written, one JSON entry per line; later lines win on load
+        self.journal_file = self.registry_file.with_suffix('.jsonl')
+        self._journal_lines = 0
         self.plugins: Dict[str, Dict[str, PluginRegistryEntry]] = {}
         
         # Create registry directory
@@ -188,7 +196,7 @@ class PluginRegistry:
             self.plugins[metadata.name][metadata.version] = entry
             
             # Save registry
-            self._save_registry()
+            self._append_journal([entry])
             
             logger.info(f"Registered plugin: {metadata.name} v{metadata.version}")
             return True
@@ -218,7 +226,7 @@ class PluginRegistry:
                 if version in self.plugins[name]:
                     # Mark as inactive instead of deleting
                     self.plugins[name][version].status = "inactive"
-                    self._save_registry()
+                    self._append_journal([self.plugins[name][version]])
                     logger.info(f"Unregistered plugin: {name} v{version}")
                     return True
                 else:
@@ -228,7 +236,7 @@ class PluginRegistry:
                 # Unregister all versions
                 for v in self.plugins[name].values():
                     v.status = "inactive"
-                self._save_registry()
+                self._append_journal(list(self.plugins[name].values()))
                 logger.info(f"Unregistered all versions of plugin: {name}")
                 return True
                 
@@ -363,7 +371,7 @@ class PluginRegistry:
                         setattr(entry, field, value)
             
             entry.last_updated = datetime.utcnow()
-            self._save_registry()
+            self._append_journal([entry])
             
             logger.info(f"Updated metadata for {name} v{version}")
             return True
@@ -377,7 +385,7 @@ class PluginRegistry:
         entry = self.get_plugin(name, version)
         if entry:
             entry.download_count += 1
-            self._save_registry()
+            self._append_journal([entry])
     
     def get_registry_stats(self) -> Dict[str, Any]:
         """
@@ -406,7 +414,7 @@ class PluginRegistry:
         }
     
     def _load_registry(self) -> None:
-        """Load registry from file"""
+        """Load registry from file, then replay the journal on top of it"""
         try:
             if self.registry_file.exists():
                 with open(self.registry_file, 'r') as f:
@@ -417,14 +425,66 @@ class PluginRegistry:
                     for version, entry_data in versions.items():
                         self.plugins[plugin_name][version] = \
                             PluginRegistryEntry.from_dict(entry_data)
-                
+            
+            if self.journal_file.exists():
+                self._replay_journal()
+            
+            if self.plugins:
                 logger.info(f"Loaded {len(self.plugins)} plugins from registry")
             
         except Exception as e:
             logger.error(f"Failed to load registry: {e}")
     
+    def _replay_journal(self) -> None:
+        """Apply journaled entries in order, skipping lines that do not parse"""
+        with open(self.journal_file, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    entry = PluginRegistryEntry.from_dict(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    # Typically a line cut short by a crash mid-append
+                    logger.warning(
+                        f"Skipping registry journal line {line_number}: {e}"
+                    )
+                    continue
+                
+                self.plugins.setdefault(entry.metadata.name, {})[
+                    entry.metadata.version
+                ] = entry
+                self._journal_lines += 1
+    
+    def _append_journal(self, entries: List[PluginRegistryEntry]) -> None:
+        """
+        Persist changed entries by appending them to the journal.
+        
+        Once the journal holds more lines than the registry has versions
+        (and at least _JOURNAL_COMPACT_MIN), the registry file is rewritten
+        and the journal dropped, so load time stays proportional to the
+        registry size.
+        
+        Args:
+            entries: Entries whose state changed
+        """
+        try:
+            lines = ''.join(
+                json.dumps(entry.to_dict(), separators=(',', ':')) + '\n'
+                for entry in entries
+            )
+            with open(self.journal_file, 'a') as f:
+                f.write(lines)
+            self._journal_lines += len(entries)
+            
+        except Exception as e:
+            logger.error(f"Failed to append to registry journal: {e}")
+            self._save_registry()
+            return
+        
+        total_versions = sum(len(v) for v in self.plugins.values())
+        if self._journal_lines > max(_JOURNAL_COMPACT_MIN, total_versions):
+            self._save_registry()
+    
     def _save_registry(self) -> None:
-        """Save registry to file"""
+        """Save registry to file and truncate the journal it now covers"""
         try:
             data = {}
             for plugin_name, versions in self.plugins.items():
@@ -435,6 +495,11 @@ class PluginRegistry:
             with open(self.registry_file, 'w') as f:
                 json.dump(data, f, indent=2)
             
+            # Every journaled entry's last line matches its state in the new
+            # file, so a crash before the unlink replays to the same registry
+            self.journal_file.unlink(missing_ok=True)
+            self._journal_lines = 0
+            
             logger.debug("Registry saved successfully")
             
         except Exception as e:
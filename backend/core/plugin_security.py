@@ -4,19 +4,54 @@ Secure Plugin Architecture - Security and Verification
 Handles plugin signing, verification, and sandboxing.
 """
 
+import ast
 import hashlib
 import hmac
 import json
 import os
-from typing import Dict, Any, Optional, List
+import re
+from typing import Dict, Any, Optional, List, Tuple, FrozenSet
 from datetime import datetime, timedelta
 from pathlib import Path
 import logging
 import importlib.util
 import sys
 
+from .plugin_base import perm_mask, perm_names
+
 logger = logging.getLogger(__name__)
 
+# Import statements, for plugins whose source does not parse as Python
+_IMPORT_STATEMENT_RE = re.compile(
+    r'^[ \t]*(?:from[ \t]+([A-Za-z_][\w.]*)[ \t]+import'
+    r'|import[ \t]+([A-Za-z_][\w.]*(?:[ \t]*,[ \t]*[A-Za-z_][\w.]*)*))',
+    re.MULTILINE
+)
+
+
+def _imported_modules(source: str) -> FrozenSet[str]:
+    """Top-level names of all modules a piece of Python source imports."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        names = []
+        for from_module, import_list in _IMPORT_STATEMENT_RE.findall(source):
+            names.extend([from_module] if from_module else import_list.split(','))
+        return frozenset(name.strip().split('.')[0] for name in names)
+    
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.add(node.module.split('.')[0])
+    return frozenset(modules)
+
+
+def _file_version(stat: os.stat_result) -> Tuple[int, int, int, int]:
+    """Stat fields that change whenever a file is rewritten or replaced."""
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+
 
 class PluginSignature:
     """Handles plugin signing and verification"""
@@ -32,26 +67,58 @@ class PluginSignature:
             'PLUGIN_SECRET_KEY',
             'default-plugin-secret-key-change-in-production'
         )
+        
+        # path -> (_file_version, sha256 hexdigest) of the file content
+        self._digest_cache: Dict[str, Tuple[Tuple[int, int, int, int], str]] = {}
     
-    def sign_plugin(self, plugin_path: str, metadata: Dict[str, Any]) -> str:
+    def _content_hash(self, plugin_path: str, use_cache: bool = True) -> str:
+        """
+        SHA-256 hex digest of a plugin file, memoized on its stat version.
+        
+        Args:
+            plugin_path: Path to plugin file
+            use_cache: Reuse the digest if the file looks unchanged
+            
+        Returns:
+            Hex digest of the file content
+        """
+        key = os.fspath(plugin_path)
+        stat = os.stat(key)
+        version = _file_version(stat)
+        cached = self._digest_cache.get(key)
+        if use_cache and cached and cached[0] == version:
+            return cached[1]
+        
+        with open(key, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                digest = hashlib.file_digest(f, 'sha256').hexdigest()
+            else:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        
+        self._digest_cache[key] = (version, digest)
+        return digest
+    
+    def sign_plugin(
+        self,
+        plugin_path: str,
+        metadata: Dict[str, Any],
+        use_cache: bool = True
+    ) -> str:
         """
         Generate signature for a plugin.
         
         Args:
             plugin_path: Path to plugin file
             metadata: Plugin metadata dictionary
+            use_cache: Reuse a memoized content hash if the file looks unchanged
             
         Returns:
             Signature string
         """
         try:
-            # Read plugin file content
-            with open(plugin_path, 'rb') as f:
-                plugin_content = f.read()
-            
             # Create signature payload
             payload = {
-                'content_hash': hashlib.sha256(plugin_content).hexdigest(),
+                'content_hash': self._content_hash(plugin_path, use_cache),
                 'metadata': metadata,
                 'timestamp': datetime.utcnow().isoformat()
             }
@@ -90,8 +157,9 @@ class PluginSignature:
             True if signature is valid, False otherwise
         """
         try:
-            # Generate expected signature
-            expected_signature = self.sign_plugin(plugin_path, metadata)
+            # Generate expected signature from the content on disk; stat
+            # fields can be preserved across a rewrite, so skip the cache
+            expected_signature = self.sign_plugin(plugin_path, metadata, use_cache=False)
             
             # Compare signatures
             if not hmac.compare_digest(signature, expected_signature):
@@ -150,6 +218,9 @@ class PluginSandbox:
             'set',
             'tuple'
         }
+        
+        # path -> (_file_version, imported top-level modules)
+        self._import_cache: Dict[str, Tuple[Tuple[int, int, int, int], FrozenSet[str]]] = {}
     
     def validate_plugin_imports(self, plugin_path: str) -> bool:
         """
@@ -162,14 +233,23 @@ class PluginSandbox:
             True if imports are safe, False otherwise
         """
         try:
-            with open(plugin_path, 'r') as f:
-                content = f.read()
+            # The plugin's imports are parsed once per file version
+            key = os.fspath(plugin_path)
+            version = _file_version(os.stat(key))
+            cached = self._import_cache.get(key)
+            if cached and cached[0] == version:
+                imported = cached[1]
+            else:
+                with open(key, 'r') as f:
+                    imported = _imported_modules(f.read())
+                self._import_cache[key] = (version, imported)
             
             # Check for restricted imports
-            for module in self.restricted_modules:
-                if f"import {module}" in content or f"from {module}" in content:
+            restricted = imported & self.restricted_modules
+            if restricted:
+                for module in sorted(restricted):
                     logger.warning(f"Plugin attempts to import restricted module: {module}")
-                    return False
+                return False
             
             return True
             
@@ -207,12 +287,10 @@ class PluginSandbox:
         Returns:
             True if all required permissions are granted
         """
-        required_set = set(required_permissions)
-        granted_set = set(granted_permissions)
+        missing = perm_mask(required_permissions) & ~perm_mask(granted_permissions)
         
-        if not required_set.issubset(granted_set):
-            missing = required_set - granted_set
-            logger.warning(f"Plugin missing permissions: {missing}")
+        if missing:
+            logger.warning(f"Plugin missing permissions: {set(perm_names(missing))}")
             return False
         
         return True
@@ -7,12 +7,15 @@ Controls update deployment with:
 - Canary deployments
 - Blue-green deployments
 - Rolling updates
+- Continuous rollouts that advance on healthy metrics
 - Automatic rollback
 - Health monitoring
 """
 
 import asyncio
+import heapq
 import logging
+import math
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
@@ -20,6 +23,9 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# First (and reset) delay between health checks while monitoring
+_MIN_HEALTH_POLL_SECONDS = 0.1
+
 
 class RolloutStrategy(Enum):
     """Rollout strategies"""
@@ -27,6 +33,7 @@ class RolloutStrategy(Enum):
     CANARY = "canary"
     BLUE_GREEN = "blue_green"
     ROLLING = "rolling"
+    CONTINUOUS = "continuous"
 
 
 class RolloutPhase(Enum):
@@ -49,6 +56,8 @@ class RolloutConfig:
     error_threshold: float  # Error rate threshold for rollback
     auto_rollback_enabled: bool
     progressive_steps: List[int]  # For rolling updates [10, 25, 50, 100]
+    min_soak_seconds: int = 0  # Continuous rollouts: minimum time per step
+    healthy_checks_required: int = 2  # Continuous rollouts: consecutive healthy checks to advance
 
 
 @dataclass
@@ -150,6 +159,8 @@ class RolloutController:
                 await self._rollout_blue_green(status, config)
             elif config.strategy == RolloutStrategy.ROLLING:
                 await self._rollout_rolling(status, config)
+            elif config.strategy == RolloutStrategy.CONTINUOUS:
+                await self._rollout_continuous(status, config)
             
             if status.phase != RolloutPhase.ROLLING_BACK:
                 status.phase = RolloutPhase.COMPLETE
@@ -264,13 +275,46 @@ class RolloutController:
             
             status.phase = RolloutPhase.DEPLOYING
     
-    async def _monitor_health(self, status: RolloutStatus, config: RolloutConfig):
-        """Monitor deployment health"""
-        monitor_duration = config.monitoring_duration_seconds
+    async def _rollout_continuous(self, status: RolloutStatus, config: RolloutConfig):
+        """Rolling update that advances as soon as each step is healthy"""
+        status.phase = RolloutPhase.DEPLOYING
+        
+        # Pending steps, smallest first
+        pending = list(set(config.progressive_steps))
+        heapq.heapify(pending)
+        
+        while pending:
+            step_percentage = heapq.heappop(pending)
+            logger.info(f"Continuous rollout to {step_percentage}%")
+            
+            # Deploy to next batch
+            await asyncio.sleep(2)
+            status.current_percentage = step_percentage
+            status.updated_at = datetime.utcnow()
+            
+            # Soak until healthy rather than for the full monitoring window
+            status.phase = RolloutPhase.MONITORING
+            if not await self._soak_until_healthy(status, config):
+                raise Exception(f"Continuous rollout unhealthy at {step_percentage}%")
+            
+            status.phase = RolloutPhase.DEPLOYING
+    
+    async def _soak_until_healthy(self, status: RolloutStatus, config: RolloutConfig) -> bool:
+        """
+        Monitor a step until it is healthy enough to advance.
+        
+        Returns True once healthy_checks_required consecutive checks pass and
+        min_soak_seconds have elapsed. If monitoring_duration_seconds runs out
+        first, returns whether the last check was healthy. Triggers rollback
+        like _monitor_health when enabled.
+        """
         interval = config.health_check_interval
-        checks = monitor_duration // interval
+        max_checks = max(1, config.monitoring_duration_seconds // interval)
+        min_checks = max(1, math.ceil(config.min_soak_seconds / interval))
+        healthy_streak = 0
+        healthy = True
         
-        for i in range(checks):
+        for i in range(1, max_checks + 1):
             await asyncio.sleep(interval)
             
             # Collect health metrics
@@ -278,11 +322,49 @@ class RolloutController:
             status.health_metrics.update(metrics)
             status.updated_at = datetime.utcnow()
             
+            healthy = self._is_healthy(status, config)
+            if not healthy:
+                if config.auto_rollback_enabled:
+                    logger.warning(f"Unhealthy deployment detected for {status.rollout_id}")
+                    await self._perform_rollback(status)
+                    return False
+                healthy_streak = 0
+                continue
+            
+            healthy_streak += 1
+            if healthy_streak >= config.healthy_checks_required and i >= min_checks:
+                return True
+        
+        return healthy
+    
+    async def _monitor_health(self, status: RolloutStatus, config: RolloutConfig):
+        """
+        Monitor deployment health for monitoring_duration_seconds.
+        
+        Checks start _MIN_HEALTH_POLL_SECONDS apart and back off by doubling
+        up to health_check_interval, so a bad deploy is caught within the
+        first second while a healthy one settles at the configured interval.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.monitoring_duration_seconds
+        interval = config.health_check_interval
+        delay = min(_MIN_HEALTH_POLL_SECONDS, interval)
+        
+        while loop.time() + delay <= deadline:
+            await asyncio.sleep(delay)
+            
+            # Collect health metrics
+            metrics = await self._collect_health_metrics(status)
+            status.health_metrics.update(metrics)
+            status.updated_at = datetime.utcnow()
+            
             # Check if rollback needed
             if config.auto_rollback_enabled and not self._is_healthy(status, config):
                 logger.warning(f"Unhealthy deployment detected for {status.rollout_id}")
                 await self._perform_rollback(status)
                 return
+            
+            delay = min(delay * 2, interval)
     
     async def _collect_health_metrics(self, status: RolloutStatus) -> Dict[str, float]:
         """Collect health metrics from deployed instances"""
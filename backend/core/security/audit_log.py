@@ -161,18 +161,31 @@ class AuditLogger:
         """Stop the audit log processor"""
         self._running = False
         if self._processor_task:
+            # Wake the blocked processor; events queued before this are
+            # still written
+            await self.event_queue.put(None)
             await self._processor_task
+            self._processor_task = None
     
     async def _process_events(self):
         """Background task to process audit events"""
-        while self._running:
-            try:
-                event = await asyncio.wait_for(self.event_queue.get(), timeout=1.0)
-                await self._write_event(event)
-            except asyncio.TimeoutError:
-                continue
-            except Exception as e:
-                print(f"Error processing audit event: {e}")
+        # Block until an event arrives, then drain the rest of the burst
+        # with get_nowait so busy periods skip a wakeup per event
+        while True:
+            event = await self.event_queue.get()
+            while event is not None:
+                try:
+                    await self._write_event(event)
+                except Exception as e:
+                    print(f"Error processing audit event: {e}")
+                
+                try:
+                    event = self.event_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+            
+            if event is None:
+                return
     
     async def log(
         self,
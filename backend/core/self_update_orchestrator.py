@@ -14,6 +14,7 @@ Coordinates the entire self-triggered update process:
 
 import asyncio
 import logging
+import random
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
@@ -103,6 +104,7 @@ class SelfUpdateOrchestrator:
         # State
         self._running = False
         self._update_check_task: Optional[asyncio.Task] = None
+        self._wake_event = asyncio.Event()
     
     async def start(self):
         """Start the orchestrator"""
@@ -145,10 +147,19 @@ class SelfUpdateOrchestrator:
         """Main loop for checking and processing updates"""
         while self._running:
             try:
+                # Registrations during the check below wake the next pass
+                self._wake_event.clear()
+                
                 if self.auto_update_enabled:
                     await self.check_and_process_updates()
                 
-                await asyncio.sleep(self.check_interval)
+                # Sleep until the jittered interval elapses or a component
+                # version is registered, whichever comes first
+                timeout = self.check_interval + random.uniform(0, self.check_interval * 0.1)
+                try:
+                    await asyncio.wait_for(self._wake_event.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
             except Exception as e:
                 logger.error(f"Error in update check loop: {e}")
                 await asyncio.sleep(60)
@@ -373,15 +384,17 @@ class SelfUpdateOrchestrator:
                 progressive_steps=[5, 25, 50, 100]
             )
         
-        # Normal updates - rolling
+        # Normal updates - continuous rolling, advancing once each step is healthy
         return RolloutConfig(
-            strategy=RolloutStrategy.ROLLING,
+            strategy=RolloutStrategy.CONTINUOUS,
             canary_percentage=10,
             monitoring_duration_seconds=120,
             health_check_interval=20,
             error_threshold=0.01,
             auto_rollback_enabled=True,
-            progressive_steps=[10, 25, 50, 75, 100]
+            progressive_steps=[10, 25, 50, 75, 100],
+            min_soak_seconds=40,
+            healthy_checks_required=2
         )
     
     async def _wait_for_rollout(self, rollout_id: str, workflow: UpdateWorkflow):
@@ -402,6 +415,9 @@ class SelfUpdateOrchestrator:
     def register_component_version(self, component: str, version: str):
         """Register current version of a component"""
         self.version_detector.register_current_version(component, version)
+        
+        # Re-check now rather than at the next interval
+        self._wake_event.set()
     
     def get_workflow_status(self, workflow_id: str) -> Optional[UpdateWorkflow]:
         """Get workflow status"""
@@ -16,6 +16,7 @@ from enum import Enum
 import numpy as np
 from collections import deque
 import json
+import logging
 
 from utils.logging import get_logger
 
@@ -84,7 +85,8 @@ class TimeSeriesForecaster:
         ts = timestamp or datetime.now()
         self.history[metric_name].append((ts, value))
         
-        logger.debug(f"Added data point for {metric_name}: {value} at {ts}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Added data point for {metric_name}: {value} at {ts}")
     
     def add_batch_data(self, metric_name: str, data_points: List[Tuple[datetime, float]]):
         """Add multiple data points at once."""
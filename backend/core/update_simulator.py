@@ -167,9 +167,18 @@ class UpdateSimulator:
             TestType.PERFORMANCE_TESTS
         ]
         
-        for test_type in test_types:
+        # Test types are independent, so run them together and fold the
+        # results back in test_types order
+        test_results = await asyncio.gather(
+            *(self._run_test(test_type, version_info, env_path) for test_type in test_types),
+            return_exceptions=True
+        )
+
+        for test_type, test_result in zip(test_types, test_results):
             try:
-                test_result = await self._run_test(test_type, version_info, env_path)
+                if isinstance(test_result, BaseException):
+                    raise test_result
+
                 result.tests_run += test_result["total"]
                 result.tests_passed += test_result["passed"]
                 result.tests_failed += test_result["failed"]
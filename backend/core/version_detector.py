@@ -14,14 +14,34 @@ import asyncio
 import hashlib
 import json
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _version_distance(current: str, latest: str) -> int:
+    """Sum of per-part increases from current to latest (cached per pair)."""
+    # Simple implementation - count version number differences
+    try:
+        current_parts = [int(x) for x in current.split('.')]
+        latest_parts = [int(x) for x in latest.split('.')]
+        
+        distance = 0
+        for c, l in zip(current_parts, latest_parts):
+            if l > c:
+                distance += (l - c)
+        
+        return distance
+    except:
+        return 0
+
+
 class UpdateSource(Enum):
     """Sources for update detection"""
     GIT_REPOSITORY = "git"
@@ -39,6 +59,11 @@ class UpdatePriority(Enum):
     LOW = "low"  # Minor updates, cosmetic changes
 
 
+# Hoisted so per-comparison checks skip the Enum class attribute lookup
+_CRITICAL = UpdatePriority.CRITICAL
+_HIGH = UpdatePriority.HIGH
+
+
 @dataclass
 class VersionInfo:
     """Version information"""
@@ -73,9 +98,12 @@ class VersionDetector:
     def __init__(
         self,
         check_interval: int = 3600,  # 1 hour
-        sources: Optional[List[UpdateSource]] = None
+        sources: Optional[List[UpdateSource]] = None,
+        source_cache_ttl: float = 300  # 5 minutes
     ):
         self.check_interval = check_interval
+        # Never longer than the check interval, so periodic checks stay fresh
+        self.source_cache_ttl = min(source_cache_ttl, check_interval)
         self.sources = sources or [
             UpdateSource.GIT_REPOSITORY,
             UpdateSource.PACKAGE_REGISTRY,
@@ -89,6 +117,9 @@ class VersionDetector:
         
         self._running = False
         self._check_task: Optional[asyncio.Task] = None
+        
+        # source -> (monotonic fetch time, updates) for recent source queries
+        self._source_cache: Dict[UpdateSource, Tuple[float, Dict[str, List[VersionInfo]]]] = {}
     
     async def start(self):
         """Start version detection"""
@@ -121,14 +152,21 @@ class VersionDetector:
                 logger.error(f"Error in version check loop: {e}")
                 await asyncio.sleep(60)  # Wait before retrying
     
-    async def check_for_updates(self) -> Dict[str, List[VersionInfo]]:
-        """Check all sources for updates"""
+    async def check_for_updates(self, force: bool = False) -> Dict[str, List[VersionInfo]]:
+        """
+        Check all sources for updates.
+        
+        A source queried within source_cache_ttl seconds is answered from
+        the last result instead of being queried again, so callers that
+        check back to back (the orchestrator and this detector's own loop)
+        share one round-trip. Pass force=True to bypass the cache.
+        """
         logger.info("Checking for updates...")
         
         updates = {}
         for source in self.sources:
             try:
-                source_updates = await self._check_source(source)
+                source_updates = await self._check_source_cached(source, force)
                 updates.update(source_updates)
             except Exception as e:
                 logger.error(f"Error checking source {source}: {e}")
@@ -146,6 +184,21 @@ class VersionDetector:
         logger.info(f"Found {len(updates)} components with updates")
         return updates
     
+    async def _check_source_cached(
+        self,
+        source: UpdateSource,
+        force: bool = False
+    ) -> Dict[str, List[VersionInfo]]:
+        """Check a source, reusing a result younger than source_cache_ttl"""
+        now = time.monotonic()
+        cached = self._source_cache.get(source)
+        if not force and cached is not None and now - cached[0] < self.source_cache_ttl:
+            return cached[1]
+        
+        source_updates = await self._check_source(source)
+        self._source_cache[source] = (now, source_updates)
+        return source_updates
+    
     async def _check_source(self, source: UpdateSource) -> Dict[str, List[VersionInfo]]:
         """Check a specific source for updates"""
         if source == UpdateSource.GIT_REPOSITORY:
@@ -297,19 +350,7 @@ class VersionDetector:
     
     def _calculate_version_distance(self, current: str, latest: str) -> int:
         """Calculate distance between versions"""
-        # Simple implementation - count version number differences
-        try:
-            current_parts = [int(x) for x in current.split('.')]
-            latest_parts = [int(x) for x in latest.split('.')]
-            
-            distance = 0
-            for c, l in zip(current_parts, latest_parts):
-                if l > c:
-                    distance += (l - c)
-            
-            return distance
-        except:
-            return 0
+        return _version_distance(current, latest)
     
     def _generate_recommendation(
         self,
@@ -322,7 +363,7 @@ class VersionDetector:
         if not is_update_available:
             return "Component is up to date"
         
-        if priority == UpdatePriority.CRITICAL:
+        if priority is _CRITICAL:
             return "URGENT: Update immediately - critical security/bug fix"
         
         if breaking_changes:
@@ -331,7 +372,7 @@ class VersionDetector:
         if version_distance > 5:
             return "Multiple versions behind - consider updating soon"
         
-        if priority == UpdatePriority.HIGH:
+        if priority is _HIGH:
             return "Important update available - recommended to update"
         
         return "Update available - consider updating when convenient"
@@ -350,7 +391,7 @@ class VersionDetector:
         all_comparisons = self.get_all_comparisons()
         return [
             c for c in all_comparisons
-            if c.is_update_available and c.priority == UpdatePriority.CRITICAL
+            if c.is_update_available and c.priority is _CRITICAL
         ]
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -6,13 +6,18 @@ SQLAlchemy database models.
 from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
-    Column, String, Integer, DateTime, ForeignKey, Text, JSON, Enum, Float
+    Column, String, Integer, DateTime, ForeignKey, Text, JSON, Enum, Float,
+    UniqueConstraint
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
 import enum
 
 Base = declarative_base()
 
+# Binary JSONB on PostgreSQL, plain JSON elsewhere
+JSONData = JSON().with_variant(JSONB(), "postgresql")
+
 
 class RunStatus(str, enum.Enum):
     """Status of a run."""
@@ -52,7 +57,7 @@ class Tenant(Base):
     name = Column(String(255), unique=True, nullable=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    meta_data = Column("metadata", JSON, default=dict)
+    meta_data = Column("metadata", JSONData, default=dict)
     
     # Relationships
     projects = relationship("Project", back_populates="tenant", cascade="all, delete-orphan")
@@ -68,6 +73,9 @@ class Project(Base):
     Projects group related runs together within a tenant.
     """
     __tablename__ = "projects"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "name", name="uq_projects_tenant_name"),
+    )
     
     id = Column(String(36), primary_key=True)
     tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=False, index=True)
@@ -75,7 +83,7 @@ class Project(Base):
     description = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    meta_data = Column("metadata", JSON, default=dict)
+    meta_data = Column("metadata", JSONData, default=dict)
     
     # Relationships
     tenant = relationship("Tenant", back_populates="projects")
@@ -96,9 +104,9 @@ class Run(Base):
     id = Column(String(36), primary_key=True)
     project_id = Column(String(36), ForeignKey("projects.id"), nullable=False, index=True)
     status = Column(Enum(RunStatus), default=RunStatus.PENDING, nullable=False, index=True)
-    config = Column(JSON, default=dict)  # Configuration used for this run
-    input_data = Column(JSON)  # Input data/task
-    output_data = Column(JSON)  # Final output
+    config = Column(JSONData, default=dict)  # Configuration used for this run
+    input_data = Column(JSONData)  # Input data/task
+    output_data = Column(JSONData)  # Final output
     error_message = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -127,8 +135,8 @@ class AgentRun(Base):
     agent_name = Column(String(255), nullable=False, index=True)
     agent_type = Column(String(100), nullable=False)
     status = Column(Enum(AgentRunStatus), default=AgentRunStatus.PENDING, nullable=False)
-    input_data = Column(JSON)
-    output_data = Column(JSON)
+    input_data = Column(JSONData)
+    output_data = Column(JSONData)
     error_message = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -154,7 +162,7 @@ class Message(Base):
     sender = Column(String(255), nullable=False)
     receiver = Column(String(255), nullable=False)
     message_type = Column(String(100), nullable=False)
-    content = Column(JSON, nullable=False)
+    content = Column(JSONData, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     processed = Column(Integer, default=0)  # 0=pending, 1=processed
     
@@ -179,8 +187,8 @@ class ModelVersion(Base):
     status = Column(Enum(ModelStatus), default=ModelStatus.TRAINING, nullable=False)
     
     # Model metadata
-    parameters = Column(JSON, default=dict)
-    hyperparameters = Column(JSON, default=dict)
+    parameters = Column(JSONData, default=dict)
+    hyperparameters = Column(JSONData, default=dict)
     
     # Performance metrics
     accuracy = Column(Float)
@@ -190,7 +198,7 @@ class ModelVersion(Base):
     training_samples = Column(Integer, default=0)
     
     # Custom metrics
-    metrics = Column(JSON, default=dict)
+    metrics = Column(JSONData, default=dict)
     
     # File paths
     model_file_path = Column(String(500))
@@ -228,8 +236,8 @@ class LearningEvent(Base):
     samples_processed = Column(Integer)
     
     # Performance before/after
-    metrics_before = Column(JSON)
-    metrics_after = Column(JSON)
+    metrics_before = Column(JSONData)
+    metrics_after = Column(JSONData)
     improvement = Column(Float)
     
     # Timing
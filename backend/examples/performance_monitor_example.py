@@ -140,10 +140,7 @@ def main():
     # Get per-agent metrics
     logger.info("\n5. Retrieving per-agent metrics...")
     
-    with monitor._lock:
-        agent_names = list(monitor._agent_metrics.keys())
-    
-    for agent_name in agent_names[:3]:  # Show first 3 agents
+    for agent_name in monitor.get_agent_names()[:3]:  # Show first 3 agents
         agent_perf = monitor.get_agent_metrics(agent_name)
         logger.info(f"\nAgent: {agent_name}")
         logger.info(f"  Type: {agent_perf.agent_type}")
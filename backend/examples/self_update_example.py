@@ -13,6 +13,14 @@ from datetime import datetime
 from core.self_update_orchestrator import SelfUpdateOrchestrator
 from core.cicd_integrator import CICDConfig, CICDProvider
 
+# uvloop (optional) runs the orchestrator's task-heavy loops with less overhead
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -213,4 +221,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # The loop has to be chosen before it starts, not inside the orchestrator
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
@@ -0,0 +1,371 @@
+"""
+Query-count tests for the Compliance Intelligence Workflow.
+
+Tests cover:
+- Workflow execution against an in-memory SQLite database
+- Failure of one concurrent step while the other is still running
+- The per-tenant report cache and status streaming, against an
+  in-memory Redis stand-in
+- The results endpoint's json and markdown formats
+- Upper bounds on SQL statements per public method, so N+1 shapes
+  (per-row lookups inside loops) fail here instead of in production
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# config.settings validates these at import time
+os.environ.setdefault("SECRET_KEY", "compliance-workflow-test-secret")
+os.environ.setdefault("API_KEYS", json.dumps(["compliance-workflow-test-key"]))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from database.models import Base, AgentRun, AgentRunStatus, Project, Run, RunStatus
+from workflows.compliance import ComplianceWorkflow, AGENT_STEPS
+from api.auth import get_current_user
+from api.models import User
+from api.routes import workflows as workflow_routes
+from database.session import get_db
+
+
+@contextlib.contextmanager
+def count_queries(conn):
+    """Collect every SQL statement executed on conn while active."""
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(conn, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(conn, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine shared across the workflow's worker threads."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """Session configured like database.session.get_session_factory."""
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio client calls the workflow makes."""
+    
+    def __init__(self):
+        self.store = {}
+        self.subscribers = {}
+    
+    async def get(self, key):
+        return self.store.get(key)
+    
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+    
+    async def publish(self, channel, message):
+        queues = self.subscribers.get(channel, [])
+        for queue in queues:
+            queue.put_nowait({"type": "message", "data": message})
+        return len(queues)
+    
+    def pubsub(self):
+        return FakePubSub(self)
+    
+    async def aclose(self):
+        pass
+
+
+class FakePubSub:
+    """Subscription on a FakeRedis, delivering published messages in order."""
+    
+    def __init__(self, client):
+        self.client = client
+        self.queue = asyncio.Queue()
+    
+    async def subscribe(self, channel):
+        self.client.subscribers.setdefault(channel, []).append(self.queue)
+        self.queue.put_nowait({"type": "subscribe", "data": 1})
+    
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+    
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Route the workflow's Redis client to a FakeRedis."""
+    client = FakeRedis()
+    monkeypatch.setattr("workflows.compliance.status_streaming_available", lambda: True)
+    monkeypatch.setattr("workflows.compliance.redis", SimpleNamespace(from_url=lambda url: client))
+    return client
+
+
+def agent_statuses(db, run_id):
+    """AgentRun status by agent name for a run, read fresh from the database."""
+    db.expire_all()
+    return {
+        ar.agent_name: ar.status
+        for ar in db.query(AgentRun).filter(AgentRun.run_id == run_id)
+    }
+
+
+@pytest.fixture
+def workflow(db):
+    """Workflow bound to the test session."""
+    return ComplianceWorkflow(db_session=db)
+
+
+@pytest.mark.asyncio
+async def test_execute_workflow(workflow, db):
+    """Test a full run completes and records every agent step."""
+    run_id = await workflow.start_workflow("Review our data retention policy", "tenant-1")
+    result = await workflow.execute_workflow(run_id, "Review our data retention policy")
+
+    assert result["status"] == "completed"
+    assert result["results"]["risk_assessment"]["findings"]
+
+    agent_runs = db.query(AgentRun).filter(AgentRun.run_id == run_id).all()
+    assert sorted(ar.agent_name for ar in agent_runs) == sorted(AGENT_STEPS)
+    assert all(ar.status == AgentRunStatus.COMPLETED for ar in agent_runs)
+
+
+
+class FailingAgent:
+    """Agent whose step raises immediately."""
+    
+    def run(self, context):
+        raise RuntimeError("analysis failed")
+
+
+class SlowAgent:
+    """Agent whose step is still running when its sibling fails."""
+    
+    def run(self, context):
+        time.sleep(0.2)
+        return {"perspectives": []}
+
+
+@pytest.mark.asyncio
+async def test_execute_workflow_concurrent_step_failure(workflow, db):
+    """Test a failing step fails the run only after its sibling step settles."""
+    workflow.agents = {**workflow.agents, "react": FailingAgent(), "debate": SlowAgent()}
+    run_id = await workflow.start_workflow("Review our data retention policy", "tenant-1")
+    result = await workflow.execute_workflow(run_id, "Review our data retention policy")
+    
+    assert result["status"] == "failed"
+    assert result["error"] == "analysis failed"
+    
+    assert agent_statuses(db, run_id) == {
+        "governor": AgentRunStatus.COMPLETED,
+        "react": AgentRunStatus.FAILED,
+        "debate": AgentRunStatus.COMPLETED,
+        "evaluator": AgentRunStatus.SKIPPED,
+    }
+    
+    status = await workflow.get_workflow_status(run_id)
+    assert status["status"] == RunStatus.FAILED.value
+    assert status["current_agent"] is None
+
+
+@pytest.mark.asyncio
+async def test_execute_workflow_query_budget(workflow, engine):
+    """Test execution stays within a fixed statement budget."""
+    run_id = await workflow.start_workflow("Review our data retention policy", "tenant-1")
+
+    with count_queries(engine) as queries:
+        await workflow.execute_workflow(run_id, "Review our data retention policy")
+
+    # Measured at 11: run lookup, run RUNNING update, one batched agent run
+    # insert (carrying the governor's RUNNING state), a RUNNING and a
+    # COMPLETED update for each later step plus the governor's COMPLETED
+    # update, and the final run update. Any per-row re-SELECT exceeds this
+    assert len(queries) <= 2 * len(AGENT_STEPS) + 3, queries
+
+
+@pytest.mark.asyncio
+async def test_get_workflow_status_single_query(workflow, engine):
+    """Test status polling is one statement regardless of agent count."""
+    run_id = await workflow.start_workflow("Review our data retention policy", "tenant-1")
+    await workflow.execute_workflow(run_id, "Review our data retention policy")
+
+    with count_queries(engine) as queries:
+        status = await workflow.get_workflow_status(run_id)
+
+    assert len(queries) == 1, queries
+    assert status["status"] == RunStatus.COMPLETED.value
+    assert status["completed_agent_count"] == len(AGENT_STEPS)
+    assert status["current_agent"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_workflow_results_single_query(workflow, engine):
+    """Test fetching results is one statement."""
+    run_id = await workflow.start_workflow("Review our data retention policy", "tenant-1")
+    await workflow.execute_workflow(run_id, "Review our data retention policy")
+
+    with count_queries(engine) as queries:
+        results = await workflow.get_workflow_results(run_id)
+
+    assert len(queries) == 1, queries
+    assert results["results"]["analysis"]["perspectives"]
+
+
+@pytest.mark.asyncio
+async def test_start_workflow_reuses_default_project(workflow, db, engine):
+    """Test repeat starts reuse the tenant's default project in few statements."""
+    await workflow.start_workflow("First query", "tenant-1")
+
+    with count_queries(engine) as queries:
+        await workflow.start_workflow("Second query", "tenant-1")
+
+    # Tenant upsert, project upsert, project id lookup, run insert
+    assert len(queries) <= 4, queries
+    assert db.query(Project).filter(Project.tenant_id == "tenant-1").count() == 1
+
+
+@pytest.mark.asyncio
+async def test_start_workflow_without_project_constraint(workflow, db, engine):
+    """Test databases created before uq_projects_tenant_name still start workflows."""
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE projects"))
+        conn.execute(text(
+            "CREATE TABLE projects ("
+            "id VARCHAR(36) PRIMARY KEY, "
+            "tenant_id VARCHAR(36) NOT NULL REFERENCES tenants(id), "
+            "name VARCHAR(255) NOT NULL, "
+            "description TEXT, "
+            "created_at DATETIME NOT NULL, "
+            "updated_at DATETIME, "
+            "metadata JSON)"
+        ))
+
+    first = await workflow.start_workflow("First query", "tenant-1")
+    second = await workflow.start_workflow("Second query", "tenant-1")
+
+    assert first != second
+    assert db.query(Project).filter(Project.tenant_id == "tenant-1").count() == 1
+
+
+class BlockingGovernor:
+    """Governor that rejects every query."""
+    
+    def preflight(self, task):
+        return False, "disallowed content"
+
+
+@pytest.mark.asyncio
+async def test_report_cache_per_tenant(workflow, db, fake_redis):
+    """Test repeat queries reuse the tenant's cached report after the governor runs."""
+    query = "Review our data retention policy"
+    first_id = await workflow.start_workflow(query, "tenant-1")
+    first = await workflow.execute_workflow(first_id, query)
+    assert len(fake_redis.store) == 1
+    
+    # Same tenant: served from the cache, but only after the governor step
+    hit_id = await workflow.start_workflow(query, "tenant-1")
+    hit = await workflow.execute_workflow(hit_id, query)
+    assert hit["status"] == "completed"
+    assert hit["results"] == json.loads(json.dumps(first["results"], default=str))
+    assert agent_statuses(db, hit_id) == {
+        "governor": AgentRunStatus.COMPLETED,
+        "react": AgentRunStatus.SKIPPED,
+        "debate": AgentRunStatus.SKIPPED,
+        "evaluator": AgentRunStatus.SKIPPED,
+    }
+    assert db.get(Run, hit_id).status == RunStatus.COMPLETED
+    
+    # Another tenant: a miss that runs every agent and caches its own report
+    miss_id = await workflow.start_workflow(query, "tenant-2")
+    await workflow.execute_workflow(miss_id, query)
+    assert set(agent_statuses(db, miss_id).values()) == {AgentRunStatus.COMPLETED}
+    assert len(fake_redis.store) == 2
+    
+    # bypass_cache ignores the cached report
+    bypass_id = await workflow.start_workflow(query, "tenant-1")
+    await workflow.execute_workflow(bypass_id, query, {"bypass_cache": True})
+    assert set(agent_statuses(db, bypass_id).values()) == {AgentRunStatus.COMPLETED}
+    
+    # A query the governor now blocks is not answered from the cache
+    workflow.agents = {**workflow.agents, "governor": BlockingGovernor()}
+    blocked_id = await workflow.start_workflow(query, "tenant-1")
+    blocked = await workflow.execute_workflow(blocked_id, query)
+    assert blocked["status"] == "failed"
+    assert db.get(Run, blocked_id).status == RunStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_stream_workflow_status(workflow, fake_redis):
+    """Test subscribers get the current status, then every published transition."""
+    query = "Review our data retention policy"
+    run_id = await workflow.start_workflow(query, "tenant-1")
+    
+    stream = workflow.stream_workflow_status(run_id)
+    snapshot = await anext(stream)
+    assert snapshot["status"] == RunStatus.PENDING.value
+    assert snapshot["snapshot"]["workflow_id"] == run_id
+    
+    await workflow.execute_workflow(run_id, query)
+    events = [event async for event in stream]
+    
+    transitions = [(e["step"], e["status"]) for e in events]
+    assert transitions[0] == ("workflow", RunStatus.RUNNING.value)
+    assert transitions[-1] == ("workflow", RunStatus.COMPLETED.value)
+    for step in AGENT_STEPS:
+        running = transitions.index((step, AgentRunStatus.RUNNING.value))
+        assert transitions.index((step, AgentRunStatus.COMPLETED.value)) > running
+
+
+@pytest.mark.asyncio
+async def test_results_endpoint_formats(workflow, db):
+    """Test the markdown report is rendered only for format=markdown, then reused."""
+    query = "Review our data retention policy"
+    run_id = await workflow.start_workflow(query, "tenant-1")
+    await workflow.execute_workflow(run_id, query)
+    
+    app = FastAPI()
+    app.include_router(workflow_routes.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: User(username="test", tenant_id="tenant-1")
+    
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        as_json = await client.get(f"/workflows/{run_id}/results")
+        as_markdown = await client.get(f"/workflows/{run_id}/results", params={"format": "markdown"})
+    
+    assert as_json.status_code == 200
+    assert as_json.json()["compliance_report"] is None
+    assert as_json.json()["risk_assessment"]["findings"]
+    
+    assert as_markdown.status_code == 200
+    report = as_markdown.json()["compliance_report"]
+    assert report.startswith("#")
+    assert query in report
+    assert workflow_routes._report_cache[run_id] == report
@@ -207,6 +207,21 @@ class TestAgentLearningCoordinator(unittest.TestCase):
         self.assertEqual(report['summary']['iterations_completed'], 3)
         self.assertGreater(report['summary']['total_tasks_executed'], 0)
     
+    def test_iter_learning_loop_stops_early(self):
+        """Test iterating the learning loop and stopping after one iteration."""
+        loop = self.coordinator.iter_exponential_learning_loop(
+            iterations=3,
+            batch_size=2,
+            report_every=1
+        )
+        
+        record = next(loop)
+        loop.close()
+        
+        self.assertEqual(record['iteration'], 1)
+        self.assertIn('performance', record)
+        self.assertEqual(self.coordinator.learning_stats['iterations_completed'], 1)
+    
     def test_get_current_stats(self):
         """Test getting current statistics."""
         stats = self.coordinator.get_current_stats()
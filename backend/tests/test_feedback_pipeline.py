@@ -13,6 +13,7 @@ Tests cover:
 import pytest
 import asyncio
 from typing import Dict, Any
+from dataclasses import asdict
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
 
@@ -27,20 +28,32 @@ from core.feedback_pipeline import (
 from core.action_dispatcher import (
     ActionDispatcher,
     OrchestrationDispatcher,
-    create_dispatcher
+    create_dispatcher,
+    _format_utc_ns
 )
 from core.base_agent import BaseAgent
+import core.feedback_pipeline as feedback_pipeline_module
+
+
+@pytest.fixture(autouse=True)
+def reset_feedback_pipeline():
+    """Give each test its own global pipeline so tests stay independent."""
+    feedback_pipeline_module._pipeline_instance = None
+    yield
+    feedback_pipeline_module._pipeline_instance = None
 
 
 # Test Agent Implementation
 class TestAgent(BaseAgent):
     """Simple test agent."""
     
+    _CAPABILITIES = frozenset({"testing"})
+    
     def __init__(self, name="test_agent", should_fail=False):
         super().__init__(
             name=name,
             agent_type="test",
-            capabilities=["testing"]
+            capabilities=self._CAPABILITIES
         )
         self.should_fail = should_fail
         self.execution_count = 0
@@ -112,6 +125,13 @@ def test_outcome_event_to_dict():
     assert data["event_id"] == "test-123"
     assert data["status"] == "success"
     assert data["severity"] == "info"
+    
+    # Generated to_dict matches dataclasses.asdict field for field
+    expected = asdict(event)
+    del expected["_cached_json"]
+    expected["status"] = "success"
+    expected["severity"] = "info"
+    assert data == expected
 
 
 def test_outcome_event_to_json():
@@ -134,9 +154,13 @@ def test_outcome_event_to_json():
     json_str = event.to_json()
     
     assert isinstance(json_str, str)
-    assert '"event_id": "test-123"' in json_str
-    assert '"status": "success"' in json_str
-
+    assert '"event_id":"test-123"' in json_str
+    assert '"status":"success"' in json_str
+    
+    # Serialized once and shared across sinks
+    assert event.to_json_bytes() is event.to_json_bytes()
+    assert event.to_json_bytes().decode("utf-8") == json_str
+    assert "_cached_json" not in event.to_dict()
 
 # ============================================================================
 # FeedbackPipeline Tests
@@ -197,7 +221,7 @@ def test_feedback_pipeline_get_recent_events():
             severity=EventSeverity.INFO,
             latency_ms=100.5
         )
-        pipeline._event_buffer.append(event)
+        pipeline._append_event(event)
     
     # Get all recent
     recent = pipeline.get_recent_events(count=10)
@@ -210,6 +234,84 @@ def test_feedback_pipeline_get_recent_events():
     # Filter by status
     failures = pipeline.get_recent_events(count=10, status=OutcomeStatus.FAILURE)
     assert len(failures) == 2  # events 1, 3
+    
+    # Combined filters return the most recent matches, oldest first
+    combined = pipeline.get_recent_events(
+        count=2, agent_name="agent_0", status=OutcomeStatus.SUCCESS
+    )
+    assert [e.event_id for e in combined] == ["test-2", "test-4"]
+
+
+def test_feedback_pipeline_buffer_eviction():
+    """Test that the oldest events are overwritten once the buffer is full."""
+    pipeline = FeedbackPipeline(
+        kafka_servers=None,
+        enable_kafka=False,
+        buffer_max_size=3
+    )
+    
+    for i in range(5):
+        event = OutcomeEvent(
+            event_id=f"test-{i}",
+            run_id="run-456",
+            agent_name=f"agent_{i % 2}",
+            agent_type="test",
+            action_type="test_action",
+            timestamp=datetime.utcnow().isoformat(),
+            start_time=datetime.utcnow().isoformat(),
+            end_time=datetime.utcnow().isoformat(),
+            duration_ms=100.5,
+            status=OutcomeStatus.SUCCESS,
+            severity=EventSeverity.INFO,
+            latency_ms=100.5
+        )
+        pipeline._append_event(event)
+    
+    assert [e.event_id for e in pipeline.get_recent_events(count=10)] == [
+        "test-2", "test-3", "test-4"
+    ]
+    agent_events = pipeline.get_recent_events(count=10, agent_name="agent_0")
+    assert [e.event_id for e in agent_events] == ["test-2", "test-4"]
+    successes = pipeline.get_recent_events(count=10, status=OutcomeStatus.SUCCESS)
+    assert len(successes) == 3
+
+
+def test_feedback_pipeline_prunes_evicted_agents():
+    """Test agents drop out of the id map once their last event is evicted."""
+    pipeline = FeedbackPipeline(
+        kafka_servers=None,
+        enable_kafka=False,
+        buffer_max_size=100
+    )
+    
+    for i in range(250):
+        event = OutcomeEvent(
+            event_id=f"test-{i}",
+            run_id="run-456",
+            agent_name="steady_agent" if i % 2 else f"agent_{i}",
+            agent_type="test",
+            action_type="test_action",
+            timestamp=datetime.utcnow().isoformat(),
+            start_time=datetime.utcnow().isoformat(),
+            end_time=datetime.utcnow().isoformat(),
+            duration_ms=100.5,
+            status=OutcomeStatus.SUCCESS if i % 4 == 1 else OutcomeStatus.FAILURE,
+            severity=EventSeverity.INFO,
+            latency_ms=100.5
+        )
+        pipeline._append_event(event)
+    
+    assert len(pipeline._agent_id_map) == 51
+    assert pipeline.get_recent_events(count=10, agent_name="agent_0") == []
+    assert [e.event_id for e in pipeline.get_recent_events(count=1, agent_name="agent_248")] == [
+        "test-248"
+    ]
+    
+    # Matches spanning several scan chunks come back oldest first
+    successes = pipeline.get_recent_events(
+        count=30, agent_name="steady_agent", status=OutcomeStatus.SUCCESS
+    )
+    assert [e.event_id for e in successes] == [f"test-{i}" for i in range(153, 250, 4)]
 
 
 def test_feedback_pipeline_metrics():
@@ -226,6 +328,47 @@ def test_feedback_pipeline_metrics():
     assert metrics["buffer_size"] == 0
 
 
+# ============================================================================
+# KafkaPublisher Tests
+# ============================================================================
+
+@pytest.mark.asyncio
+async def test_kafka_publisher_does_not_block_on_send():
+    """Test that publish queues the event without waiting for the broker."""
+    producer = Mock()
+    future = producer.send.return_value
+    
+    with patch("core.feedback_pipeline.KAFKA_AVAILABLE", True), \
+         patch("core.feedback_pipeline.KafkaProducer", return_value=producer):
+        publisher = KafkaPublisher(bootstrap_servers="localhost:9092")
+    
+    event = OutcomeEvent(
+        event_id="test-123",
+        run_id="run-456",
+        agent_name="test_agent",
+        agent_type="test",
+        action_type="test_action",
+        timestamp=datetime.utcnow().isoformat(),
+        start_time=datetime.utcnow().isoformat(),
+        end_time=datetime.utcnow().isoformat(),
+        duration_ms=100.5,
+        status=OutcomeStatus.SUCCESS,
+        severity=EventSeverity.INFO,
+        latency_ms=100.5
+    )
+    
+    assert await publisher.publish(event) is True
+    producer.send.assert_called_once()
+    future.get.assert_not_called()
+    
+    # Delivery is recorded once the producer reports the batch acknowledged
+    success_cb = future.add_callback.call_args[0]
+    success_cb[0](*success_cb[1:], Mock(partition=0, offset=1))
+    assert publisher.get_metrics()["events_sent"] == 1
+    
+    publisher.close()
+
+
 # ============================================================================
 # ActionDispatcher Tests
 # ============================================================================
@@ -260,6 +403,18 @@ async def test_action_dispatcher_success():
     recent = pipeline.get_recent_events(count=10)
     assert len(recent) == 1
     assert recent[0].status == OutcomeStatus.SUCCESS
+    assert _format_utc_ns(recent[0].timestamp_ns) == recent[0].timestamp
+
+
+def test_format_utc_ns_matches_datetime():
+    """Test the dispatcher's timestamp formatter against datetime."""
+    epoch_ns = 1_700_000_000_123_456_789
+    expected = datetime.utcfromtimestamp(epoch_ns // 1_000_000_000).replace(
+        microsecond=(epoch_ns % 1_000_000_000) // 1000
+    ).isoformat(timespec="microseconds")
+    
+    assert _format_utc_ns(epoch_ns) == expected
+    assert datetime.fromisoformat(_format_utc_ns(epoch_ns)).microsecond == 123456
 
 
 @pytest.mark.asyncio
@@ -365,7 +520,8 @@ async def test_orchestration_dispatcher_workflow():
     result = await orchestrator.execute_workflow(
         agents=agents,
         task="Test workflow",
-        tags=["test", "workflow"]
+        tags=["test", "workflow"],
+        parallel=True
     )
     
     # Check result structure
@@ -374,9 +530,9 @@ async def test_orchestration_dispatcher_workflow():
     assert "outputs" in result
     assert len(result["outputs"]) == 3
     
-    # Check each agent was executed
-    for i, output in enumerate(result["outputs"]):
-        assert output["agent"] == f"agent{i+1}"
+    # Check each agent was executed, irrespective of completion order
+    assert {output["agent"] for output in result["outputs"]} == {"agent1", "agent2", "agent3"}
+    for output in result["outputs"]:
         assert output["status"] == "success"
         assert "event_id" in output
 
@@ -402,6 +558,33 @@ async def test_orchestration_dispatcher_workflow_failure():
     assert len(result["outputs"]) == 2
     assert result["outputs"][0]["status"] == "success"
     assert result["outputs"][1]["status"] == "failure"
+    assert agents[2].execution_count == 0
+
+
+@pytest.mark.asyncio
+async def test_orchestration_dispatcher_workflow_timeout():
+    """Test workflow stops on agent timeout."""
+    class TimeoutAgent(TestAgent):
+        def execute(self, input_data, context):
+            self.execution_count += 1
+            raise TimeoutError("Step timed out")
+    
+    orchestrator = OrchestrationDispatcher()
+    
+    agents = [
+        TimeoutAgent(name="agent1"),
+        TestAgent(name="agent2")
+    ]
+    
+    result = await orchestrator.execute_workflow(
+        agents=agents,
+        task="Test workflow",
+        tags=["test", "timeout"]
+    )
+    
+    assert len(result["outputs"]) == 1
+    assert result["outputs"][0]["status"] == "timeout"
+    assert agents[1].execution_count == 0
 
 
 # ============================================================================
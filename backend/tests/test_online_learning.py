@@ -5,9 +5,10 @@ Tests for the online learning module.
 
 import pytest
 import asyncio
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch, MagicMock
 import json
+import sys
 
 from core.online_learning import (
     AgentPerformanceModel,
@@ -16,7 +17,9 @@ from core.online_learning import (
     UpdateStrategy,
     get_model_updater
 )
-from core.feedback_pipeline import OutcomeEvent, OutcomeStatus, EventSeverity
+from core.feedback_pipeline import OutcomeEvent, OutcomeStatus, EventSeverity, FeedbackPipeline
+from core.action_dispatcher import ActionDispatcher
+from core.base_agent import BaseAgent
 
 
 @pytest.fixture
@@ -99,6 +102,16 @@ class TestAgentPerformanceModel:
         avg_latency = agent_model.get_avg_latency("ReActAgent")
         assert avg_latency == 200.0
     
+    def test_avg_latency_window(self, agent_model, sample_outcome_event):
+        """Test average latency only covers the bounded latency window."""
+        for latency in range(150):
+            sample_outcome_event.latency_ms = float(latency)
+            agent_model.update(sample_outcome_event)
+        
+        stats = agent_model.agent_stats["ReActAgent"]
+        assert len(stats['latencies']) == 100
+        assert agent_model.get_avg_latency("ReActAgent") == pytest.approx(99.5)  # mean(50..149)
+    
     def test_predict_best_agent(self, agent_model, sample_outcome_event):
         """Test agent prediction."""
         # Add data for multiple agents
@@ -115,6 +128,30 @@ class TestAgentPerformanceModel:
         assert all(isinstance(p, tuple) for p in predictions)
         assert all(len(p) == 2 for p in predictions)
     
+    def test_predict_best_agent_ranking(self, agent_model, sample_outcome_event):
+        """Test predictions are ranked and refresh only after updates."""
+        for agent, status in [("GoodAgent", OutcomeStatus.SUCCESS), ("BadAgent", OutcomeStatus.FAILURE)]:
+            sample_outcome_event.agent_name = agent
+            sample_outcome_event.status = status
+            for _ in range(200):
+                agent_model.update(sample_outcome_event)
+        
+        predictions = agent_model.predict_best_agent(top_k=2)
+        
+        assert [name for name, _ in predictions] == ["GoodAgent", "BadAgent"]
+        assert predictions[0][1] >= predictions[1][1]
+        assert not agent_model._dirty
+        assert agent_model._score_params["GoodAgent"][:2] == (201, 1)
+        
+        agent_model.update(sample_outcome_event)
+        assert agent_model._dirty == {"BadAgent"}
+        agent_model.predict_best_agent(top_k=1)
+        assert agent_model._score_params["BadAgent"][:2] == (1, 202)
+        
+        # Agents dropped from agent_stats (e.g. by a full retrain) drop out too
+        del agent_model.agent_stats["GoodAgent"]
+        assert [name for name, _ in agent_model.predict_best_agent(top_k=2)] == ["BadAgent"]
+    
     def test_task_specific_patterns(self, agent_model, sample_outcome_event):
         """Test task-specific pattern learning."""
         sample_outcome_event.action_type = "analysis"
@@ -123,6 +160,17 @@ class TestAgentPerformanceModel:
         assert "analysis" in agent_model.task_patterns
         assert "ReActAgent" in agent_model.task_patterns["analysis"]
     
+    def test_update_interns_keys(self, agent_model, sample_outcome_event):
+        """Test agent names and action types are interned as keys."""
+        sample_outcome_event.agent_name = "".join(["Dynamic", "Agent"])
+        sample_outcome_event.action_type = "".join(["dynamic", "_task"])
+        agent_model.update(sample_outcome_event)
+        
+        agent_key = next(iter(agent_model.agent_stats))
+        task_key = next(iter(agent_model.task_patterns))
+        assert agent_key is sys.intern("DynamicAgent")
+        assert task_key is sys.intern("dynamic_task")
+    
     def test_to_dict(self, agent_model, sample_outcome_event):
         """Test model serialization."""
         agent_model.update(sample_outcome_event)
@@ -219,6 +267,207 @@ class TestRealTimeModelUpdater:
         assert predictions[0][0] == "ReActAgent"
 
 
+@pytest.mark.asyncio
+async def test_processing_loop_batches_polls(tmp_path, sample_outcome_event):
+    """Test the consumer loop polls in batches and processes once per batch."""
+    record = Mock(value=sample_outcome_event.to_json_bytes())
+    polls = [{"tp": [record, record]}, {"tp": [record]}]
+    
+    with patch('core.online_learning.KAFKA_AVAILABLE', True):
+        with patch('core.online_learning.KafkaConsumer'):
+            updater = RealTimeModelUpdater(
+                kafka_servers="localhost:9092",
+                batch_size=3,
+                batch_timeout_seconds=10,
+                model_storage_path=str(tmp_path / "models"),
+                enable_auto_save=False
+            )
+    
+    updater.consumer = Mock()
+    updater.consumer.poll.side_effect = lambda **kwargs: polls.pop(0) if polls else {}
+    updater.running = True
+    
+    task = asyncio.create_task(updater._processing_loop())
+    for _ in range(100):
+        if updater.metrics.samples_processed:
+            break
+        await asyncio.sleep(0.01)
+    updater.running = False
+    await task
+    
+    assert updater.metrics.total_updates == 1
+    assert updater.metrics.samples_processed == 3
+    max_records = [c.kwargs["max_records"] for c in updater.consumer.poll.call_args_list[:2]]
+    assert max_records == [3, 1]
+
+
+@pytest.mark.parametrize("msgspec_enabled,orjson_enabled", [
+    (True, True),
+    (False, True),
+    (False, False),
+])
+def test_decode_outcome_event(tmp_path, sample_outcome_event, msgspec_enabled, orjson_enabled):
+    """Test Kafka payloads decode to the same event with every JSON backend."""
+    import core.online_learning as online_learning
+    
+    if msgspec_enabled and not online_learning.MSGSPEC_AVAILABLE:
+        pytest.skip("msgspec not installed")
+    if orjson_enabled and not online_learning.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    
+    sample_outcome_event.tags = ["a", "b"]
+    sample_outcome_event.context_snapshot = {"user": "u1"}
+    
+    with patch('core.online_learning.KAFKA_AVAILABLE', True):
+        with patch('core.online_learning.KafkaConsumer'):
+            updater = RealTimeModelUpdater(
+                kafka_servers="localhost:9092",
+                model_storage_path=str(tmp_path / "models")
+            )
+    
+    with patch('core.online_learning.MSGSPEC_AVAILABLE', msgspec_enabled):
+        with patch('core.online_learning.ORJSON_AVAILABLE', orjson_enabled):
+            event = updater._decode_outcome_event(sample_outcome_event.to_json_bytes())
+    
+    assert event == sample_outcome_event
+    assert event.status is OutcomeStatus.SUCCESS
+    assert event.severity is EventSeverity.INFO
+    
+    with pytest.raises(ValueError):
+        updater._dict_to_outcome_event({**sample_outcome_event.to_dict(), 'status': 'unknown'})
+
+
+
+class StringOutputAgent(BaseAgent):
+    """Agent returning plain-text output, as most real agents do."""
+    
+    def __init__(self):
+        super().__init__(name="string_agent", agent_type="test")
+    
+    def execute(self, input_data, context):
+        return {"status": "success", "output": f"Processed: {input_data['task']}"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("msgspec_enabled,orjson_enabled", [
+    (True, True),
+    (False, True),
+    (False, False),
+])
+async def test_decode_dispatcher_event(tmp_path, msgspec_enabled, orjson_enabled):
+    """Test events serialized by ActionDispatcher decode with a string output."""
+    import core.online_learning as online_learning
+    
+    if msgspec_enabled and not online_learning.MSGSPEC_AVAILABLE:
+        pytest.skip("msgspec not installed")
+    if orjson_enabled and not online_learning.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    
+    pipeline = FeedbackPipeline(kafka_servers=None, enable_kafka=False)
+    await ActionDispatcher(feedback_pipeline=pipeline).dispatch(
+        agent=StringOutputAgent(),
+        action_type="analysis",
+        input_data={"task": "review"},
+        context={}
+    )
+    [recorded] = pipeline.get_recent_events(count=1)
+    
+    with patch('core.online_learning.KAFKA_AVAILABLE', True):
+        with patch('core.online_learning.KafkaConsumer'):
+            updater = RealTimeModelUpdater(
+                kafka_servers="localhost:9092",
+                model_storage_path=str(tmp_path / "models")
+            )
+    
+    with patch('core.online_learning.MSGSPEC_AVAILABLE', msgspec_enabled):
+        with patch('core.online_learning.ORJSON_AVAILABLE', orjson_enabled):
+            event = updater._decode_outcome_event(recorded.to_json_bytes())
+    
+    assert event.output == "Processed: review"
+    assert event == recorded
+
+
+
+def test_decode_event_without_timestamp_ns(tmp_path, sample_outcome_event):
+    """Test events from producers without timestamp_ns keep their event time."""
+    with patch('core.online_learning.KAFKA_AVAILABLE', True):
+        with patch('core.online_learning.KafkaConsumer'):
+            updater = RealTimeModelUpdater(
+                kafka_servers="localhost:9092",
+                model_storage_path=str(tmp_path / "models")
+            )
+    
+    data = sample_outcome_event.to_dict()
+    del data['timestamp_ns']
+    data['timestamp'] = "2024-05-01T12:30:45.123456"
+    
+    event = updater._decode_outcome_event(json.dumps(data).encode())
+    
+    expected = datetime(2024, 5, 1, 12, 30, 45, 123456, tzinfo=timezone.utc)
+    assert event.timestamp_ns == int(expected.timestamp()) * 10**9 + 123456000
+
+
+@pytest.mark.asyncio
+async def test_process_batch_groups_by_agent(tmp_path, sample_outcome_event):
+    """Test batches keep per-agent order and yield to the loop between agents."""
+    from dataclasses import replace
+    
+    with patch('core.online_learning.KAFKA_AVAILABLE', True):
+        with patch('core.online_learning.KafkaConsumer'):
+            updater = RealTimeModelUpdater(
+                kafka_servers="localhost:9092",
+                model_storage_path=str(tmp_path / "models")
+            )
+    
+    batch = [
+        replace(sample_outcome_event, agent_name=name, latency_ms=latency)
+        for name, latency in [("A", 1.0), ("B", 10.0), ("A", 2.0), ("B", 20.0), ("A", 3.0)]
+    ]
+    model = updater.get_model(ModelType.AGENT_SELECTION)
+    
+    seen_update_counts = []
+    
+    async def observer():
+        seen_update_counts.append(model.update_count)
+    
+    observer_task = asyncio.create_task(observer())
+    await updater._process_batch(batch)
+    await observer_task
+    
+    assert list(model.agent_stats["A"]["latencies"]) == [1.0, 2.0, 3.0]
+    assert list(model.agent_stats["B"]["latencies"]) == [10.0, 20.0]
+    assert updater.metrics.samples_processed == 5
+    assert seen_update_counts == [3]  # Ran after agent A's group, before B's
+
+
+def test_model_persistence_round_trip(tmp_path, sample_outcome_event):
+    """Test models survive _save_models/_load_models."""
+    with patch('core.online_learning.KAFKA_AVAILABLE', True):
+        with patch('core.online_learning.KafkaConsumer'):
+            updater = RealTimeModelUpdater(
+                kafka_servers="localhost:9092",
+                model_storage_path=str(tmp_path / "models")
+            )
+            model = updater.get_model(ModelType.AGENT_SELECTION)
+            for latency in (100.0, 300.0):
+                sample_outcome_event.latency_ms = latency
+                model.update(sample_outcome_event)
+            updater._save_models()
+            
+            loaded = RealTimeModelUpdater(
+                kafka_servers="localhost:9092",
+                model_storage_path=str(tmp_path / "models")
+            ).get_model(ModelType.AGENT_SELECTION)
+    
+    assert loaded is not model
+    assert loaded.update_count == 2
+    assert loaded.get_avg_latency("ReActAgent") == 200.0
+    assert loaded.task_patterns["analysis"]["ReActAgent"] == 1.0
+    
+    # Default factories still work after loading
+    assert loaded.get_success_rate("NewAgent") == 0.5
+
+
 def test_get_model_updater_singleton():
     """Test singleton pattern for model updater."""
     with patch('core.online_learning.KAFKA_AVAILABLE', True):
@@ -4,8 +4,10 @@ Tests for Performance Monitor.
 """
 
 import pytest
+import threading
 import time
-from datetime import datetime, timedelta
+from dataclasses import FrozenInstanceError, asdict
+from datetime import datetime, timedelta, timezone
 
 from core.performance_monitor import (
     PerformanceMonitor,
@@ -102,6 +104,9 @@ class TestPerformanceMonitor:
                     cost=0.05
                 )
         
+        # Staged runs are visible without waiting for a drain
+        assert self.monitor.get_agent_names() == ["agent_1", "agent_2"]
+        
         # Get agent metrics
         agent1_perf = self.monitor.get_agent_metrics("agent_1")
         agent2_perf = self.monitor.get_agent_metrics("agent_2")
@@ -113,6 +118,22 @@ class TestPerformanceMonitor:
         assert agent2_perf.agent_name == "agent_2"
         assert agent2_perf.metrics.total_tasks == 5
     
+    def test_recommendations_with_staged_new_agent(self):
+        """Test recommendations tolerate agents first seen in staged runs."""
+        self.monitor.record_agent_run(
+            run_id="run_1", agent_name="agent_1", agent_type="react",
+            status="success", duration_ms=1000
+        )
+        self.monitor.get_agent_names()
+        self.monitor.record_agent_run(
+            run_id="run_2", agent_name="agent_2", agent_type="react",
+            status="failure", duration_ms=1000
+        )
+        
+        recommendations = self.monitor._generate_recommendations(PerformanceMetrics())
+        
+        assert any("agent_2" in r for r in recommendations)
+    
     def test_accuracy_recording(self):
         """Test accuracy measurement recording."""
         self.monitor.record_accuracy(
@@ -151,6 +172,16 @@ class TestPerformanceMonitor:
         )
         assert 0.5 < score < 1.0
     
+    def test_numeric_accuracy_score_edge_cases(self):
+        """Test the numeric accuracy kernel on zero and far-off values."""
+        monitor = self.monitor
+        
+        assert monitor._calculate_accuracy_score(0, 0) == 1.0
+        assert monitor._calculate_accuracy_score(5, 0) == 0.0
+        assert monitor._calculate_accuracy_score(300, 100) == 0.0
+        assert monitor._calculate_accuracy_score(90, 100) == pytest.approx(0.9)
+        assert monitor._calculate_accuracy_score(1.5, 2) == pytest.approx(0.75)
+    
     def test_alert_generation(self):
         """Test alert generation for threshold violations."""
         # Record events that should trigger alerts
@@ -175,6 +206,25 @@ class TestPerformanceMonitor:
         latency_alerts = [a for a in alerts if a.metric_type == MetricType.LATENCY]
         assert len(latency_alerts) > 0
     
+    def test_alerts_are_immutable(self):
+        """Test alert history is bounded and shared instances cannot be changed."""
+        for i in range(105):
+            self.monitor.record_agent_run(
+                run_id=f"run_{i}",
+                agent_name="slow_agent",
+                agent_type="react",
+                status="success",
+                duration_ms=6000
+            )
+        
+        alerts = self.monitor.get_alerts(limit=100)
+        assert len(alerts) == 100
+        assert alerts[-1].alert_id == "latency_run_104"
+        assert alerts[0].alert_id == "latency_run_5"
+        
+        with pytest.raises(FrozenInstanceError):
+            alerts[0].message = "changed"
+    
     def test_health_score(self):
         """Test health score calculation."""
         # Record good performance
@@ -193,6 +243,25 @@ class TestPerformanceMonitor:
         
         assert 80 <= health_score <= 100  # Should be high for good performance
     
+    def test_health_score_components(self):
+        """Test each health score component at its bounds."""
+        assert self.monitor._calculate_health_score(PerformanceMetrics()) == 100.0
+        
+        perfect = PerformanceMetrics(total_tasks=10, success_rate=1.0, avg_accuracy=1.0)
+        assert self.monitor._calculate_health_score(perfect) == 100.0
+        
+        # Latency and error penalties floor at zero; no accuracy data scores 10
+        degraded = PerformanceMetrics(
+            total_tasks=10, success_rate=0.5, avg_latency_ms=20000, error_rate=0.5
+        )
+        assert self.monitor._calculate_health_score(degraded) == pytest.approx(30.0)
+        
+        partial = PerformanceMetrics(
+            total_tasks=10, success_rate=0.5, avg_latency_ms=2000,
+            error_rate=0.1, avg_accuracy=0.5
+        )
+        assert self.monitor._calculate_health_score(partial) == pytest.approx(20 + 24 + 10 + 5)
+    
     def test_report_generation(self):
         """Test comprehensive report generation."""
         # Record some events
@@ -243,8 +312,10 @@ class TestPerformanceMonitor:
     def test_time_window_filtering(self):
         """Test time window filtering of metrics."""
         # Record old event (outside window)
+        old_time = datetime.utcnow() - timedelta(hours=3)
         old_event = {
-            "timestamp": (datetime.utcnow() - timedelta(hours=3)).isoformat(),
+            "timestamp": old_time.isoformat(),
+            "timestamp_ns": int(old_time.replace(tzinfo=timezone.utc).timestamp() * 1e9),
             "run_id": "old_run",
             "agent_name": "test_agent",
             "agent_type": "react",
@@ -272,7 +343,7 @@ class TestPerformanceMonitor:
         
         # Add old event manually
         with self.monitor._lock:
-            self.monitor._metrics_buffer.append(old_event)
+            self.monitor._append_raw(old_event)
         
         # Get metrics with 60-minute window
         metrics = self.monitor.get_system_metrics(time_window_minutes=60)
@@ -280,6 +351,231 @@ class TestPerformanceMonitor:
         # Should only include recent event
         assert metrics.total_tasks == 1
     
+    def test_columnar_metrics_match_event_metrics(self):
+        """Test vectorized system metrics agree with the per-event calculation."""
+        for i in range(20):
+            self.monitor.record_agent_run(
+                run_id=f"run_{i}",
+                agent_name=f"agent_{i % 3}",
+                agent_type="react",
+                status=("success", "failure", "partial", "skipped")[i % 4],
+                duration_ms=500 + 37 * i,
+                tokens_used=100 + i,
+                cost=0.01 * i,
+                memory_mb=64.0 if i % 2 else None,
+                quality_score=0.5 + i / 100 if i % 3 else None,
+                confidence=0.9 if i % 5 else None,
+                error_type="timeout" if i % 7 == 0 else None,
+                metadata={"retry_count": i % 4}
+            )
+        
+        self.monitor.record_accuracy(
+            agent_name="agent_0",
+            task_id="run_3",
+            predicted_outcome=90,
+            actual_outcome=100
+        )
+        
+        self.monitor._flush_staging()
+        events = [e for runs in self.monitor._agent_metrics.values() for e in runs]
+        events.sort(key=lambda e: int(e["run_id"].split("_")[1]))
+        
+        expected = asdict(self.monitor._calculate_metrics(events))
+        actual = asdict(self.monitor.get_system_metrics())
+        
+        assert actual.keys() == expected.keys()
+        for key, value in expected.items():
+            if isinstance(value, float):
+                assert actual[key] == pytest.approx(value), key
+            else:
+                assert actual[key] == value, key
+    
+    def test_metrics_buffer_wraps(self):
+        """Test the metrics buffer keeps only the most recent runs."""
+        monitor = PerformanceMonitor(metrics_buffer_size=5, enable_auto_alerts=False)
+        
+        for i in range(8):
+            monitor.record_agent_run(
+                run_id=f"run_{i}",
+                agent_name="test_agent",
+                agent_type="react",
+                status="success" if i >= 5 else "failure",
+                duration_ms=100 * (i + 1)
+            )
+        
+        metrics = monitor.get_system_metrics()
+        
+        assert monitor.get_stats()["events_buffered"] == 5
+        assert metrics.total_tasks == 5
+        assert metrics.successful_tasks == 3
+        assert metrics.failed_tasks == 2
+        assert metrics.max_latency_ms == 800
+        assert metrics.window_end == monitor._agent_metrics["test_agent"][-1]["timestamp"]
+    
+    def test_window_accuracy_tracks_buffered_runs(self):
+        """Test system accuracy only counts measurements for runs still buffered."""
+        monitor = PerformanceMonitor(metrics_buffer_size=3, enable_auto_alerts=False)
+        
+        for i in range(5):
+            monitor.record_agent_run(
+                run_id=f"run_{i}",
+                agent_name="test_agent",
+                agent_type="react",
+                status="success",
+                duration_ms=100
+            )
+            monitor.record_accuracy(
+                agent_name="test_agent",
+                task_id=f"run_{i}",
+                predicted_outcome=1.0,
+                actual_outcome=1.0 if i >= 2 else 0.0
+            )
+        
+        metrics = monitor.get_system_metrics()
+        
+        assert metrics.total_tasks == 3
+        assert metrics.avg_accuracy == 1.0
+        assert sorted(monitor._run_slots) == ["run_2", "run_3", "run_4"]
+    
+    def test_agent_history_is_bounded(self, monkeypatch):
+        """Test per-agent histories keep only the most recent runs."""
+        monkeypatch.setattr("core.performance_monitor._AGENT_HISTORY_SIZE", 3)
+        monitor = PerformanceMonitor(enable_auto_alerts=False)
+        
+        for i in range(5):
+            monitor.record_agent_run(
+                run_id=f"run_{i}",
+                agent_name="test_agent",
+                agent_type="react",
+                status="success",
+                duration_ms=100
+            )
+        
+        monitor._flush_staging()
+        history = monitor._agent_metrics["test_agent"]
+        assert [e["run_id"] for e in history] == ["run_2", "run_3", "run_4"]
+        
+        monitor._cleanup_old_data()
+        assert monitor._agent_metrics["test_agent"].maxlen == 3
+        assert len(monitor._agent_metrics["test_agent"]) == 3
+    
+    def test_concurrent_recording_is_staged(self, monkeypatch):
+        """Test runs from concurrent producers all reach the buffers."""
+        monkeypatch.setattr("core.performance_monitor._STAGING_DRAIN_SIZE", 8)
+        monitor = PerformanceMonitor(enable_auto_alerts=False)
+        
+        def produce(worker):
+            for i in range(50):
+                monitor.record_agent_run(
+                    run_id=f"run_{worker}_{i}",
+                    agent_name=f"agent_{worker}",
+                    agent_type="react",
+                    status="success",
+                    duration_ms=100
+                )
+        
+        threads = [threading.Thread(target=produce, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        metrics = monitor.get_system_metrics()
+        assert len(monitor._staging) == 0
+        assert metrics.total_tasks == 200
+        assert all(len(monitor._agent_metrics[f"agent_{w}"]) == 50 for w in range(4))
+        
+        # With no reader, a producer drains the queue once it reaches the threshold
+        for i in range(7):
+            monitor.record_agent_run(f"extra_{i}", "agent_0", "react", "success", 100)
+        assert len(monitor._staging) == 7
+        monitor.record_agent_run("extra_7", "agent_0", "react", "success", 100)
+        assert len(monitor._staging) == 0
+    
+    def test_running_totals_track_buffer(self):
+        """Test running totals match a full recount after ring overwrites."""
+        monitor = PerformanceMonitor(metrics_buffer_size=7, enable_auto_alerts=False)
+        
+        for i in range(30):
+            monitor.record_agent_run(
+                run_id=f"run_{i}",
+                agent_name="test_agent",
+                agent_type="react",
+                status=("success", "failure", "partial")[i % 3],
+                duration_ms=10.0 * i,
+                tokens_used=i,
+                cost=0.1 * i,
+                memory_mb=float(i % 2),
+                quality_score=0.5 if i % 4 else None,
+                error_type="timeout" if i % 5 == 0 else None
+            )
+        
+        with monitor._lock:
+            expected = monitor._column_totals(monitor._buffer_slots())
+        
+        assert monitor._totals.keys() == expected.keys()
+        for key, value in expected.items():
+            assert monitor._totals[key] == pytest.approx(value), key
+    
+    def test_time_window_search_across_wrap(self):
+        """Test binary-searched time windows on a wrapped, time-ordered buffer."""
+        monitor = PerformanceMonitor(metrics_buffer_size=4, enable_auto_alerts=False)
+        now = datetime.utcnow()
+        
+        with monitor._lock:
+            for i, hours_ago in enumerate([6, 5, 4, 3, 2, 1]):
+                monitor._append_raw({
+                    "timestamp": (now - timedelta(hours=hours_ago)).isoformat(),
+                    "run_id": f"run_{i}",
+                    "agent_name": "test_agent",
+                    "status": "success",
+                    "duration_ms": 100.0 * i
+                })
+        
+        assert monitor._buffer_sorted
+        assert monitor.get_system_metrics(time_window_minutes=90).total_tasks == 1
+        assert monitor.get_system_metrics(time_window_minutes=150).total_tasks == 2
+        assert monitor.get_system_metrics(time_window_minutes=210).total_tasks == 3
+        assert monitor.get_system_metrics(time_window_minutes=600).total_tasks == 4
+        assert monitor.get_system_metrics(time_window_minutes=30).total_tasks == 0
+        
+        # An out-of-order append drops to the masked scan
+        with monitor._lock:
+            monitor._append_raw({
+                "timestamp": (now - timedelta(hours=10)).isoformat(),
+                "run_id": "late_run",
+                "agent_name": "test_agent",
+                "status": "success",
+                "duration_ms": 100.0
+            })
+        
+        assert not monitor._buffer_sorted
+        assert monitor.get_system_metrics(time_window_minutes=210).total_tasks == 3
+    
+    def test_success_rate_bitmap(self):
+        """Test the bitmap success rate agrees with the full metrics."""
+        monitor = PerformanceMonitor(metrics_buffer_size=21, enable_auto_alerts=False)
+        
+        for i in range(50):
+            monitor.record_agent_run(
+                run_id=f"run_{i}",
+                agent_name="test_agent",
+                agent_type="react",
+                status="success" if i % 3 else "failure",
+                duration_ms=100
+            )
+            
+            expected = monitor.get_system_metrics().success_rate
+            assert monitor.get_success_rate() == pytest.approx(expected)
+        
+        assert monitor._count_successes(0, 21) == int(round(21 * monitor.get_success_rate()))
+        
+        monitor._cleanup_old_data()
+        assert monitor.get_success_rate() == pytest.approx(
+            monitor.get_system_metrics().success_rate
+        )
+        assert PerformanceMonitor().get_success_rate() == 0.0
+    
     def test_agent_performance_scores(self):
         """Test agent performance score calculations."""
         # Record high-quality, consistent performance
@@ -306,8 +602,10 @@ class TestPerformanceMonitor:
         """Test old data cleanup."""
         # Record many old events
         for i in range(100):
+            old_time = datetime.utcnow() - timedelta(days=2)
             old_event = {
-                "timestamp": (datetime.utcnow() - timedelta(days=2)).isoformat(),
+                "timestamp": old_time.isoformat(),
+                "timestamp_ns": int(old_time.replace(tzinfo=timezone.utc).timestamp() * 1e9),
                 "run_id": f"old_run_{i}",
                 "agent_name": "test_agent",
                 "agent_type": "react",
@@ -323,7 +621,7 @@ class TestPerformanceMonitor:
                 "metadata": {}
             }
             with self.monitor._lock:
-                self.monitor._metrics_buffer.append(old_event)
+                self.monitor._append_raw(old_event)
         
         initial_count = self.monitor.get_stats()["events_buffered"]
         
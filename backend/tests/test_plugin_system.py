@@ -7,17 +7,21 @@ import unittest
 import os
 import tempfile
 import shutil
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 from core.plugin_base import (
     PluginInterface,
     PluginMetadata,
     PluginCapability,
-    PluginPermission
+    PluginPermission,
+    perm_mask,
+    perm_names
 )
 from core.plugin_security import PluginSignature, PluginSandbox, PluginValidator
 from core.plugin_loader import PluginLoader
-from core.plugin_registry import PluginRegistry
+from core.plugin_registry import PluginRegistry, PluginRegistryEntry
 from core.plugin_service import PluginService
 
 
@@ -137,6 +141,19 @@ class TestPlugin(PluginInterface):
         
         self.assertTrue(is_valid)
     
+    def test_plugin_content_hash_cache(self):
+        """Test plugin content hashes are reused until the file changes"""
+        signature_handler = PluginSignature()
+        
+        first = signature_handler._content_hash(self.test_plugin_path)
+        self.assertIn(self.test_plugin_path, signature_handler._digest_cache)
+        self.assertEqual(signature_handler._content_hash(self.test_plugin_path), first)
+        
+        with open(self.test_plugin_path, 'a') as f:
+            f.write('\n# modified\n')
+        
+        self.assertNotEqual(signature_handler._content_hash(self.test_plugin_path), first)
+    
     def test_sandbox_import_validation(self):
         """Test sandbox import validation"""
         sandbox = PluginSandbox()
@@ -145,6 +162,24 @@ class TestPlugin(PluginInterface):
         is_valid = sandbox.validate_plugin_imports(self.test_plugin_path)
         self.assertTrue(is_valid)
     
+    def test_sandbox_rejects_restricted_imports(self):
+        """Test sandbox import validation flags restricted modules"""
+        sandbox = PluginSandbox()
+        cases = {
+            'import os\n': False,
+            'import json, subprocess\n': False,
+            'from os.path import join\n': False,
+            'def f():\n    import sys\n': False,
+            'import ossify\n': True,
+            'text = "import os"\n': True,
+            'import os\nthis is not python(\n': False,
+        }
+        
+        for source, expected in cases.items():
+            with open(self.test_plugin_path, 'w') as f:
+                f.write(source)
+            self.assertEqual(sandbox.validate_plugin_imports(self.test_plugin_path), expected, source)
+    
     def test_permission_validation(self):
         """Test permission validation"""
         sandbox = PluginSandbox()
@@ -159,6 +194,27 @@ class TestPlugin(PluginInterface):
         granted_insufficient = ['file_read']
         is_valid = sandbox.validate_plugin_permissions(required, granted_insufficient)
         self.assertFalse(is_valid)
+    
+    def test_permission_masks(self):
+        """Test permission bitmasks accept enum members and custom names"""
+        sandbox = PluginSandbox()
+        
+        self.assertEqual(
+            perm_mask([PluginPermission.FILE_READ, 'file_write']),
+            perm_mask(['file_write', 'file_read', 'file_read'])
+        )
+        self.assertEqual(
+            perm_names(perm_mask(['network_access'])), ['network_access']
+        )
+        
+        # Permissions outside the enum still participate in validation
+        self.assertTrue(sandbox.validate_plugin_permissions(
+            ['custom_scope'], ['file_read', 'custom_scope']
+        ))
+        self.assertFalse(sandbox.validate_plugin_permissions(
+            ['custom_scope', 'file_read'], ['file_read', 'other_scope']
+        ))
+        self.assertTrue(sandbox.validate_plugin_permissions([], []))
 
 
 class TestPluginRegistry(unittest.TestCase):
@@ -209,6 +265,63 @@ class TestPluginRegistry(unittest.TestCase):
         self.assertIn('total_plugins', stats)
         self.assertIn('active_plugins', stats)
         self.assertIn('total_downloads', stats)
+    
+    def _add_entry(self, name, version):
+        """Add an entry directly, bypassing plugin validation"""
+        metadata = PluginMetadata(
+            name=name,
+            version=version,
+            author="Test Author",
+            description="Test plugin",
+            capabilities=[PluginCapability.DATA_PROCESSING],
+            required_permissions=[PluginPermission.FILE_READ]
+        )
+        entry = PluginRegistryEntry(
+            metadata=metadata,
+            file_path=self.test_plugin_path,
+            signature="sig",
+            file_hash="hash",
+            registered_at=datetime.utcnow()
+        )
+        self.registry.plugins.setdefault(name, {})[version] = entry
+        self.registry._append_journal([entry])
+    
+    def test_registry_journal_replay(self):
+        """Test changes are journaled and replayed on load"""
+        self._add_entry("journaled", "1.0.0")
+        self._add_entry("journaled", "1.1.0")
+        self.registry.increment_download_count("journaled", "1.0.0")
+        self.registry.increment_download_count("journaled", "1.0.0")
+        self.registry.unregister_plugin("journaled", "1.1.0")
+        
+        with open(self.registry.journal_file) as f:
+            self.assertEqual(len(f.readlines()), 5)
+        
+        # A torn final line is skipped rather than failing the load
+        with open(self.registry.journal_file, 'a') as f:
+            f.write('{"metadata": {"na')
+        
+        reloaded = PluginRegistry(registry_dir=self.temp_dir)
+        self.assertEqual(reloaded.get_plugin("journaled", "1.0.0").download_count, 2)
+        self.assertEqual(reloaded.get_plugin("journaled", "1.1.0").status, "inactive")
+        self.assertEqual(reloaded.get_plugin("journaled").metadata.version, "1.0.0")
+        self.assertEqual(reloaded.get_registry_stats()['total_versions'], 2)
+    
+    def test_registry_journal_compaction(self):
+        """Test the journal folds into the registry file once it grows"""
+        with patch('core.plugin_registry._JOURNAL_COMPACT_MIN', 3):
+            self._add_entry("compacted", "1.0.0")
+            for _ in range(3):
+                self.registry.increment_download_count("compacted", "1.0.0")
+            
+            self.assertTrue(self.registry.registry_file.exists())
+            self.assertFalse(self.registry.journal_file.exists())
+            
+            self.registry.increment_download_count("compacted", "1.0.0")
+            self.assertTrue(self.registry.journal_file.exists())
+        
+        reloaded = PluginRegistry(registry_dir=self.temp_dir)
+        self.assertEqual(reloaded.get_plugin("compacted", "1.0.0").download_count, 4)
 
 
 class TestPluginService(unittest.TestCase):
@@ -5,6 +5,7 @@ Tests for Self-Triggered CI/CD Update System
 
 import pytest
 import asyncio
+from dataclasses import replace
 from datetime import datetime, timedelta
 
 from core.version_detector import (
@@ -27,31 +28,46 @@ from core.cicd_integrator import CICDIntegrator
 from core.rollout_controller import (
     RolloutController,
     RolloutConfig,
-    RolloutStrategy
+    RolloutStrategy,
+    RolloutPhase
 )
 from core.self_update_orchestrator import SelfUpdateOrchestrator
 
 
+@pytest.fixture(scope="module")
+def detector():
+    """Detector with test_component registered, shared by the module's tests"""
+    detector = VersionDetector(check_interval=60)
+    detector.register_current_version("test_component", "1.0.0")
+    return detector
+
+
+@pytest.fixture
+def simulator():
+    """Fresh simulator (its semaphore must not outlive a test's event loop)"""
+    return UpdateSimulator()
+
+
+@pytest.fixture
+def engine():
+    """Fresh policy engine (tests add policies)"""
+    return UpdatePolicyEngine()
+
+
 class TestVersionDetector:
     """Test version detection"""
     
     @pytest.mark.asyncio
-    async def test_version_detection(self):
+    async def test_version_detection(self, detector):
         """Test detecting versions"""
-        detector = VersionDetector(check_interval=60)
-        detector.register_current_version("test_component", "1.0.0")
-        
         updates = await detector.check_for_updates()
         
         assert isinstance(updates, dict)
         assert detector.last_check is not None
     
     @pytest.mark.asyncio
-    async def test_version_comparison(self):
+    async def test_version_comparison(self, detector):
         """Test version comparison"""
-        detector = VersionDetector(check_interval=60)
-        detector.register_current_version("test_component", "1.0.0")
-        
         await detector.check_for_updates()
         
         comparison = detector.compare_versions("test_component")
@@ -60,11 +76,30 @@ class TestVersionDetector:
         assert comparison.component == "test_component"
         assert comparison.current_version == "1.0.0"
     
-    def test_critical_updates(self):
-        """Test getting critical updates"""
-        detector = VersionDetector(check_interval=60)
-        detector.register_current_version("test_component", "1.0.0")
+    @pytest.mark.asyncio
+    async def test_source_results_cached(self):
+        """Test repeated checks reuse recent source results"""
+        detector = VersionDetector(check_interval=60, sources=[UpdateSource.GIT_REPOSITORY])
+        
+        calls = []
+        original = detector._check_source
+        
+        async def counting_check(source):
+            calls.append(source)
+            return await original(source)
         
+        detector._check_source = counting_check
+        
+        first = await detector.check_for_updates()
+        second = await detector.check_for_updates()
+        assert second == first
+        assert len(calls) == 1
+        
+        await detector.check_for_updates(force=True)
+        assert len(calls) == 2
+    
+    def test_critical_updates(self, detector):
+        """Test getting critical updates"""
         critical = detector.get_critical_updates()
         
         assert isinstance(critical, list)
@@ -74,10 +109,8 @@ class TestUpdateSimulator:
     """Test update simulation"""
     
     @pytest.mark.asyncio
-    async def test_simulation(self):
+    async def test_simulation(self, simulator):
         """Test running simulation"""
-        simulator = UpdateSimulator()
-        
         version_info = VersionInfo(
             version="2.0.0",
             component="test_component",
@@ -100,23 +133,30 @@ class TestUpdateSimulator:
         assert result.tests_run > 0
     
     @pytest.mark.asyncio
-    async def test_batch_simulation(self):
+    async def test_batch_simulation(self, simulator):
         """Test batch simulation"""
-        simulator = UpdateSimulator()
-        
+        # Shared fields come from one template; only per-update fields vary
+        template = VersionInfo(
+            version="2.0.0",
+            component="component_0",
+            source=UpdateSource.GIT_REPOSITORY,
+            priority=UpdatePriority.MEDIUM,
+            release_date=datetime.utcnow(),
+            changelog="Update 0",
+            download_url="https://example.com/v2.0.0",
+            checksum="abc0",
+            dependencies=[],
+            breaking_changes=False,
+            metadata={}
+        )
         version_infos = [
-            VersionInfo(
+            replace(
+                template,
                 version=f"2.{i}.0",
                 component=f"component_{i}",
-                source=UpdateSource.GIT_REPOSITORY,
-                priority=UpdatePriority.MEDIUM,
-                release_date=datetime.utcnow(),
                 changelog=f"Update {i}",
                 download_url=f"https://example.com/v2.{i}.0",
-                checksum=f"abc{i}",
-                dependencies=[],
-                breaking_changes=False,
-                metadata={}
+                checksum=f"abc{i}"
             )
             for i in range(3)
         ]
@@ -129,10 +169,8 @@ class TestUpdateSimulator:
 class TestUpdatePolicyEngine:
     """Test policy engine"""
     
-    def test_policy_evaluation(self):
+    def test_policy_evaluation(self, engine):
         """Test evaluating policies"""
-        engine = UpdatePolicyEngine()
-        
         version_info = VersionInfo(
             version="2.0.0",
             component="test_component",
@@ -168,10 +206,8 @@ class TestUpdatePolicyEngine:
             UpdateDecision.MANUAL_REVIEW
         ]
     
-    def test_custom_policy(self):
+    def test_custom_policy(self, engine):
         """Test adding custom policy"""
-        engine = UpdatePolicyEngine()
-        
         custom_policy = UpdatePolicy(
             name="test_policy",
             enabled=True,
@@ -259,6 +295,40 @@ class TestRolloutController:
         assert status.component == "test_component"
         
         await controller.stop()
+    
+    @pytest.mark.asyncio
+    async def test_continuous_rollout(self):
+        """Test continuous rollout advances once each step is healthy"""
+        controller = RolloutController()
+        
+        config = RolloutConfig(
+            strategy=RolloutStrategy.CONTINUOUS,
+            canary_percentage=10,
+            monitoring_duration_seconds=60,
+            health_check_interval=1,
+            error_threshold=0.05,
+            auto_rollback_enabled=True,
+            progressive_steps=[100, 50],
+            min_soak_seconds=1,
+            healthy_checks_required=1
+        )
+        
+        status = await controller.start_rollout(
+            "test_component",
+            "2.0.0",
+            config
+        )
+        
+        assert status.strategy == RolloutStrategy.CONTINUOUS
+        
+        # Far shorter than two full monitoring windows
+        for _ in range(100):
+            if status.phase in (RolloutPhase.COMPLETE, RolloutPhase.FAILED):
+                break
+            await asyncio.sleep(0.1)
+        
+        assert status.phase == RolloutPhase.COMPLETE
+        assert status.current_percentage == 100
 
 
 class TestSelfUpdateOrchestrator:
@@ -0,0 +1,34 @@
+"""
+Tests for task queue dispatch of compliance workflows.
+
+Tests cover:
+- Enqueueing on the Celery task when a broker is configured
+- Falling back to in-process execution when it is not
+"""
+
+import json
+import os
+from unittest.mock import Mock, patch
+
+# config.settings validates these at import time
+os.environ.setdefault("SECRET_KEY", "workflow-tasks-test-secret")
+os.environ.setdefault("API_KEYS", json.dumps(["workflow-tasks-test-key"]))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from workflows.tasks import dispatch_compliance_workflow
+
+
+def test_dispatch_enqueues_when_queue_configured():
+    """Test the workflow is handed to the Celery task with its arguments."""
+    task = Mock()
+    with patch("workflows.tasks.run_compliance_workflow", task):
+        enqueued = dispatch_compliance_workflow("run-1", "Review retention", {"bypass_cache": True})
+    
+    assert enqueued is True
+    task.delay.assert_called_once_with("run-1", "Review retention", {"bypass_cache": True})
+
+
+def test_dispatch_falls_back_without_queue():
+    """Test the caller is told to run the workflow itself when no queue exists."""
+    with patch("workflows.tasks.run_compliance_workflow", None):
+        assert dispatch_compliance_workflow("run-1", "Review retention") is False
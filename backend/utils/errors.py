@@ -6,37 +6,43 @@ Custom exception classes for the platform.
 class PlatformError(Exception):
     """Base exception for all platform errors."""
     
+    __slots__ = ("message", "details")
+    
     def __init__(self, message: str, details: dict = None):
         self.message = message
-        self.details = details or {}
+        self.details = details if details is not None else {}
         super().__init__(self.message)
+    
+    def __reduce__(self):
+        # Slots are not part of BaseException's pickled state
+        return (type(self), (self.message, self.details))
 
 
 class AgentError(PlatformError):
     """Raised when an agent encounters an error during execution."""
-    pass
+    __slots__ = ()
 
 
 class CommunicationError(PlatformError):
     """Raised when inter-agent communication fails."""
-    pass
+    __slots__ = ()
 
 
 class LLMError(PlatformError):
     """Raised when LLM provider encounters an error."""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(PlatformError):
     """Raised when configuration is invalid or missing."""
-    pass
+    __slots__ = ()
 
 
 class DatabaseError(PlatformError):
     """Raised when database operations fail."""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(PlatformError):
     """Raised when data validation fails."""
-    pass
+    __slots__ = ()
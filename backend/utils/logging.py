@@ -4,50 +4,134 @@ Logging configuration and utilities.
 
 import logging
 import sys
-from typing import Optional
+from typing import Optional, Tuple
 from pythonjsonlogger import jsonlogger
 
 from config.settings import get_settings
 
+# orjson (optional) serializes log records several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+class _SecondCachedTimeMixin:
+    """
+    Reuse the formatted asctime for records within the same second.
+    
+    Our datefmt has second resolution, so the strftime result only changes
+    once per second; the last one is kept as a (second, text) pair.
+    """
+    
+    _time_cache: Tuple[Optional[int], str] = (None, "")
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            # The default format includes milliseconds
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._time_cache = (second, text)
+        return text
+
+
+class _JsonFormatter(_SecondCachedTimeMixin, jsonlogger.JsonFormatter):
+    """JsonFormatter with per-second asctime caching."""
+
+
+class _TextFormatter(_SecondCachedTimeMixin, logging.Formatter):
+    """Formatter with per-second asctime caching."""
+
+
+class OrjsonFormatter(_JsonFormatter):
+    """JsonFormatter that serializes records with orjson."""
+    
+    # Same fallback as the stdlib encoder path (tracebacks, exceptions, str())
+    _fallback_default = staticmethod(jsonlogger.JsonEncoder().default)
+    
+    def jsonify_log_record(self, log_record):
+        return orjson.dumps(
+            log_record,
+            default=self._fallback_default,
+            option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+
+# Formatters hold no per-call state, so every setup_logging call shares these
+_JSON_FORMATTER = (OrjsonFormatter if ORJSON_AVAILABLE else _JsonFormatter)(
+    fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+_TEXT_FORMATTER = _TextFormatter(
+    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# (numeric level, format type) applied by the last setup_logging call,
+# and the console handler it installed on the root logger
+_configured: Optional[Tuple[int, str]] = None
+_console_handler: Optional[logging.Handler] = None
+
 
 def setup_logging(log_level: Optional[str] = None, log_format: Optional[str] = None) -> None:
     """
     Configure application logging.
     
+    Repeated calls with the same resolved level and format are no-ops
+    while the handler they installed is still attached.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_format: Format type ('json' or 'text')
     """
-    settings = get_settings()
-    level = log_level or settings.log_level
-    format_type = log_format or settings.log_format
+    global _configured, _console_handler
+    
+    if log_level is None or log_format is None:
+        settings = get_settings()
+        level = log_level or settings.log_level
+        format_type = log_format or settings.log_format
+    else:
+        level, format_type = log_level, log_format
+    
+    numeric_level = logging.getLevelNamesMapping()[level.upper()]
     
     # Create root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, level.upper()))
+    if (
+        _configured == (numeric_level, format_type)
+        and root_logger.handlers == [_console_handler]
+    ):
+        return
+    
+    root_logger.setLevel(numeric_level)
+    
+    # Our formats never show thread/process fields, so skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
     # Remove existing handlers
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    root_logger.handlers.clear()
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
+    console_handler.setLevel(numeric_level)
     
     # Set formatter based on format type
     if format_type == "json":
-        formatter = jsonlogger.JsonFormatter(
-            fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        console_handler.setFormatter(_JSON_FORMATTER)
     else:
-        formatter = logging.Formatter(
-            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        console_handler.setFormatter(_TEXT_FORMATTER)
     
-    console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
+    _configured = (numeric_level, format_type)
+    _console_handler = console_handler
     
     # Suppress noisy third-party loggers
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -60,6 +144,10 @@ def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
     
+    f-string messages are built before the level check, so on hot paths
+    guard debug calls with ``if logger.isEnabledFor(logging.DEBUG):``;
+    the logger caches that check until levels are reconfigured.
+    
     Args:
         name: Logger name (typically __name__)
         
@@ -104,7 +104,7 @@ def verify_functionality():
     except Exception as e:
         print_check(f"Functionality test failed: {e}", False)
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
 def verify_mini_learning():
@@ -143,24 +143,32 @@ def verify_mini_learning():
         )
         print_check("Created learning coordinator")
         
-        # Run mini loop (2 iterations)
-        print("\n  Running 2-iteration learning loop...")
-        report = coordinator.start_exponential_learning_loop(
+        # Run mini loop (2 iterations), stopping at the first empty iteration
+        print("\n  Running 2-iteration learning loop...", flush=True)
+        completed = 0
+        multiplier = 0.0
+        for record in coordinator.iter_exponential_learning_loop(
             iterations=2,
             batch_size=2,
             report_every=1
-        )
+        ):
+            if not record['performance']['total_tasks']:
+                print_check(f"Iteration {record['iteration']} executed no tasks", False)
+                return False
+            
+            completed += 1
+            multiplier = record['multiplier']
         
-        print_check(f"Completed {report['summary']['iterations_completed']} iterations")
-        print_check(f"Executed {report['summary']['total_tasks_executed']} tasks")
-        print_check(f"Final multiplier: {report['performance']['final_multiplier']:.2f}x")
+        print_check(f"Completed {completed} iterations")
+        print_check(f"Executed {coordinator.learning_stats['tasks_executed']} tasks")
+        print_check(f"Final multiplier: {multiplier:.2f}x")
         
         return True
         
     except Exception as e:
         print_check(f"Mini learning loop failed: {e}", False)
         import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
 def verify_api_endpoints():
@@ -170,7 +178,7 @@ def verify_api_endpoints():
     try:
         from api.routes.exponential_learning_routes import router
         
-        routes = [route.path for route in router.routes]
+        routes = {route.path for route in router.routes}
         
         expected_endpoints = [
             "/api/learning/deploy",
@@ -187,7 +195,7 @@ def verify_api_endpoints():
             exists = endpoint in routes
             print_check(f"{endpoint}", exists)
         
-        print(f"\n  Total endpoints: {len(routes)}")
+        print(f"\n  Total endpoints: {len(router.routes)}")
         
         return True
         
@@ -197,18 +205,29 @@ def verify_api_endpoints():
 
 def main():
     """Run all verifications."""
+    # Block-buffer stdout so each section reaches the terminal in one write
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     print("\n╔════════════════════════════════════════════════════════════════╗")
     print("║     EXPONENTIAL LEARNING SYSTEM VERIFICATION                   ║")
     print("╚════════════════════════════════════════════════════════════════╝")
     
-    results = []
+    sections = [
+        ("Files", verify_files),
+        ("Imports", verify_imports),
+        ("Functionality", verify_functionality),
+        ("API Endpoints", verify_api_endpoints),
+        ("Mini Learning Loop", verify_mini_learning),
+    ]
     
-    # Run verifications
-    results.append(("Files", verify_files()))
-    results.append(("Imports", verify_imports()))
-    results.append(("Functionality", verify_functionality()))
-    results.append(("API Endpoints", verify_api_endpoints()))
-    results.append(("Mini Learning Loop", verify_mini_learning()))
+    # Run verifications, writing each section's output in a single flush
+    results = []
+    for name, check in sections:
+        try:
+            results.append((name, check()))
+        finally:
+            sys.stdout.flush()
     
     # Summary
     print_header("VERIFICATION SUMMARY")
@@ -9,24 +9,47 @@ Verifies that all components are properly installed and functional.
 import sys
 import os
 
-# Color codes for output
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-RESET = '\033[0m'
+# Color codes for output (blank when stdout is not a terminal)
+if sys.stdout.isatty():
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    RESET = '\033[0m'
+else:
+    GREEN = RED = YELLOW = BLUE = RESET = ''
+
+# Status prefixes, built once
+OK = f"{GREEN}✓{RESET}"
+ERR = f"{RED}✗{RESET}"
+INFO = f"{BLUE}ℹ{RESET}"
+WARN = f"{YELLOW}⚠{RESET}"
 
 def print_success(msg):
-    print(f"{GREEN}✓{RESET} {msg}")
+    print(OK, msg)
 
 def print_error(msg):
-    print(f"{RED}✗{RESET} {msg}")
+    print(ERR, msg)
 
 def print_info(msg):
-    print(f"{BLUE}ℹ{RESET} {msg}")
+    print(INFO, msg)
 
 def print_warning(msg):
-    print(f"{YELLOW}⚠{RESET} {msg}")
+    print(WARN, msg)
+
+def _count_lines(path):
+    """Count lines like len(readlines()) without building the line strings"""
+    lines = 0
+    last = b'\n'
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(65536)
+            if not chunk:
+                break
+            lines += chunk.count(b'\n')
+            last = chunk[-1:]
+    # A final line without a trailing newline still counts
+    return lines + (last != b'\n')
 
 def verify_imports():
     """Verify all imports work"""
@@ -83,23 +106,23 @@ def verify_api_routes():
     
     api_file = "api/self_update_routes.py"
     if os.path.exists(api_file):
+        # Read once for both the line count and the blueprint checks
         with open(api_file, 'r') as f:
-            lines = len(f.readlines())
+            content = f.read()
+        lines = len(content.splitlines())
         print_success(f"API routes file exists ({lines} lines)")
         
         # Check if blueprint is defined
-        with open(api_file, 'r') as f:
-            content = f.read()
-            if 'self_update_bp' in content and 'Blueprint' in content:
-                print_success("Blueprint properly defined")
-                
-                # Count endpoints
-                endpoint_count = content.count('@self_update_bp.route(')
-                print_info(f"Found {endpoint_count} API endpoints")
-                return True
-            else:
-                print_error("Blueprint not properly defined")
-                return False
+        if 'self_update_bp' in content and 'Blueprint' in content:
+            print_success("Blueprint properly defined")
+            
+            # Count endpoints
+            endpoint_count = content.count('@self_update_bp.route(')
+            print_info(f"Found {endpoint_count} API endpoints")
+            return True
+        else:
+            print_error("Blueprint not properly defined")
+            return False
     else:
         print_error("API routes file not found")
         return False
@@ -112,8 +135,7 @@ def verify_tests():
     
     test_file = "tests/test_self_update_system.py"
     if os.path.exists(test_file):
-        with open(test_file, 'r') as f:
-            lines = len(f.readlines())
+        lines = _count_lines(test_file)
         print_success(f"Test file exists ({lines} lines)")
         return True
     else:
@@ -135,8 +157,7 @@ def verify_documentation():
     all_exist = True
     for doc in docs:
         if os.path.exists(doc):
-            with open(doc, 'r') as f:
-                lines = len(f.readlines())
+            lines = _count_lines(doc)
             print_success(f"{doc} ({lines} lines)")
         else:
             print_error(f"{doc} not found")
@@ -152,8 +173,7 @@ def verify_examples():
     
     example_file = "examples/self_update_example.py"
     if os.path.exists(example_file):
-        with open(example_file, 'r') as f:
-            lines = len(f.readlines())
+        lines = _count_lines(example_file)
         print_success(f"Example file exists ({lines} lines)")
         return True
     else:
@@ -217,33 +237,46 @@ def count_total_files():
     total_lines = 0
     for file in files:
         if os.path.exists(file):
-            with open(file, 'r') as f:
-                lines = len(f.readlines())
-                total_lines += lines
-                print(f"  {file}: {lines} lines")
+            lines = _count_lines(file)
+            total_lines += lines
+            print(f"  {file}: {lines} lines")
     
     print_info(f"Total implementation: {total_lines} lines of code")
     return total_lines
 
 def main():
     """Main verification"""
+    # Block-buffer stdout so each section reaches the terminal in one write
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+    
     print("\n" + "╔" + "="*68 + "╗")
     print("║" + " "*10 + "Self-Triggered CI/CD Update System" + " "*24 + "║")
     print("║" + " "*18 + "Verification Script" + " "*31 + "║")
     print("╚" + "="*68 + "╝")
     
-    results = []
+    sections = [
+        ("Imports", verify_imports),
+        ("API Routes", verify_api_routes),
+        ("Tests", verify_tests),
+        ("Documentation", verify_documentation),
+        ("Examples", verify_examples),
+        ("Instantiation", verify_component_instantiation),
+    ]
     
-    # Run verifications
-    results.append(("Imports", verify_imports()))
-    results.append(("API Routes", verify_api_routes()))
-    results.append(("Tests", verify_tests()))
-    results.append(("Documentation", verify_documentation()))
-    results.append(("Examples", verify_examples()))
-    results.append(("Instantiation", verify_component_instantiation()))
+    # Run verifications, writing each section's output in a single flush
+    results = []
+    for name, check in sections:
+        try:
+            results.append((name, check()))
+        finally:
+            sys.stdout.flush()
     
     # Count files
-    total_lines = count_total_files()
+    try:
+        total_lines = count_total_files()
+    finally:
+        sys.stdout.flush()
     
     # Print summary
     print("\n" + "="*70)
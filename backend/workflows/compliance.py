@@ -8,22 +8,272 @@ Orchestrates multiple agents to perform comprehensive compliance analysis:
 4. Governor agent - Performs final compliance check
 """
 
+import asyncio
+import bisect
+import hashlib
+import json
 import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, TypeVar, AsyncIterator
 import logging
 
+from sqlalchemy import case, func
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
 from database.models import (
     Run, AgentRun, RunStatus, AgentRunStatus, Tenant, Project
 )
+from config.settings import settings
 from database.session import get_db
 from agents.react import Agent as ReActAgent
 from agents.debate import Agent as DebateAgent
 from agents.evaluator import Agent as EvaluatorAgent
 from agents.governor import GovernorAgent
 
+# Time-ordered UUIDv7 (stdlib on 3.14+, else the optional uuid6 package)
+# keeps primary-key inserts at the right edge of the index
+try:
+    from uuid import uuid7
+    UUID7_AVAILABLE = True
+except ImportError:
+    try:
+        from uuid6 import uuid7
+        UUID7_AVAILABLE = True
+    except ImportError:
+        UUID7_AVAILABLE = False
+        uuid7 = None
+
+# Redis (optional) memoizes reports for repeated identical queries and
+# publishes status transitions to subscribers
+try:
+    import redis.asyncio as redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None
+
 logger = logging.getLogger(__name__)
 
+# Agents block on LLM/tool I/O, so they run here instead of on the event
+# loop. Shared by all workflows so concurrent runs cannot spawn unbounded
+# threads; CPU-bound agent internals belong in a ProcessPoolExecutor instead.
+_AGENT_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="compliance-agent")
+
+T = TypeVar("T")
+
+# Agent steps in execution order; one AgentRun row is created for each
+AGENT_STEPS = ("governor", "react", "debate", "evaluator")
+
+# Agents keep no per-run state, so one set is shared by every workflow and
+# executor thread
+_AGENTS = {
+    "react": ReActAgent(),
+    "debate": DebateAgent(),
+    "evaluator": EvaluatorAgent(),
+    "governor": GovernorAgent()
+}
+
+
+@dataclass(slots=True)
+class WorkflowContext:
+    """Execution context passed between the workflow's agents."""
+    task: str
+    query: str
+    run_id: str
+    config: Dict[str, Any]
+    state: Dict[str, Any] = field(default_factory=dict)
+    outputs: List[Dict[str, Any]] = field(default_factory=list)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Mapping-style read, for agents written against dict contexts."""
+        return getattr(self, key, default)
+    
+    def record(self, agent_name: str, state_key: str, output: Any) -> None:
+        """Append an agent's output and expose it in state under state_key."""
+        self.outputs.append({"agent": agent_name, "output": output})
+        self.state[state_key] = output
+
+
+# Run statuses after which no further transitions are published
+_FINAL_RUN_STATUSES = frozenset({
+    RunStatus.COMPLETED.value,
+    RunStatus.FAILED.value,
+    RunStatus.CANCELLED.value
+})
+
+
+def _status_channel(run_id: str) -> str:
+    """Redis pub/sub channel carrying a run's status transitions."""
+    return f"wf:{run_id}"
+
+
+def status_streaming_available() -> bool:
+    """Whether stream_workflow_status can be used (Redis installed and configured)."""
+    return REDIS_AVAILABLE and bool(settings.redis_url)
+
+
+def _result_cache_key(
+    tenant_id: str,
+    query: str,
+    config: Optional[Dict[str, Any]]
+) -> str:
+    """Content hash of the inputs that determine a tenant's compliance report."""
+    config = {k: v for k, v in (config or {}).items() if k != "bypass_cache"}
+    payload = "|".join((tenant_id, query, json.dumps(config, sort_keys=True, default=str)))
+    return "compliance:" + hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _new_id() -> str:
+    """Generate a primary key, time-ordered when UUIDv7 is available."""
+    return str(uuid7() if UUID7_AVAILABLE else uuid.uuid4())
+
+# Dialects that support INSERT ... ON CONFLICT DO NOTHING
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+# Engines whose projects table predates uq_projects_tenant_name (create_all
+# does not add constraints to existing tables); they use the select path
+_NO_PROJECT_UPSERT: "weakref.WeakSet" = weakref.WeakSet()
+
+# Evaluation score thresholds (inclusive lower bounds) and the risk level
+# for each band; _RISK_LEVELS has one more entry than _RISK_THRESHOLDS
+_RISK_THRESHOLDS = (0.3, 0.5, 0.8)
+_RISK_LEVELS = ("critical", "high", "medium", "low")
+
+# Static report content, identical for every workflow
+_OBLIGATIONS = (
+    "Data protection and privacy requirements",
+    "Record retention policies",
+    "User consent management",
+    "Data breach notification procedures"
+)
+_GAPS = (
+    "Missing documentation for data processing activities",
+    "Incomplete user consent tracking",
+    "Insufficient data retention schedules"
+)
+_RECOMMENDATIONS = (
+    "Implement comprehensive data mapping",
+    "Establish clear data retention policies",
+    "Deploy automated consent management system",
+    "Create incident response procedures",
+    "Conduct regular compliance audits"
+)
+_AFFECTED_REGULATIONS = (
+    "GDPR (General Data Protection Regulation)",
+    "CCPA (California Consumer Privacy Act)",
+    "HIPAA (if applicable)",
+    "SOC 2 Type II"
+)
+
+_REPORT_TEMPLATE = """# Compliance Intelligence Report
+
+## Executive Summary
+
+**Query:** {query}
+
+**Risk Level:** {risk_level}
+
+**Evaluation Score:** {eval_score:.2f}/1.00
+
+---
+
+## Analysis
+
+### ReAct Agent Analysis
+{react_analysis}
+
+### Debate Agent Perspectives
+{debate_perspectives}
+
+### Evaluator Assessment
+Evaluation Score: {eval_score}
+
+---
+
+## Risk Assessment
+
+**Overall Risk Level:** {risk_level}
+
+**Risk Score:** {risk_score:.2f}
+
+### Key Findings
+- Comprehensive multi-agent analysis completed
+- Multiple perspectives considered
+- Evaluation metrics calculated
+
+### Recommendations
+""" + "\n".join(
+    f"{i}. {item}" for i, item in enumerate(_RECOMMENDATIONS, 1)
+) + """
+
+### Affected Regulations
+""" + "\n".join(f"- {item}" for item in _AFFECTED_REGULATIONS) + """
+
+---
+
+## Next Steps
+
+1. Review and prioritize recommendations
+2. Assign ownership for each action item
+3. Establish timeline for implementation
+4. Schedule follow-up compliance review
+
+---
+
+*Report generated by Powerhouse Multi-Agent Platform*
+*Timestamp: {timestamp}Z*
+"""
+
+
+def _markdown_text(value: Any) -> str:
+    """Agent output as markdown text; structured outputs render as JSON."""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, indent=2, default=str)
+
+
+def render_compliance_report(
+    query: str,
+    results: Dict[str, Any],
+    generated_at: Optional[datetime] = None
+) -> str:
+    """
+    Render the markdown report for stored workflow results.
+    
+    The report is derived entirely from results, so it is rendered on
+    demand rather than stored alongside them.
+    
+    Args:
+        query: The compliance query
+        results: Workflow results as produced by _generate_compliance_report
+        generated_at: Timestamp shown in the footer (defaults to now)
+        
+    Returns:
+        Markdown compliance report
+    """
+    analysis = results.get("analysis") or {}
+    risk_assessment = results.get("risk_assessment") or {}
+    perspectives = {
+        p.get("key"): p.get("analysis", "")
+        for p in analysis.get("perspectives", [])
+    }
+    eval_score = analysis.get("evaluation_score", 0.0)
+    
+    return _REPORT_TEMPLATE.format_map({
+        "query": query,
+        "risk_level": risk_assessment.get("risk_level", "").upper(),
+        "eval_score": eval_score,
+        "react_analysis": _markdown_text(perspectives.get("react_analysis", "")),
+        "debate_perspectives": _markdown_text(perspectives.get("debate_perspectives", "")),
+        "risk_score": risk_assessment.get("risk_score", 1.0 - eval_score),
+        "timestamp": (generated_at or datetime.utcnow()).isoformat()
+    })
+
 
 class ComplianceWorkflow:
     """
@@ -36,12 +286,10 @@ class ComplianceWorkflow:
     def __init__(self, db_session=None):
         """Initialize the workflow with database session."""
         self.db = db_session
-        self.agents = {
-            "react": ReActAgent(),
-            "debate": DebateAgent(),
-            "evaluator": EvaluatorAgent(),
-            "governor": GovernorAgent()
-        }
+        self._redis = None
+        # The session is not thread-safe; serializes its use in _run_db
+        self._db_lock = asyncio.Lock()
+        self.agents = _AGENTS
     
     async def start_workflow(
         self,
@@ -67,19 +315,17 @@ class ComplianceWorkflow:
             project_id = await self._get_or_create_default_project(tenant_id)
         
         # Create run record
-        run_id = str(uuid.uuid4())
+        run_id = _new_id()
         run = Run(
             id=run_id,
             project_id=project_id,
             status=RunStatus.PENDING,
             config=config or {},
-            input_data={"query": query, "type": "compliance"},
+            input_data={"query": query, "type": "compliance", "tenant_id": tenant_id},
             created_at=datetime.utcnow()
         )
         
-        if self.db:
-            self.db.add(run)
-            self.db.commit()
+        await self._save(run, final=True)
         
         logger.info(f"Started compliance workflow {run_id} for tenant {tenant_id}")
         
@@ -102,29 +348,59 @@ class ComplianceWorkflow:
         Returns:
             Workflow results
         """
+        # Each step commits; keep the run and agent run rows loaded across
+        # commits so later updates don't re-SELECT them
+        expire_on_commit = self.db.expire_on_commit if self.db else None
+        if self.db:
+            self.db.expire_on_commit = False
+        
         try:
-            # Update run status to running
+            # Update run status to running; committed with the governor step
+            run = None
+            tenant_id = None
             if self.db:
-                run = self.db.query(Run).filter(Run.id == run_id).first()
+                def load_run():
+                    run = self.db.get(Run, run_id)
+                    input_data = (run.input_data if run else None) or {}
+                    return run, input_data.get("tenant_id")
+                
+                run, tenant_id = await self._run_db(load_run)
                 if run:
-                    run.status = RunStatus.RUNNING
-                    run.started_at = datetime.utcnow()
-                    self.db.commit()
+                    await self._save(
+                        run,
+                        status=RunStatus.RUNNING,
+                        started_at=datetime.utcnow()
+                    )
+            await self._publish_status(run_id, "workflow", RunStatus.RUNNING.value)
             
-            # Initialize context
-            context = {
-                "task": query,
-                "query": query,
-                "outputs": [],
-                "state": {},
-                "run_id": run_id,
-                "config": config or {}
+            # Create every step's agent run up front; the first flush sends
+            # them as one batched INSERT and each step then only updates its row
+            agent_runs = {
+                name: AgentRun(
+                    id=_new_id(),
+                    run_id=run_id,
+                    agent_name=name,
+                    agent_type=self.agents[name].__class__.__name__,
+                    status=AgentRunStatus.PENDING,
+                    input_data={"context": query}
+                )
+                for name in AGENT_STEPS
             }
+            if self.db:
+                await self._run_db(lambda: self.db.add_all(agent_runs.values()))
+            
+            # Initialize context
+            context = WorkflowContext(
+                task=query,
+                query=query,
+                run_id=run_id,
+                config=config or {}
+            )
             
             # Step 1: Governor preflight check
             logger.info(f"[{run_id}] Step 1: Governor preflight check")
             governor_result = await self._execute_agent(
-                run_id, "governor", "preflight", context
+                agent_runs["governor"], "governor", "preflight", context
             )
             
             if not governor_result.get("allowed", True):
@@ -136,51 +412,87 @@ class ComplianceWorkflow:
                     "results": None
                 }
             
-            # Step 2: ReAct agent analysis
-            logger.info(f"[{run_id}] Step 2: ReAct agent analysis")
-            react_result = await self._execute_agent(
-                run_id, "react", "analysis", context
-            )
-            context["outputs"].append({
-                "agent": "react",
-                "output": react_result
-            })
-            context["state"]["react_analysis"] = react_result
+            # Identical query and config from the same tenant produce the same
+            # report. Checked only after the governor allows the query, and
+            # only for runs that record their tenant
+            cache_key = None
+            if tenant_id and not (config or {}).get("bypass_cache"):
+                cache_key = _result_cache_key(tenant_id, query, config)
+                cached_report = await self._get_cached_report(cache_key)
+                if cached_report is not None:
+                    logger.info(f"[{run_id}] Reusing cached compliance report")
+                    
+                    def complete_from_cache():
+                        for name in AGENT_STEPS:
+                            if name != "governor":
+                                agent_runs[name].status = AgentRunStatus.SKIPPED
+                        if run:
+                            run.status = RunStatus.COMPLETED
+                            run.completed_at = datetime.utcnow()
+                            run.output_data = cached_report
+                        self.db.commit()
+                    
+                    if self.db:
+                        await self._run_db(complete_from_cache)
+                    await self._publish_status(
+                        run_id, "workflow", RunStatus.COMPLETED.value
+                    )
+                    return {
+                        "status": "completed",
+                        "results": cached_report
+                    }
             
-            # Step 3: Debate agent - multiple perspectives
-            logger.info(f"[{run_id}] Step 3: Debate agent - generating perspectives")
-            debate_result = await self._execute_agent(
-                run_id, "debate", "perspectives", context
+            # Steps 2-3: ReAct analysis and Debate perspectives only read the
+            # query, so run them concurrently. Debate gets its own outputs/state
+            # so neither agent sees the other's partial results.
+            logger.info(f"[{run_id}] Steps 2-3: ReAct analysis and Debate perspectives")
+            debate_context = replace(
+                context,
+                outputs=list(context.outputs),
+                state=dict(context.state)
             )
-            context["outputs"].append({
-                "agent": "debate",
-                "output": debate_result
-            })
-            context["state"]["debate_perspectives"] = debate_result
+            # Let both steps settle (and record their own outcome) before a
+            # failure in either fails the run; nothing may still be writing
+            # to the session once the run is marked failed
+            react_result, debate_result = await asyncio.gather(
+                self._execute_agent(agent_runs["react"], "react", "analysis", context),
+                self._execute_agent(
+                    agent_runs["debate"], "debate", "perspectives", debate_context
+                ),
+                return_exceptions=True
+            )
+            for step_result in (react_result, debate_result):
+                if isinstance(step_result, BaseException):
+                    raise step_result
+            
+            # Merge in the original step order for the evaluator
+            context.record("react", "react_analysis", react_result)
+            context.record("debate", "debate_perspectives", debate_result)
             
             # Step 4: Evaluator agent - assessment
             logger.info(f"[{run_id}] Step 4: Evaluator agent - assessment")
             evaluator_result = await self._execute_agent(
-                run_id, "evaluator", "evaluation", context
+                agent_runs["evaluator"], "evaluator", "evaluation", context
             )
-            context["outputs"].append({
-                "agent": "evaluator",
-                "output": evaluator_result
-            })
-            context["state"]["evaluation"] = evaluator_result
+            context.record("evaluator", "evaluation", evaluator_result)
             
             # Step 5: Generate compliance report
             logger.info(f"[{run_id}] Step 5: Generating compliance report")
             compliance_report = self._generate_compliance_report(context)
             
             # Update run with results
-            if self.db:
-                run = self.db.query(Run).filter(Run.id == run_id).first()
-                if run:
-                    run.status = RunStatus.COMPLETED
-                    run.completed_at = datetime.utcnow()
-                    run.output_data = compliance_report
-                    self.db.commit()
+            if run:
+                await self._save(
+                    run,
+                    final=True,
+                    status=RunStatus.COMPLETED,
+                    completed_at=datetime.utcnow(),
+                    output_data=compliance_report
+                )
+            
+            if cache_key:
+                await self._cache_report(cache_key, compliance_report)
+            await self._publish_status(run_id, "workflow", RunStatus.COMPLETED.value)
             
             logger.info(f"[{run_id}] Compliance workflow completed successfully")
             
@@ -197,19 +509,28 @@ class ComplianceWorkflow:
                 "error": str(e),
                 "results": None
             }
+        finally:
+            if self.db:
+                self.db.expire_on_commit = expire_on_commit
+            if self._redis is not None:
+                await self._redis.aclose()
+                self._redis = None
     
     async def _execute_agent(
         self,
-        run_id: str,
+        agent_run: AgentRun,
         agent_name: str,
         step_name: str,
-        context: Dict[str, Any]
+        context: WorkflowContext
     ) -> Dict[str, Any]:
         """
         Execute a single agent and record its execution.
         
+        The agent itself runs on _AGENT_EXECUTOR so the event loop stays
+        free while it blocks.
+        
         Args:
-            run_id: Workflow run ID
+            agent_run: Pending agent run record for this step
             agent_name: Name of the agent to execute
             step_name: Name of the step
             context: Execution context
@@ -217,47 +538,47 @@ class ComplianceWorkflow:
         Returns:
             Agent output
         """
-        agent_run_id = str(uuid.uuid4())
         agent = self.agents.get(agent_name)
+        run_id = context.run_id
         
         if not agent:
             raise ValueError(f"Agent {agent_name} not found")
         
-        # Create agent run record
-        agent_run = AgentRun(
-            id=agent_run_id,
-            run_id=run_id,
-            agent_name=agent_name,
-            agent_type=agent.__class__.__name__,
+        # Mark the agent run started; its start time doubles as the duration
+        # start. Flushed now, committed once the step finishes
+        start_time = datetime.utcnow()
+        await self._save(
+            agent_run,
             status=AgentRunStatus.RUNNING,
-            input_data={"context": context.get("task", "")},
-            started_at=datetime.utcnow()
+            started_at=start_time
         )
-        
-        if self.db:
-            self.db.add(agent_run)
-            self.db.commit()
+        await self._publish_status(run_id, agent_name, AgentRunStatus.RUNNING.value)
         
         try:
             # Execute agent
-            start_time = datetime.utcnow()
-            
+            loop = asyncio.get_running_loop()
             if agent_name == "governor":
-                ok, msg = agent.preflight(context.get("task", ""))
+                ok, msg = await loop.run_in_executor(
+                    _AGENT_EXECUTOR, agent.preflight, context.task
+                )
                 output = {"allowed": ok, "message": msg}
             else:
-                output = agent.run(context)
+                output = await loop.run_in_executor(_AGENT_EXECUTOR, agent.run, context)
             
             end_time = datetime.utcnow()
             duration = (end_time - start_time).total_seconds()
             
             # Update agent run record
             if self.db:
-                agent_run.status = AgentRunStatus.COMPLETED
-                agent_run.completed_at = end_time
-                agent_run.output_data = {"output": output}
-                agent_run.metrics = {"duration_seconds": duration}
-                self.db.commit()
+                await self._save(
+                    agent_run,
+                    final=True,
+                    status=AgentRunStatus.COMPLETED,
+                    completed_at=end_time,
+                    output_data={"output": output},
+                    metrics={"duration_seconds": duration}
+                )
+            await self._publish_status(run_id, agent_name, AgentRunStatus.COMPLETED.value)
             
             return output
             
@@ -265,14 +586,115 @@ class ComplianceWorkflow:
             logger.error(f"Agent {agent_name} execution failed: {str(e)}")
             
             if self.db:
-                agent_run.status = AgentRunStatus.FAILED
-                agent_run.error_message = str(e)
-                agent_run.completed_at = datetime.utcnow()
-                self.db.commit()
+                await self._save(
+                    agent_run,
+                    final=True,
+                    status=AgentRunStatus.FAILED,
+                    error_message=str(e),
+                    completed_at=datetime.utcnow()
+                )
+            await self._publish_status(run_id, agent_name, AgentRunStatus.FAILED.value)
             
             raise
     
-    def _generate_compliance_report(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _persist(self, obj: Any = None, final: bool = False) -> None:
+        """
+        Stage pending changes, committing only at step boundaries.
+        
+        Intermediate updates are flushed so later queries in this session
+        see them; final=True commits everything staged so far in one
+        transaction.
+        """
+        if not self.db:
+            return
+        
+        if obj is not None:
+            self.db.add(obj)
+        
+        if final:
+            self.db.commit()
+        else:
+            self.db.flush()
+    
+    async def _run_db(self, fn: Callable[[], T]) -> T:
+        """
+        Run blocking session work in a worker thread.
+        
+        Calls are serialized per workflow because concurrent steps share
+        one session, and so that no flush sees a half-applied update.
+        """
+        async with self._db_lock:
+            return await asyncio.to_thread(fn)
+    
+    async def _save(self, obj: Any = None, final: bool = False, **changes: Any) -> None:
+        """Apply attribute changes to obj and _persist them off the event loop."""
+        if not self.db:
+            return
+        
+        def apply():
+            for key, value in changes.items():
+                setattr(obj, key, value)
+            self._persist(obj, final=final)
+        
+        await self._run_db(apply)
+    
+    def _get_redis(self):
+        """Return the Redis client, or None if not configured."""
+        if not status_streaming_available():
+            return None
+        
+        # Per workflow, since each execution may run on its own event loop
+        if self._redis is None:
+            self._redis = redis.from_url(settings.redis_url)
+        return self._redis
+    
+    async def _publish_status(self, run_id: str, step: str, status: str) -> None:
+        """Publish a status transition; step is an agent name or "workflow"."""
+        client = self._get_redis()
+        if client is None:
+            return
+        
+        event = {
+            "run_id": run_id,
+            "step": step,
+            "status": status,
+            "ts": datetime.utcnow().timestamp()
+        }
+        try:
+            await client.publish(_status_channel(run_id), json.dumps(event))
+        except Exception as e:
+            logger.warning(f"Publishing workflow status failed: {e}")
+    
+    async def _get_cached_report(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a previously generated report; cache errors count as a miss."""
+        cache = self._get_redis()
+        if cache is None:
+            return None
+        
+        try:
+            cached = await cache.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Compliance report cache lookup failed: {e}")
+            return None
+        
+        return json.loads(cached) if cached is not None else None
+    
+    async def _cache_report(self, cache_key: str, report: Dict[str, Any]) -> None:
+        """Store a generated report for workflow_cache_ttl_seconds."""
+        cache = self._get_redis()
+        if cache is None:
+            return
+        
+        try:
+            await cache.setex(
+                cache_key,
+                settings.workflow_cache_ttl_seconds,
+                json.dumps(report, default=str)
+            )
+        except Exception as e:
+            logger.warning(f"Compliance report cache store failed: {e}")
+    
+    def _generate_compliance_report(self, context: WorkflowContext) -> Dict[str, Any]:
         """
         Generate comprehensive compliance report from agent outputs.
         
@@ -282,9 +704,9 @@ class ComplianceWorkflow:
         Returns:
             Compliance report
         """
-        react_analysis = context["state"].get("react_analysis", "")
-        debate_perspectives = context["state"].get("debate_perspectives", "")
-        evaluation = context["state"].get("evaluation", {})
+        react_analysis = context.state.get("react_analysis", "")
+        debate_perspectives = context.state.get("debate_perspectives", "")
+        evaluation = context.state.get("evaluation", {})
         
         # Extract evaluation score
         eval_score = 0.0
@@ -292,38 +714,24 @@ class ComplianceWorkflow:
             eval_score = evaluation.get("score", 0) / 10.0  # Normalize to 0-1
         
         # Determine risk level based on evaluation
-        if eval_score >= 0.8:
-            risk_level = "low"
-        elif eval_score >= 0.5:
-            risk_level = "medium"
-        elif eval_score >= 0.3:
-            risk_level = "high"
-        else:
-            risk_level = "critical"
+        risk_level = _RISK_LEVELS[bisect.bisect_right(_RISK_THRESHOLDS, eval_score)]
         
         # Build compliance report
         report = {
             "analysis": {
-                "summary": f"Compliance analysis completed for query: {context.get('query', '')}",
-                "obligations": [
-                    "Data protection and privacy requirements",
-                    "Record retention policies",
-                    "User consent management",
-                    "Data breach notification procedures"
-                ],
-                "gaps": [
-                    "Missing documentation for data processing activities",
-                    "Incomplete user consent tracking",
-                    "Insufficient data retention schedules"
-                ],
+                "summary": f"Compliance analysis completed for query: {context.query}",
+                "obligations": list(_OBLIGATIONS),
+                "gaps": list(_GAPS),
                 "perspectives": [
                     {
+                        "key": "react_analysis",
                         "viewpoint": "Legal Compliance",
-                        "analysis": str(react_analysis)
+                        "analysis": react_analysis
                     },
                     {
+                        "key": "debate_perspectives",
                         "viewpoint": "Risk Management",
-                        "analysis": str(debate_perspectives)
+                        "analysis": debate_perspectives
                     }
                 ],
                 "evaluation_score": eval_score
@@ -331,121 +739,79 @@ class ComplianceWorkflow:
             "risk_assessment": {
                 "risk_level": risk_level,
                 "risk_score": 1.0 - eval_score,  # Inverse of evaluation score
+                # Keys into analysis.perspectives / analysis, so agent
+                # outputs are stored once
                 "findings": [
-                    f"ReAct Analysis: {react_analysis}",
-                    f"Debate Perspectives: {debate_perspectives}",
-                    f"Evaluation Score: {eval_score}"
+                    "react_analysis",
+                    "debate_perspectives",
+                    "evaluation_score"
                 ],
-                "recommendations": [
-                    "Implement comprehensive data mapping",
-                    "Establish clear data retention policies",
-                    "Deploy automated consent management system",
-                    "Create incident response procedures",
-                    "Conduct regular compliance audits"
-                ],
-                "affected_regulations": [
-                    "GDPR (General Data Protection Regulation)",
-                    "CCPA (California Consumer Privacy Act)",
-                    "HIPAA (if applicable)",
-                    "SOC 2 Type II"
-                ]
-            },
-            "compliance_report": self._format_markdown_report(
-                context.get("query", ""),
-                react_analysis,
-                debate_perspectives,
-                evaluation,
-                risk_level,
-                eval_score
-            )
+                "recommendations": list(_RECOMMENDATIONS),
+                "affected_regulations": list(_AFFECTED_REGULATIONS)
+            }
         }
         
         return report
     
-    def _format_markdown_report(
-        self,
-        query: str,
-        react_analysis: str,
-        debate_perspectives: str,
-        evaluation: Any,
-        risk_level: str,
-        eval_score: float
-    ) -> str:
-        """Format a markdown compliance report."""
-        
-        report = f"""# Compliance Intelligence Report
-
-## Executive Summary
-
-**Query:** {query}
-
-**Risk Level:** {risk_level.upper()}
-
-**Evaluation Score:** {eval_score:.2f}/1.00
-
----
-
-## Analysis
-
-### ReAct Agent Analysis
-{react_analysis}
-
-### Debate Agent Perspectives
-{debate_perspectives}
-
-### Evaluator Assessment
-Evaluation Score: {evaluation}
-
----
-
-## Risk Assessment
-
-**Overall Risk Level:** {risk_level.upper()}
-
-**Risk Score:** {1.0 - eval_score:.2f}
-
-### Key Findings
-- Comprehensive multi-agent analysis completed
-- Multiple perspectives considered
-- Evaluation metrics calculated
-
-### Recommendations
-1. Implement comprehensive data mapping
-2. Establish clear data retention policies
-3. Deploy automated consent management system
-4. Create incident response procedures
-5. Conduct regular compliance audits
-
-### Affected Regulations
-- GDPR (General Data Protection Regulation)
-- CCPA (California Consumer Privacy Act)
-- HIPAA (if applicable)
-- SOC 2 Type II
-
----
-
-## Next Steps
-
-1. Review and prioritize recommendations
-2. Assign ownership for each action item
-3. Establish timeline for implementation
-4. Schedule follow-up compliance review
-
----
-
-*Report generated by Powerhouse Multi-Agent Platform*
-*Timestamp: {datetime.utcnow().isoformat()}Z*
-"""
-        
-        return report
-    
     async def _get_or_create_default_project(self, tenant_id: str) -> str:
         """Get or create default project for tenant."""
         if not self.db:
             return "default-project"
         
+        return await self._run_db(lambda: self._default_project_id(tenant_id))
+    
+    def _default_project_id(self, tenant_id: str) -> str:
+        """Blocking part of _get_or_create_default_project."""
+        bind = self.db.get_bind()
+        insert = _UPSERT_INSERTS.get(bind.dialect.name)
+        if insert is None or bind in _NO_PROJECT_UPSERT:
+            return self._select_or_create_default_project(tenant_id)
+        
+        try:
+            return self._upsert_default_project(insert, tenant_id)
+        except (OperationalError, ProgrammingError) as e:
+            # No unique constraint matches the ON CONFLICT target
+            self.db.rollback()
+            _NO_PROJECT_UPSERT.add(bind)
+            logger.warning(
+                f"Default project upsert unavailable, falling back to select: {e}"
+            )
+            return self._select_or_create_default_project(tenant_id)
+    
+    def _upsert_default_project(self, insert: Callable, tenant_id: str) -> str:
+        """Insert-if-missing tenant and project; requires uq_projects_tenant_name."""
+        # One transaction; safe against concurrent starts
+        self.db.execute(
+            insert(Tenant).values(
+                id=tenant_id,
+                name=f"Tenant {tenant_id}"
+            ).on_conflict_do_nothing()
+        )
+        project_id = self.db.execute(
+            insert(Project).values(
+                id=_new_id(),
+                tenant_id=tenant_id,
+                name="Default Project",
+                description="Default project for compliance workflows"
+            ).on_conflict_do_nothing(
+                index_elements=["tenant_id", "name"]
+            ).returning(Project.id)
+        ).scalar()
+        
+        if project_id is None:
+            # Already existed, so RETURNING came back empty
+            project_id = self.db.query(Project.id).filter(
+                Project.tenant_id == tenant_id,
+                Project.name == "Default Project"
+            ).scalar()
+        
+        self.db.commit()
+        return project_id
+    
+    def _select_or_create_default_project(self, tenant_id: str) -> str:
+        """Fallback for dialects or schemas without ON CONFLICT support."""
         # Check if tenant exists
-        tenant = self.db.query(Tenant).filter(Tenant.id == tenant_id).first()
+        tenant = self.db.get(Tenant, tenant_id)
         if not tenant:
             tenant = Tenant(id=tenant_id, name=f"Tenant {tenant_id}")
             self.db.add(tenant)
@@ -458,7 +824,7 @@ Evaluation Score: {evaluation}
         ).first()
         
         if not project:
-            project_id = str(uuid.uuid4())
+            project_id = _new_id()
             project = Project(
                 id=project_id,
                 tenant_id=tenant_id,
@@ -472,13 +838,28 @@ Evaluation Score: {evaluation}
     
     async def _mark_workflow_failed(self, run_id: str, error_message: str):
         """Mark workflow as failed."""
-        if self.db:
-            run = self.db.query(Run).filter(Run.id == run_id).first()
+        await self._publish_status(run_id, "workflow", RunStatus.FAILED.value)
+        if not self.db:
+            return
+        
+        def mark_failed():
+            run = self.db.get(Run, run_id)
             if run:
                 run.status = RunStatus.FAILED
                 run.error_message = error_message
                 run.completed_at = datetime.utcnow()
+                # Steps that never started will not run now
+                self.db.flush()
+                self.db.query(AgentRun).filter(
+                    AgentRun.run_id == run_id,
+                    AgentRun.status == AgentRunStatus.PENDING
+                ).update(
+                    {AgentRun.status: AgentRunStatus.SKIPPED},
+                    synchronize_session=False
+                )
                 self.db.commit()
+        
+        await self._run_db(mark_failed)
     
     async def get_workflow_status(self, run_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -493,27 +874,33 @@ Evaluation Score: {evaluation}
         if not self.db:
             return None
         
-        run = self.db.query(Run).filter(Run.id == run_id).first()
-        if not run:
+        # Load the run columns and its agent counts in one round trip;
+        # selecting columns rather than the entity skips ORM hydration
+        row = await self._run_db(lambda: self.db.query(
+            Run.id,
+            Run.status,
+            Run.created_at,
+            Run.started_at,
+            Run.completed_at,
+            func.count(AgentRun.id),
+            func.coalesce(func.sum(
+                case((AgentRun.status == AgentRunStatus.COMPLETED, 1), else_=0)
+            ), 0),
+            func.min(
+                case((AgentRun.status == AgentRunStatus.RUNNING, AgentRun.agent_name))
+            )
+        ).outerjoin(AgentRun, AgentRun.run_id == Run.id).filter(
+            Run.id == run_id
+        ).group_by(Run.id).first())
+        if not row:
             return None
-        
-        # Get agent runs
-        agent_runs = self.db.query(AgentRun).filter(
-            AgentRun.run_id == run_id
-        ).order_by(AgentRun.created_at).all()
+        run = row
+        agent_count, completed_agents, current_agent = row[5:]
         
         # Calculate progress
-        total_agents = 4  # react, debate, evaluator, governor
-        completed_agents = sum(1 for ar in agent_runs if ar.status == AgentRunStatus.COMPLETED)
+        total_agents = len(AGENT_STEPS)
         progress = (completed_agents / total_agents) * 100 if total_agents > 0 else 0
         
-        # Get current agent
-        current_agent = None
-        for ar in agent_runs:
-            if ar.status == AgentRunStatus.RUNNING:
-                current_agent = ar.agent_name
-                break
-        
         # Calculate duration
         duration = None
         if run.started_at:
@@ -529,10 +916,55 @@ Evaluation Score: {evaluation}
             "started_at": run.started_at,
             "completed_at": run.completed_at,
             "duration_seconds": duration,
-            "agent_count": len(agent_runs),
+            "agent_count": agent_count,
             "completed_agent_count": completed_agents
         }
     
+    async def stream_workflow_status(self, run_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream status transitions for a workflow.
+        
+        Yields the current status from the database once, then each
+        transition published by the executing workflow, until the run
+        reaches a final status. Requires Redis (see settings.redis_url).
+        
+        Args:
+            run_id: Workflow run ID
+            
+        Yields:
+            Status events with run_id, step, status and ts keys; the first
+            event also carries the full status snapshot
+        """
+        client = redis.from_url(settings.redis_url)
+        pubsub = client.pubsub()
+        try:
+            # Subscribe before reading the snapshot so no transition is missed
+            await pubsub.subscribe(_status_channel(run_id))
+            
+            snapshot = await self.get_workflow_status(run_id)
+            if snapshot is None:
+                return
+            yield {
+                "run_id": run_id,
+                "step": "workflow",
+                "status": snapshot["status"],
+                "ts": datetime.utcnow().timestamp(),
+                "snapshot": snapshot
+            }
+            if snapshot["status"] in _FINAL_RUN_STATUSES:
+                return
+            
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                event = json.loads(message["data"])
+                yield event
+                if event["step"] == "workflow" and event["status"] in _FINAL_RUN_STATUSES:
+                    return
+        finally:
+            await pubsub.aclose()
+            await client.aclose()
+    
     async def get_workflow_results(self, run_id: str) -> Optional[Dict[str, Any]]:
         """
         Get workflow results.
@@ -546,7 +978,14 @@ Evaluation Score: {evaluation}
         if not self.db:
             return None
         
-        run = self.db.query(Run).filter(Run.id == run_id).first()
+        run = await self._run_db(lambda: self.db.query(
+            Run.id,
+            Run.status,
+            Run.output_data,
+            Run.created_at,
+            Run.started_at,
+            Run.completed_at
+        ).filter(Run.id == run_id).first())
         if not run:
             return None
         
@@ -0,0 +1,76 @@
+"""
+Task queue dispatch for long-running workflows.
+
+When ``TASK_BROKER_URL`` is configured and Celery is installed, compliance
+workflows execute on dedicated Celery workers instead of inside the API
+process. Otherwise ``dispatch_compliance_workflow`` returns False and the
+caller runs the workflow in-process.
+
+Start workers with ``celery -A workflows.tasks.celery_app worker``.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+
+from config.settings import settings
+from database.session import get_session
+from .compliance import ComplianceWorkflow
+
+try:
+    from celery import Celery
+    CELERY_AVAILABLE = True
+except ImportError:
+    CELERY_AVAILABLE = False
+    Celery = None
+
+logger = logging.getLogger(__name__)
+
+if CELERY_AVAILABLE and settings.task_broker_url:
+    celery_app = Celery("powerhouse", broker=settings.task_broker_url)
+    # Workers take one workflow at a time. Tasks are not retried or
+    # redelivered: execute_workflow records its own failures on the run,
+    # and re-running a run_id would duplicate its agent runs
+    celery_app.conf.update(worker_prefetch_multiplier=1)
+
+    @celery_app.task
+    def run_compliance_workflow(
+        run_id: str,
+        query: str,
+        config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute a compliance workflow on a worker with its own session."""
+        db = get_session()
+        try:
+            return asyncio.run(
+                ComplianceWorkflow(db_session=db).execute_workflow(run_id, query, config)
+            )
+        finally:
+            db.close()
+else:
+    celery_app = None
+    run_compliance_workflow = None
+
+
+def dispatch_compliance_workflow(
+    run_id: str,
+    query: str,
+    config: Optional[Dict[str, Any]] = None
+) -> bool:
+    """
+    Enqueue a compliance workflow on the task queue.
+
+    Args:
+        run_id: The workflow run ID
+        query: The compliance query
+        config: Optional configuration
+
+    Returns:
+        True if the workflow was enqueued, False if no queue is configured
+    """
+    if run_compliance_workflow is None:
+        return False
+
+    run_compliance_workflow.delay(run_id, query, config)
+    logger.info(f"[{run_id}] Compliance workflow enqueued")
+    return True